@@ -45,6 +45,8 @@ class AcceptanceTestCaseWithService(AcceptanceTestCase):
             session = Session(bind=APP_FACTORY.engine)
             service_list = ServiceList(session)
             del service_list[cls.service.id]
+            session.commit()
+            session.close()
         AcceptanceTestCase.tearDownClass()
 
     class JobRegistrationSchema(Schema):
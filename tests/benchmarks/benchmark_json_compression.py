@@ -0,0 +1,107 @@
+"""
+Measures the size of a SQLite database holding job results, and how long it
+takes to write and read those results, with the plain
+:class:`topchef.database.json_type.JSON` type and with
+:class:`topchef.database.json_type.CompressedJSON` at a few compression
+levels. Run this with
+
+.. code-block:: bash
+
+    python tests/benchmarks/benchmark_json_compression.py
+
+"""
+import os
+import random
+import timeit
+from tempfile import TemporaryDirectory
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine
+from sqlalchemy import select
+from topchef.database.json_type import JSON, CompressedJSON
+
+NUMBER_OF_JOBS = 2000
+POINTS_PER_RESULT = 500
+
+COLUMN_TYPES = [
+    ('JSON', JSON()),
+    ('zlib level 1', CompressedJSON(level=1)),
+    ('zlib level 6', CompressedJSON(level=6)),
+    ('zlib level 9', CompressedJSON(level=9))
+]
+
+
+def odmr_result(random_generator: random.Random) -> dict:
+    """
+    Make a result shaped like the output of an ODMR resonance sweep. This
+    is a frequency sweep with evenly-spaced points, and a noisy dip in
+    the measured counts at the resonance
+
+    :param random_generator: The source of the noise
+    :return: The result of one job
+    """
+    frequencies = [
+        round(2.8e9 + 1e5 * point, 1) for point in range(POINTS_PER_RESULT)
+    ]
+    resonance = random_generator.randrange(POINTS_PER_RESULT)
+    counts = [
+        round(
+            1000 - 300 / (1 + ((point - resonance) / 5) ** 2) +
+            random_generator.gauss(0, 10), 2
+        ) for point in range(POINTS_PER_RESULT)
+    ]
+    return {
+        'frequencies': frequencies, 'counts': counts,
+        'exposure_time': 0.1, 'status': 'ok'
+    }
+
+
+def benchmark(name: str, column_type, results: list, directory: str) -> None:
+    """
+    Write every result to a new database, read them all back, and print
+    the time taken and the size of the database file
+
+    :param name: The name of the column type
+    :param column_type: The type of the ``results`` column
+    :param results: The results to write
+    :param directory: The directory in which to create the database
+    """
+    path = os.path.join(directory, '%s.sqlite3' % name.replace(' ', '_'))
+    engine = create_engine('sqlite:///%s' % path)
+    table = Table(
+        'jobs', MetaData(),
+        Column('job_id', Integer, primary_key=True),
+        Column('results', column_type)
+    )
+    table.create(bind=engine)
+
+    def write() -> None:
+        with engine.begin() as connection:
+            connection.execute(table.insert(), [
+                {'job_id': job_id, 'results': result}
+                for job_id, result in enumerate(results)
+            ])
+
+    def read() -> None:
+        with engine.connect() as connection:
+            for row in connection.execute(select([table.c.results])):
+                row[0]
+
+    write_time = timeit.timeit(write, number=1)
+    read_time = timeit.timeit(read, number=1)
+    engine.dispose()
+
+    print('%-13s size: %7.1f MiB  write: %6.3f s  read: %6.3f s' % (
+        name, os.path.getsize(path) / 2 ** 20, write_time, read_time
+    ))
+
+
+def main() -> None:
+    random_generator = random.Random(0)
+    results = [odmr_result(random_generator) for _ in range(NUMBER_OF_JOBS)]
+
+    with TemporaryDirectory() as directory:
+        for name, column_type in COLUMN_TYPES:
+            benchmark(name, column_type, results, directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Measures how long it takes to build the JSON schemas returned in the
+``meta`` key of the API's endpoints, with and without the cache in
+:class:`topchef.serializers.JSONSchema`. Run this with
+
+.. code-block:: bash
+
+    python tests/benchmarks/benchmark_json_schema.py
+
+"""
+import timeit
+from marshmallow_jsonschema import JSONSchema as MarshmallowJSONSchema
+from topchef.serializers import JobDetail, ServiceDetail, NewService
+from topchef.serializers.json_schema import JSONSchema
+
+NUMBER_OF_DUMPS = 2000
+
+SCHEMAS = [('JobDetail', JobDetail), ('ServiceDetail', ServiceDetail),
+           ('NewService', NewService)]
+
+
+def uncached_dump(schema) -> None:
+    """
+    Build the JSON schema the way that it was built before it was cached
+
+    :param schema: The marshmallow schema to reflect over
+    """
+    result = MarshmallowJSONSchema(strict=True).dump(schema()).data
+    result['title'] = 'Title'
+    result['description'] = 'Description'
+    result['$schema'] = 'http://json-schema.org/draft-04/schema#'
+
+
+def cached_dump(schema) -> None:
+    """
+    Build the JSON schema with the cache
+
+    :param schema: The marshmallow schema to reflect over
+    """
+    JSONSchema(title='Title', description='Description').dump(schema())
+
+
+def main() -> None:
+    for name, schema in SCHEMAS:
+        uncached_time = timeit.timeit(
+            lambda: uncached_dump(schema), number=NUMBER_OF_DUMPS
+        )
+        cached_time = timeit.timeit(
+            lambda: cached_dump(schema), number=NUMBER_OF_DUMPS
+        )
+        print('%-14s uncached: %7.1f us  cached: %7.1f us  speedup: %.1fx' % (
+            name,
+            1e6 * uncached_time / NUMBER_OF_DUMPS,
+            1e6 * cached_time / NUMBER_OF_DUMPS,
+            uncached_time / cached_time
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 import os
-from unittest import TestCase
+import tempfile
+from unittest import TestCase, mock
 from abc import ABCMeta
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
@@ -31,3 +32,31 @@ class IntegrationTestCase(TestCase, metaclass=ABCMeta):
             cls.session.commit()
         if hasattr(cls, 'database') and hasattr(cls, 'engine'):
             cls.database.metadata.drop_all(bind=cls.engine)
+
+
+class DatabaseInFile(object):
+    """
+    Mixin for integration tests that read the database from more than one
+    thread. Each thread has its own in-memory SQLite database, so unless
+    another database is configured, these tests use a SQLite database in a
+    temporary file, and MUST commit the rows that other threads read
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.database_directory = tempfile.TemporaryDirectory()
+        database_uri = os.environ.get(
+            IntegrationTestCase.DATABASE_ENVIRONMENT_VARIABLE_KEY,
+            default='sqlite:///%s' % os.path.join(
+                cls.database_directory.name, 'topchef.sqlite3'
+            )
+        )
+        with mock.patch.dict(os.environ, {
+            IntegrationTestCase.DATABASE_ENVIRONMENT_VARIABLE_KEY:
+                database_uri
+        }):
+            super(DatabaseInFile, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super(DatabaseInFile, cls).tearDownClass()
+        cls.database_directory.cleanup()
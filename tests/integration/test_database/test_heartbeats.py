@@ -0,0 +1,100 @@
+"""
+Contains integration tests for :mod:`topchef.database.heartbeats`
+"""
+import unittest
+from datetime import datetime, timedelta
+from sqlalchemy.dialects import mysql, postgresql
+from tests.integration.test_models import IntegrationTestCaseWithModels
+from topchef.database import is_alive, write_heartbeats
+from topchef.database.models import Service as DatabaseService
+from topchef.models.service import Service
+
+
+class TestWriteHeartbeats(IntegrationTestCaseWithModels):
+    """
+    Contains integration tests for writing service check ins in batches
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Commit the test service and job, so that each test can roll back
+        its own changes without losing them
+        """
+        IntegrationTestCaseWithModels.setUpClass()
+        cls.session.commit()
+
+    def setUp(self) -> None:
+        self.other_service = Service.new(
+            'Other', 'Another service', {'type': 'object'},
+            {'type': 'object'}, self.session
+        )
+        self.session.flush()
+
+    def tearDown(self) -> None:
+        self.session.rollback()
+
+    def test_write_several_services(self) -> None:
+        """
+        Tests that the check ins of several services are written at once
+        """
+        newer_date = self.service.db_model.last_checked_in + \
+            timedelta(minutes=1)
+        other_date = self.other_service.db_model.last_checked_in + \
+            timedelta(minutes=2)
+
+        write_heartbeats(self.session, {
+            self.service.id: newer_date, self.other_service.id: other_date
+        })
+
+        self.assertEqual(newer_date, self._last_checked_in(self.service))
+        self.assertEqual(
+            other_date, self._last_checked_in(self.other_service)
+        )
+
+    def test_older_check_in_not_written(self) -> None:
+        """
+        Tests that a check in older than the one in the database is ignored
+        """
+        current_date = self._last_checked_in(self.service)
+        write_heartbeats(self.session, {
+            self.service.id: current_date - timedelta(minutes=1)
+        })
+        self.assertEqual(current_date, self._last_checked_in(self.service))
+
+    def _last_checked_in(self, service: Service):
+        """
+
+        :param service: The service to look up
+        :return: The date on which the service last checked in, read from
+            the database
+        """
+        return self.session.query(DatabaseService.last_checked_in).filter(
+            DatabaseService.id == service.id
+        ).scalar()
+
+
+class TestIsAlive(unittest.TestCase):
+    """
+    Contains tests for the deadline of each service, compiled for databases
+    that cannot be reached from the test suite
+    """
+    def test_postgresql(self) -> None:
+        """
+        Tests that PostgreSQL multiplies an interval by the timeout
+        """
+        self.assertIn(
+            "heartbeat_timeout_seconds * INTERVAL '1 second'",
+            str(is_alive(datetime.utcnow()).compile(
+                dialect=postgresql.dialect()
+            ))
+        )
+
+    def test_mysql(self) -> None:
+        """
+        Tests that MySQL adds the timeout with ``DATE_ADD``
+        """
+        self.assertIn(
+            'DATE_ADD(services.last_checked_in, '
+            'INTERVAL services.heartbeat_timeout_seconds SECOND)',
+            str(is_alive(datetime.utcnow()).compile(dialect=mysql.dialect()))
+        )
@@ -0,0 +1,159 @@
+"""
+Contains integration tests for :mod:`topchef.database.job_counters`
+"""
+from sqlalchemy import func
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from tests.integration.test_models import IntegrationTestCaseWithModels
+from topchef.database import adjust_job_counters, job_counts
+from topchef.database import repair_job_counters
+from topchef.database.job_counters import _create_counter
+from topchef.database.job_counters import _insert_ignoring_duplicates
+from topchef.database.models import Job as DatabaseJob
+from topchef.database.schemas import JobStatus
+from topchef.models import Job
+from topchef.models.service import Service
+from topchef.models.service_list import ServiceList
+
+
+class TestJobCounters(IntegrationTestCaseWithModels):
+    """
+    Contains integration tests checking that the job counters agree with
+    the jobs after every kind of change to the jobs
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Commit the test service and job, so that each test can roll back
+        its own changes without losing them
+        """
+        IntegrationTestCaseWithModels.setUpClass()
+        cls.session.commit()
+
+    def setUp(self) -> None:
+        self.job_list = self.service.jobs
+
+    def tearDown(self) -> None:
+        self.session.rollback()
+
+    def test_new_job(self) -> None:
+        self.service.new_job({'value': 2})
+        self._assert_counters_match_jobs()
+
+    def test_new_jobs(self) -> None:
+        self.service.new_jobs([{'value': 2}, {'value': 3}])
+        self._assert_counters_match_jobs()
+
+    def test_claim_next_job(self) -> None:
+        self.service.new_job({'value': 2})
+        self.job_list.claim_next_job()
+        self._assert_counters_match_jobs()
+
+    def test_claim_next_jobs(self) -> None:
+        self.service.new_jobs([{'value': 2}, {'value': 3}, {'value': 4}])
+        self.job_list.claim_next_jobs(3)
+        self._assert_counters_match_jobs()
+
+    def test_set_status(self) -> None:
+        job = self.service.new_job({'value': 2})
+        job.status = Job.JobStatus.COMPLETED
+        self.job_list[job.id] = job
+        self._assert_counters_match_jobs()
+
+    def test_delete(self) -> None:
+        job = self.service.new_job({'value': 2})
+        self.session.flush()
+        del self.job_list[job.id]
+        self._assert_counters_match_jobs()
+
+    def test_delete_service(self) -> None:
+        service = Service.new(
+            'Deleted', 'A service to delete', {'type': 'object'},
+            {'type': 'object'}, self.session
+        )
+        service.new_jobs([{'value': 2}, {'value': 3}])
+        self.session.flush()
+
+        del ServiceList(self.session)[service.id]
+        self.session.flush()
+
+        self.assertEqual(0, self.session.query(
+            self.database.service_job_counters
+        ).filter_by(service_id=service.id).count())
+
+    def test_repair(self) -> None:
+        self.service.new_jobs([{'value': 2}, {'value': 3}])
+        self.session.execute(
+            self.database.service_job_counters.update().values(
+                number_of_jobs=100
+            )
+        )
+        repair_job_counters(self.session)
+        self._assert_counters_match_jobs()
+
+    def test_summary_reads_counters(self) -> None:
+        self.service.new_jobs([{'value': 2}, {'value': 3}])
+        summary = self.job_list.summary()
+        self.assertEqual(
+            job_counts(self.session, self.service.id)[JobStatus.REGISTERED],
+            summary.registered
+        )
+        self.assertEqual(
+            sum(job_counts(self.session, self.service.id).values()),
+            len(self.job_list)
+        )
+
+    def test_counter_made_by_another_transaction(self) -> None:
+        """
+        Tests that a counter that appears after it was found to be missing
+        is added to, instead of being inserted a second time
+        """
+        service = Service.new(
+            'Counted', 'A service with no counters', {'type': 'object'},
+            {'type': 'object'}, self.session
+        )
+        self.session.flush()
+        self.session.execute(
+            self.database.service_job_counters.insert().values(
+                service_id=service.id, status=JobStatus.ERROR,
+                number_of_jobs=2
+            )
+        )
+
+        _create_counter(self.session, service.id, JobStatus.ERROR)
+        adjust_job_counters(self.session, {(service.id, JobStatus.ERROR): 1})
+
+        self.assertEqual(
+            3, job_counts(self.session, service.id)[JobStatus.ERROR]
+        )
+
+    def test_insert_ignoring_duplicates(self) -> None:
+        """
+        Tests that each database that the counters are written to skips
+        counters that already exist
+        """
+        for dialect, clause in [
+            (postgresql.dialect(), 'ON CONFLICT DO NOTHING'),
+            (mysql.dialect(), 'INSERT IGNORE'),
+            (sqlite.dialect(), 'INSERT OR IGNORE')
+        ]:
+            with self.subTest(dialect=dialect.name):
+                self.assertIn(clause, str(_insert_ignoring_duplicates(
+                    dialect.name
+                ).compile(dialect=dialect)))
+        self.assertIsNone(_insert_ignoring_duplicates('oracle'))
+
+    def _assert_counters_match_jobs(self) -> None:
+        """
+        Count the service's jobs with a ``GROUP BY`` query, and check that
+        the counters give the same numbers
+        """
+        expected_counts = {status: 0 for status in JobStatus}
+        expected_counts.update(self.session.query(
+            DatabaseJob.status, func.count(DatabaseJob.id)
+        ).filter(
+            DatabaseJob.service_id == self.service.id
+        ).group_by(DatabaseJob.status).all())
+
+        self.assertEqual(
+            expected_counts, job_counts(self.session, self.service.id)
+        )
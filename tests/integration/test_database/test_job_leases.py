@@ -0,0 +1,96 @@
+"""
+Contains integration tests for :mod:`topchef.database.job_leases`
+"""
+import unittest.mock as mock
+from datetime import datetime, timedelta
+from tests.integration.test_models import IntegrationTestCaseWithModels
+from topchef.database import job_counts, reap_expired_leases
+from topchef.database.schemas import JobStatus
+from topchef.models import Job
+
+
+class TestReapExpiredLeases(IntegrationTestCaseWithModels):
+    """
+    Contains integration tests for returning jobs with expired leases to
+    the queue
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Commit the test service and job, so that each test can roll back
+        its own changes without losing them
+        """
+        IntegrationTestCaseWithModels.setUpClass()
+        cls.session.commit()
+
+    def setUp(self) -> None:
+        self.job_list = self.service.jobs
+        self.claimed_job = self.job_list.claim_next_job()
+
+    def tearDown(self) -> None:
+        self.session.rollback()
+
+    def test_claim_starts_lease(self) -> None:
+        """
+        Tests that a claimed job is leased until some time in the future
+        """
+        self.assertIsNotNone(self.claimed_job.lease_token)
+        self.assertGreater(
+            self.claimed_job.lease_expires_at, datetime.utcnow()
+        )
+
+    def test_unexpired_lease_not_reaped(self) -> None:
+        """
+        Tests that a job whose lease has not expired stays ``WORKING``
+        """
+        self.assertEqual({}, reap_expired_leases(self.session))
+        self.assertIs(
+            Job.JobStatus.WORKING, self.job_list[self.job.id].status
+        )
+
+    def test_expired_lease_reaped(self) -> None:
+        """
+        Tests that a job whose lease has expired is registered again, that
+        the counters follow it, and that it can be claimed again
+        """
+        reaped_jobs = reap_expired_leases(
+            self.session, now=self.claimed_job.lease_expires_at +
+            timedelta(seconds=1)
+        )
+        self.session.expire_all()
+
+        self.assertEqual({self.service.id: 1}, reaped_jobs)
+        reaped_job = self.job_list[self.job.id]
+        self.assertIs(Job.JobStatus.REGISTERED, reaped_job.status)
+        self.assertIsNone(reaped_job.lease_token)
+
+        counts = job_counts(self.session, self.service.id)
+        self.assertEqual(1, counts[JobStatus.REGISTERED])
+        self.assertEqual(0, counts[JobStatus.WORKING])
+
+        self.assertEqual(self.job, self.job_list.claim_next_job())
+
+    def test_extended_lease_not_reaped(self) -> None:
+        """
+        Tests that extending a lease keeps the job from being reaped at the
+        date on which the lease was originally going to expire
+        """
+        original_expiry = self.claimed_job.lease_expires_at
+        with mock.patch.object(
+                self.job_list, '_LEASE_DURATION', timedelta(hours=1)
+        ):
+            self.assertIsNotNone(self.job_list.extend_lease(
+                self.job.id, self.claimed_job.lease_token
+            ))
+
+        self.assertEqual({}, reap_expired_leases(
+            self.session, now=original_expiry + timedelta(seconds=1)
+        ))
+
+    def test_extend_lease_with_wrong_token(self) -> None:
+        """
+        Tests that a lease cannot be extended without its token
+        """
+        self.assertIsNone(self.job_list.extend_lease(
+            self.job.id, self.service.id
+        ))
@@ -0,0 +1,176 @@
+"""
+Contains integration tests for :mod:`topchef.database.json_filters`
+"""
+import json
+import unittest
+import unittest.mock as mock
+from hypothesis import assume, given
+from hypothesis.strategies import booleans, dictionaries, floats, integers
+from hypothesis.strategies import lists, none, one_of, sampled_from
+from typing import Callable
+from sqlalchemy import Column, MetaData, Table, Text, create_engine
+from sqlalchemy import literal, select
+from sqlalchemy.dialects import mysql, oracle, postgresql
+from sqlalchemy.exc import CompileError
+from sqlalchemy.sql.elements import ColumnElement
+from topchef.database import is_stored_out_of_line, json_path_matches
+from topchef.models import Job, JobList
+
+SCALARS = one_of(
+    none(), booleans(), integers(min_value=-10, max_value=10),
+    floats(min_value=-10, max_value=10), sampled_from(['a', 'b', '1'])
+)
+
+DOCUMENTS = dictionaries(
+    sampled_from(['a', 'b']), one_of(SCALARS, lists(SCALARS, max_size=2))
+)
+
+_DOCUMENTS_TABLE = Table(
+    'documents', MetaData(), Column('document', Text)
+)
+
+
+class TestOnSQLite(unittest.TestCase):
+    """
+    Contains tests that run the conditions on SQLite, and compare them with
+    :meth:`JobList.Filter.matches`
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.engine = create_engine('sqlite://')
+
+    @given(
+        DOCUMENTS, sampled_from([('a',), ('b',), ('a', 0), ('a', 1)]),
+        sampled_from(sorted(JobList.Filter.OPERATORS)), SCALARS
+    )
+    def test_same_as_python(
+            self, document: dict, path: tuple, operator: str, value
+    ) -> None:
+        """
+        Tests that the database and Python agree on which documents match,
+        for every filter that can be read from a query string
+
+        :param document: The document to filter
+        :param path: The path to the value
+        :param operator: The comparison operator
+        :param value: The value to compare with
+        """
+        assume(value is not None or operator == '=')
+        assume(not isinstance(value, bool) or operator in ('=', '!='))
+
+        job_filter = JobList.Filter('parameters', path, operator, value)
+        job = mock.MagicMock(spec=Job, parameters=document)
+
+        database_match = self._matches(
+            lambda column: json_path_matches(
+                column, path, operator, value,
+                JobList.Filter.json_type(value)
+            ), json.dumps(document)
+        )
+
+        self.assertEqual(job_filter.matches(job), database_match)
+
+    def test_compressed_document(self) -> None:
+        """
+        Tests that a document that is not JSON never matches, but is found
+        as a document stored out of line
+        """
+        self.assertFalse(self._matches(
+            lambda column: json_path_matches(
+                column, ('a',), '=', 1, 'number'
+            ), 'zlib:eJyrVkpUslIwrAUAD8sC2w=='
+        ))
+        self.assertTrue(self._matches(
+            is_stored_out_of_line, 'zlib:eJyrVkpUslIwrAUAD8sC2w=='
+        ))
+
+    def test_blob_reference(self) -> None:
+        self.assertTrue(self._matches(
+            is_stored_out_of_line, json.dumps({'$blob': 64 * '0'})
+        ))
+        self.assertFalse(self._matches(
+            is_stored_out_of_line, json.dumps({'a': 1})
+        ))
+
+    def test_escaped_document(self) -> None:
+        """
+        Tests that a document wrapped in an envelope, because it looked
+        like a reference, is checked after it is loaded
+        """
+        self.assertTrue(self._matches(
+            is_stored_out_of_line,
+            json.dumps({'$document': {'$blob': 64 * '0'}})
+        ))
+
+    def _matches(
+            self, condition: Callable[[ColumnElement], ColumnElement],
+            document: str
+    ) -> bool:
+        """
+
+        :param condition: A function making a condition on a column
+        :param document: The value of the column
+        :return: Whether the condition holds for the document
+        """
+        documents = select([
+            literal(document, Text).label('document')
+        ]).alias('documents')
+        return bool(self.engine.execute(
+            select([condition(documents.c.document)])
+        ).scalar())
+
+
+class TestCompiled(unittest.TestCase):
+    """
+    Contains tests for the conditions compiled for databases that cannot
+    be reached from the test suite
+    """
+    def setUp(self) -> None:
+        self.condition = json_path_matches(
+            _DOCUMENTS_TABLE.c.document, ('sweep', 0), '>', 10, 'number'
+        )
+
+    def test_postgresql(self) -> None:
+        """
+        Tests that PostgreSQL reads the value with ``#>>``, after checking
+        its type
+        """
+        sql = str(self.condition.compile(dialect=postgresql.dialect()))
+        self.assertIn("json_typeof(documents.document #> ", sql)
+        self.assertIn("CAST((documents.document #>> ", sql)
+
+    def test_mysql(self) -> None:
+        sql = str(self.condition.compile(dialect=mysql.dialect()))
+        self.assertIn('JSON_EXTRACT(documents.document, %s) > CAST(', sql)
+
+    def test_stored_out_of_line(self) -> None:
+        """
+        Tests that PostgreSQL and MySQL look for envelopes as well as for
+        references
+        """
+        condition = is_stored_out_of_line(_DOCUMENTS_TABLE.c.document)
+        self.assertIn(['$document'], list(condition.compile(
+            dialect=postgresql.dialect()
+        ).params.values()))
+        self.assertIn('$."$document"', list(condition.compile(
+            dialect=mysql.dialect()
+        ).params.values()))
+
+    def test_json_string_stored_out_of_line(self) -> None:
+        """
+        Tests that PostgreSQL and MySQL find rows that hold their document
+        as a JSON string
+        """
+        condition = is_stored_out_of_line(_DOCUMENTS_TABLE.c.document)
+        self.assertIn(
+            "json_typeof(documents.document) = 'string'",
+            str(condition.compile(dialect=postgresql.dialect()))
+        )
+        self.assertIn(
+            "JSON_TYPE(documents.document) = 'STRING'",
+            str(condition.compile(dialect=mysql.dialect()))
+        )
+
+    def test_unsupported_database(self) -> None:
+        with self.assertRaises(CompileError):
+            self.condition.compile(dialect=oracle.dialect())
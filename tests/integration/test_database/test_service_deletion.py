@@ -0,0 +1,80 @@
+"""
+Contains integration tests for :mod:`topchef.database.service_deletion`
+"""
+from tests.integration.test_models import IntegrationTestCaseWithModels
+from topchef.database import delete_jobs_of_service, delete_service
+from topchef.database import job_counts
+from topchef.database.models import Job as DatabaseJob
+from topchef.database.models import Service as DatabaseService
+from topchef.database.schemas import JobStatus
+from topchef.models.service_list import ServiceList
+
+
+class TestServiceDeletion(IntegrationTestCaseWithModels):
+    """
+    Contains integration tests for deleting a service and its jobs
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Commit the test service and job, so that each test can roll back
+        its own changes without losing them
+        """
+        IntegrationTestCaseWithModels.setUpClass()
+        cls.session.commit()
+
+    def setUp(self) -> None:
+        self.service.new_jobs([{'value': value} for value in range(4)])
+        self.session.flush()
+
+    def tearDown(self) -> None:
+        self.session.rollback()
+
+    def test_delete_jobs_in_chunks(self) -> None:
+        """
+        Tests that each chunk deletes at most the requested number of jobs,
+        and takes them off the counters
+        """
+        self.assertEqual(
+            2, delete_jobs_of_service(self.session, self.service.id, 2)
+        )
+        self.assertEqual(
+            3, job_counts(self.session, self.service.id)[JobStatus.REGISTERED]
+        )
+        self.assertEqual(
+            3, delete_jobs_of_service(self.session, self.service.id, 10)
+        )
+        self.assertEqual(
+            0, delete_jobs_of_service(self.session, self.service.id, 10)
+        )
+        self.assertEqual(
+            0, job_counts(self.session, self.service.id)[JobStatus.REGISTERED]
+        )
+
+    def test_delete_service(self) -> None:
+        """
+        Tests that deleting a service deletes its jobs and counters
+        """
+        self.assertTrue(delete_service(self.session, self.service.id))
+        self.assertFalse(delete_service(self.session, self.service.id))
+
+        self.assertEqual(0, self.session.query(DatabaseJob).count())
+        self.assertEqual(
+            {status: 0 for status in JobStatus},
+            job_counts(self.session, self.service.id)
+        )
+
+    def test_delitem_with_loaded_jobs(self) -> None:
+        """
+        Tests that a service whose jobs are loaded into the session is
+        deleted, and is not written back by the next flush
+        """
+        service_list = ServiceList(self.session)
+        self.assertTrue(list(self.service.db_model.jobs))
+
+        del service_list[self.service.id]
+        self.session.flush()
+
+        self.assertEqual(0, self.session.query(DatabaseService).count())
+        self.assertEqual(0, self.session.query(DatabaseJob).count())
+        self.assertNotIn(self.service.id, service_list)
@@ -2,14 +2,16 @@
 Contains unit tests for the ``JobListRequiringQuery`` abstract class
 """
 import asyncio
+import unittest.mock as mock
 from uuid import uuid4
+from tests.integration import DatabaseInFile
 from tests.integration.test_models import IntegrationTestCaseWithModels
 from topchef.models.abstract_classes import JobListFromQuery
 from sqlalchemy.orm import Query
 from topchef.database.models import Job as DatabaseJob
 from topchef.database.schemas.job_status import JobStatus as DatabaseJobStatus
-from typing import AsyncIterator
-from topchef.models.interfaces import Job
+from typing import AsyncIterator, List
+from topchef.models.interfaces import Job, JobList
 
 
 class TestJobListRequiringQuery(IntegrationTestCaseWithModels):
@@ -123,11 +125,31 @@ class TestIter(TestJobListRequiringQuery):
         job = iter(self.job_list).__next__()
         self.assertEqual(job, self.job)
 
+    def test_iter_in_chunks(self) -> None:
+        """
+        Submit more jobs than fit in one chunk, and check that every job is
+        visited once, and that finished chunks leave the session
+        """
+        for _ in range(4):
+            self.service.new_job({'value': 2})
+        self.session.flush()
+
+        with mock.patch.object(self.job_list, '_ITERATION_CHUNK_SIZE', 2):
+            jobs = list(self.job_list)
 
-class TestAsyncIter(TestJobListRequiringQuery):
+        self.assertEqual(len(self.job_list), len(set(jobs)))
+        self.assertNotIn(jobs[0].db_model, self.session)
+
+
+class TestAsyncIter(DatabaseInFile, TestJobListRequiringQuery):
     """
-    Contains unit tests for the asynchronous iterator
+    Contains unit tests for the asynchronous iterator, which reads jobs
+    that have been committed, from another thread
     """
+    def setUp(self) -> None:
+        TestJobListRequiringQuery.setUp(self)
+        self.session.commit()
+
     @staticmethod
     async def get_async_job(iterator: AsyncIterator[Job]) -> Job:
         """
@@ -147,3 +169,247 @@ class TestAsyncIter(TestJobListRequiringQuery):
             self.get_async_job(self.job_list.__aiter__())
         )
         self.assertEqual(self.job, result)
+
+    def test_async_iter_in_chunks(self) -> None:
+        """
+        Tests that iterating asynchronously over more jobs than fit in one
+        chunk visits every job once, in submission order
+        """
+        for _ in range(4):
+            self.service.new_job({'value': 2})
+        self.session.commit()
+
+        async def collect() -> List[Job]:
+            return [job async for job in self.job_list]
+
+        with mock.patch.object(self.job_list, '_ITERATION_CHUNK_SIZE', 2):
+            jobs = asyncio.get_event_loop().run_until_complete(collect())
+
+        self.assertEqual(self.job_list.page(len(self.job_list)), jobs)
+
+
+class TestPage(TestJobListRequiringQuery):
+    """
+    Contains integration tests for keyset pagination of the job list
+    """
+    def test_pages_cover_all_jobs_in_order(self) -> None:
+        """
+        Submit more jobs, some of them at the same time as the test job,
+        and check that paging one job at a time visits every job once, in
+        ``(date_submitted, job_id)`` order
+        """
+        for _ in range(4):
+            new_job = self.service.new_job({'value': 2})
+            new_job.db_model.date_submitted = self.job.date_submitted
+        self.session.flush()
+
+        visited_jobs = []
+        page = self.job_list.page(1)
+        while page:
+            visited_jobs.extend(page)
+            last_job = page[-1]
+            page = self.job_list.page(
+                1, after=(last_job.date_submitted, last_job.id)
+            )
+
+        self.assertEqual(list(self.job_list.page(len(self.job_list))),
+                         visited_jobs)
+        self.assertEqual(len(self.job_list), len(set(visited_jobs)))
+
+
+class TestPageWithFilters(TestJobListRequiringQuery):
+    """
+    Contains integration tests for filtering pages of jobs by their
+    parameters. The last two jobs have parameters long enough to be
+    compressed, so the database cannot read them
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        TestJobListRequiringQuery.setUpClass()
+        for parameters in [
+            {'pulse_time': 5, 'experiment': 'RABI'},
+            {'pulse_time': 15, 'experiment': 'RAMSEY'},
+            {'pulse_time': '20', 'experiment': 'RAMSEY'},
+            {'pulse_time': 25, 'sweep': list(range(1000))},
+            {'pulse_time': 30, 'sweep': list(range(1000))}
+        ]:
+            cls.service.new_job(parameters)
+        cls.session.commit()
+
+    def test_large_parameters_compressed(self) -> None:
+        stored_parameters = self.session.execute(
+            'SELECT parameters FROM jobs'
+        ).fetchall()
+        self.assertEqual(
+            2, sum(row[0].startswith('zlib:') for row in stored_parameters)
+        )
+
+    def test_number(self) -> None:
+        self.assertEqual(
+            [15, 25, 30], self._pulse_times(('pulse_time', '>', 10))
+        )
+        self.assertEqual([5], self._pulse_times(('pulse_time', '<', 10)))
+
+    def test_string(self) -> None:
+        """
+        Tests that strings are only compared with strings
+        """
+        self.assertEqual(
+            ['20'], self._pulse_times(('pulse_time', '=', '20'))
+        )
+        self.assertEqual(
+            [15, '20'], self._pulse_times(('experiment', '=', 'RAMSEY'))
+        )
+
+    def test_several_filters(self) -> None:
+        self.assertEqual([15], self._pulse_times(
+            ('experiment', '=', 'RAMSEY'), ('pulse_time', '>=', 10)
+        ))
+
+    def test_page_filled_after_compressed_jobs(self) -> None:
+        """
+        Tests that a page is filled with matching jobs, even if jobs that
+        had to be checked after being loaded did not match
+        """
+        self.assertEqual(
+            [30], self._pulse_times(('pulse_time', '=', 30), limit=1)
+        )
+
+    def test_pages_of_filtered_jobs(self) -> None:
+        filters = [JobList.Filter('parameters', ('pulse_time',), '>', 10)]
+
+        visited_jobs = []
+        page = self.job_list.page(1, filters=filters)
+        while page:
+            visited_jobs.extend(page)
+            page = self.job_list.page(1, after=(
+                page[-1].date_submitted, page[-1].id
+            ), filters=filters)
+
+        self.assertEqual(
+            self.job_list.page(len(self.job_list), filters=filters),
+            visited_jobs
+        )
+
+    def _pulse_times(self, *conditions: tuple, limit: int=10) -> list:
+        """
+
+        :param conditions: The ``(key, operator, value)`` of each filter on
+            the parameters
+        :param limit: The maximum number of jobs on the page
+        :return: The pulse times of the jobs on the first page
+        """
+        return [job.parameters['pulse_time'] for job in self.job_list.page(
+            limit, filters=[
+                JobList.Filter('parameters', (key,), operator, value)
+                for key, operator, value in conditions
+            ]
+        )]
+
+
+class TestRegisteredJobs(TestJobListRequiringQuery):
+    """
+    Contains integration tests for getting the head of the queue
+    """
+    def test_registered_jobs(self) -> None:
+        """
+        Tests that the only registered job is at the head of the queue, and
+        that it leaves the queue once it is claimed
+        """
+        self.assertEqual([self.job], self.job_list.registered_jobs(10))
+        self.job_list.claim_next_job()
+        self.assertEqual([], self.job_list.registered_jobs(10))
+
+
+class TestClaimNextJob(TestJobListRequiringQuery):
+    """
+    Contains integration tests for claiming the next job on the queue
+    """
+    def test_claim_next_job(self) -> None:
+        """
+        Tests that the only registered job is claimed once, and that a
+        second claim finds nothing left on the queue
+        """
+        claimed_job = self.job_list.claim_next_job()
+        self.assertEqual(self.job, claimed_job)
+        self.assertIs(Job.JobStatus.WORKING, claimed_job.status)
+        self.assertIs(
+            Job.JobStatus.WORKING, self.job_list[self.job.id].status
+        )
+
+        self.assertIsNone(self.job_list.claim_next_job())
+
+
+class TestClaimNextJobs(TestJobListRequiringQuery):
+    """
+    Contains integration tests for claiming several jobs at once
+    """
+    def test_claim_next_jobs(self) -> None:
+        """
+        Submit more jobs, and check that claiming them in batches hands out
+        every job exactly once, oldest first
+        """
+        for _ in range(4):
+            self.service.new_job({'value': 2})
+        self.session.flush()
+        queue = self.job_list.registered_jobs(5)
+
+        first_batch = self.job_list.claim_next_jobs(3)
+        second_batch = self.job_list.claim_next_jobs(3)
+
+        self.assertEqual(queue, first_batch + second_batch)
+        for job in first_batch + second_batch:
+            self.assertIs(Job.JobStatus.WORKING, job.status)
+        self.assertEqual([], self.job_list.claim_next_jobs(3))
+
+
+class TestMarkJobsAsWorking(TestJobListRequiringQuery):
+    """
+    Contains integration tests for claiming jobs whose IDs were selected
+    beforehand
+    """
+    def test_jobs_claimed_by_someone_else_are_left_out(self) -> None:
+        """
+        Tests that a job that was claimed by another client after its ID
+        was selected is neither returned nor counted a second time
+        """
+        other_job = self.service.new_job({'value': 2})
+        self.session.flush()
+        job_claimed_first = self.job_list.claim_next_job()
+        job_ids = [self.job.id, other_job.id]
+
+        claimed_jobs = self.job_list._mark_jobs_as_working(job_ids)
+
+        self.assertEqual(
+            [job_id for job_id in job_ids if job_id != job_claimed_first.id],
+            [job.id for job in claimed_jobs]
+        )
+        summary = self.job_list.summary()
+        self.assertEqual(0, summary.registered)
+        self.assertEqual(2, summary.working)
+
+
+class TestSummary(TestJobListRequiringQuery):
+    """
+    Contains integration tests for summarizing the job list
+    """
+    def test_summary(self) -> None:
+        """
+        Submit more jobs, claim the oldest one, and check that the counts
+        and the oldest registered job date account for the claim
+        """
+        for _ in range(2):
+            self.service.new_job({'value': 2})
+        self.session.flush()
+        queue = self.job_list.registered_jobs(3)
+
+        self.job_list.claim_next_job()
+        summary = self.job_list.summary()
+
+        self.assertEqual(2, summary.registered)
+        self.assertEqual(1, summary.working)
+        self.assertEqual(0, summary.completed)
+        self.assertEqual(0, summary.error)
+        self.assertEqual(
+            queue[1].date_submitted, summary.oldest_registered_job_date
+        )
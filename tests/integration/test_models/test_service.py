@@ -2,6 +2,7 @@
 Contains integration tests for :mod:`topchef.models.service.Service`
 """
 from uuid import uuid4
+from tests.integration import DatabaseInFile
 from tests.integration.test_models import IntegrationTestCaseWithModels
 import asyncio
 
@@ -65,7 +66,11 @@ class TestIterator(TestService):
         self.assertIn(self.job, jobs)
 
 
-class TestAsyncIterator(TestService):
+class TestAsyncIterator(DatabaseInFile, TestService):
+    def setUp(self):
+        TestService.setUp(self)
+        self.session.commit()
+
     def test_async_iter(self):
         loop = asyncio.get_event_loop()
         loop.run_until_complete(self.run_async())
@@ -87,3 +92,27 @@ class TestContains(TestService):
 
     def test_contains_bad_job_id(self):
         self.assertNotIn(self.bad_job_id, self.service.jobs)
+
+
+class TestNewJobs(TestService):
+    def test_new_jobs(self):
+        parameter_sets = [{'value': value} for value in range(3)]
+        job_ids = self.service.new_jobs(parameter_sets)
+
+        self.assertEqual(len(parameter_sets), len(job_ids))
+        for job_id, parameters in zip(job_ids, parameter_sets):
+            job = self.service.jobs[job_id]
+            self.assertEqual(parameters, job.parameters)
+            self.assertIs(job.JobStatus.REGISTERED, job.status)
+
+    def test_new_jobs_claimed_in_order(self):
+        parameter_sets = [{'value': value} for value in range(20)]
+        job_ids = self.service.new_jobs(parameter_sets)
+
+        claimed_jobs = self.service.jobs.claim_next_jobs(
+            len(self.service.jobs)
+        )
+
+        self.assertEqual(job_ids, [
+            job.id for job in claimed_jobs if job.id in set(job_ids)
+        ])
@@ -0,0 +1,175 @@
+"""
+Contains integration tests for :mod:`topchef.models.service_list`
+"""
+from datetime import datetime, timedelta
+from uuid import uuid4
+from sqlalchemy import event
+from tests.integration.test_models import IntegrationTestCaseWithModels
+from topchef.models.heartbeat_buffer import HeartbeatBuffer
+from topchef.models.service import Service
+from topchef.models.service_list import ServiceList
+
+
+class TestPage(IntegrationTestCaseWithModels):
+    """
+    Contains integration tests for getting filtered pages of services
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Commit the test service and job, so that each test can roll back
+        its own changes without losing them
+        """
+        IntegrationTestCaseWithModels.setUpClass()
+        cls.service.timeout = timedelta(hours=1)
+        cls.service.is_service_available = True
+        cls.session.commit()
+
+    def setUp(self) -> None:
+        """
+        Add a service that timed out a long time ago
+        """
+        self.timed_out_service = Service.new(
+            'Timed out', 'A service that stopped checking in',
+            {'type': 'object'}, {'type': 'object'}, self.session
+        )
+        self.timed_out_service.db_model.last_checked_in = \
+            datetime.utcnow() - timedelta(hours=1)
+        self.session.flush()
+
+        self.heartbeat_buffer = HeartbeatBuffer()
+        self.service_list = ServiceList(self.session, self.heartbeat_buffer)
+
+    def tearDown(self) -> None:
+        self.session.rollback()
+
+    def test_page_sorted_by_id(self) -> None:
+        """
+        Tests that pages are sorted by ID, and that the page after a
+        service starts after it
+        """
+        first_service, second_service = sorted(
+            [self.service, self.timed_out_service],
+            key=lambda service: service.id
+        )
+        self.assertEqual(
+            [first_service], self.service_list.page(1)
+        )
+        self.assertEqual(
+            [second_service],
+            self.service_list.page(2, after=first_service.id)
+        )
+
+    def test_filter_by_availability(self) -> None:
+        """
+        Tests that only services with the requested availability are
+        returned
+        """
+        self.assertEqual(
+            [self.service], self.service_list.page(10, is_available=True)
+        )
+        self.assertEqual(
+            [self.timed_out_service],
+            self.service_list.page(10, is_available=False)
+        )
+
+    def test_filter_by_liveness(self) -> None:
+        """
+        Tests that the deadline of each service is worked out from its own
+        timeout
+        """
+        self.assertEqual(
+            [self.service], self.service_list.page(10, is_alive=True)
+        )
+        self.assertEqual(
+            [self.timed_out_service],
+            self.service_list.page(10, is_alive=False)
+        )
+
+    def test_buffered_check_in_is_alive(self) -> None:
+        """
+        Tests that a service whose check in has not yet been written to the
+        database is alive
+        """
+        self.heartbeat_buffer.record(self.timed_out_service.id)
+
+        self.assertEqual(
+            {self.service, self.timed_out_service},
+            set(self.service_list.page(10, is_alive=True))
+        )
+        self.assertEqual([], self.service_list.page(10, is_alive=False))
+        self.assertFalse(
+            self.service_list.page(10, is_available=False)[0].has_timed_out
+        )
+
+
+class TestLookups(IntegrationTestCaseWithModels):
+    """
+    Contains integration tests for looking services and jobs up by ID
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Commit the test service and job, so that each test can roll back
+        its own changes without losing them
+        """
+        IntegrationTestCaseWithModels.setUpClass()
+        cls.session.commit()
+
+    def setUp(self) -> None:
+        """
+        Load the test service and job, which the previous test's rollback
+        expired, and record every statement sent to the database after that
+        """
+        self.session.refresh(self.service.db_model)
+        self.session.refresh(self.job.db_model)
+        self.service_list = ServiceList(self.session)
+        self.statements = []
+        event.listen(
+            self.engine, 'before_cursor_execute', self._record_statement
+        )
+
+    def tearDown(self) -> None:
+        event.remove(
+            self.engine, 'before_cursor_execute', self._record_statement
+        )
+        self.session.rollback()
+
+    def test_loaded_objects_not_queried(self) -> None:
+        """
+        Tests that a service and a job that are already in the session are
+        found without querying the database
+        """
+        self.assertEqual(self.service, self.service_list[self.service.id])
+        self.assertIn(self.service.id, self.service_list)
+        self.assertIn(self.job.id, self.service.jobs)
+        self.assertEqual([], self.statements)
+
+    def test_missing_service(self) -> None:
+        """
+        Tests that a service that is not loaded is looked for with an
+        ``EXISTS`` query
+        """
+        self.assertNotIn(uuid4(), self.service_list)
+        self.assertEqual(1, len(self.statements))
+        self.assertIn('EXISTS', self.statements[0])
+
+    def test_loaded_job_of_other_service(self) -> None:
+        """
+        Tests that a loaded job is not found in the job list of a service
+        that it does not belong to
+        """
+        other_service = Service.new(
+            'Other', 'Another service', {'type': 'object'},
+            {'type': 'object'}, self.session
+        )
+        self.assertNotIn(self.job.id, other_service.jobs)
+        with self.assertRaises(KeyError):
+            other_service.jobs[self.job.id]
+
+    def _record_statement(self, _, __, statement: str, *args) -> None:
+        """
+
+        :param statement: A statement sent to the database
+        """
+        self.statements.append(statement)
@@ -3,6 +3,7 @@ Contains a generator for creating jobs
 """
 from uuid import UUID
 from datetime import datetime
+from typing import Optional
 from hypothesis.strategies import composite, uuids, text, sampled_from
 from hypothesis.strategies import dictionaries, datetimes
 from topchef.models import Job as JobInterface
@@ -21,7 +22,9 @@ class Job(JobInterface):
             results: dict,
             date_submitted: datetime,
             parameter_schema: dict,
-            result_schema: dict
+            result_schema: dict,
+            lease_token: Optional[UUID]=None,
+            lease_expires_at: Optional[datetime]=None
     ) -> None:
         """
 
@@ -34,6 +37,8 @@ class Job(JobInterface):
             order to successfully create parameters for a job
         :param result_schema: The schema that must be satisified in order to
             post job results.
+        :param lease_token: The token of the worker that leased the job
+        :param lease_expires_at: The date on which the lease expires
         """
         self._job_id = job_id
         self._status = status
@@ -42,6 +47,8 @@ class Job(JobInterface):
         self._date_submitted = date_submitted
         self._parameter_schema = parameter_schema
         self._result_schema = result_schema
+        self._lease_token = lease_token
+        self._lease_expires_at = lease_expires_at
 
     @property
     def id(self) -> UUID:
@@ -102,6 +109,22 @@ class Job(JobInterface):
         """
         return self._date_submitted
 
+    @property
+    def lease_token(self) -> Optional[UUID]:
+        """
+
+        :return: The token of the worker to which the job is leased
+        """
+        return self._lease_token
+
+    @property
+    def lease_expires_at(self) -> Optional[datetime]:
+        """
+
+        :return: The date on which the job's lease expires
+        """
+        return self._lease_expires_at
+
     @property
     def parameter_schema(self) -> dict:
         """
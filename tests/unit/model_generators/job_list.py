@@ -6,7 +6,9 @@ from hypothesis.strategies import composite, lists
 from tests.unit.model_generators.job import jobs
 from topchef.models import JobList as JobListInterface
 from topchef.models import Job as JobInterface
-from typing import Iterable, MutableSequence, Iterator, Union
+from typing import Iterable, MutableSequence, Iterator, Union, Optional
+from typing import Sequence, Tuple
+from datetime import datetime, timedelta
 from uuid import UUID
 
 
@@ -51,6 +53,107 @@ class JobList(JobListInterface):
     def __aiter__(self):
         raise Exception()
 
+    def page(
+            self, limit: int, after: Optional[Tuple[datetime, UUID]]=None,
+            filters: Sequence[JobListInterface.Filter]=()
+    ) -> Sequence[JobInterface]:
+        """
+
+        :param limit: The maximum number of jobs on the page
+        :param after: The position of the last job on the previous page
+        :param filters: The conditions that every job must match
+        :return: At most ``limit`` jobs sorted after ``after``
+        """
+        sorted_jobs = sorted(
+            (
+                job for job in self._jobs.values()
+                if all(job_filter.matches(job) for job_filter in filters)
+            ),
+            key=lambda job: (job.date_submitted, job.id)
+        )
+        if after is not None:
+            sorted_jobs = [
+                job for job in sorted_jobs
+                if (job.date_submitted, job.id) > tuple(after)
+            ]
+        return sorted_jobs[:limit]
+
+    def registered_jobs(self, limit: int) -> Sequence[JobInterface]:
+        """
+
+        :param limit: The maximum number of jobs to return
+        :return: At most ``limit`` registered jobs, oldest first
+        """
+        registered_jobs = sorted(
+            (
+                job for job in self._jobs.values()
+                if job.status is JobInterface.JobStatus.REGISTERED
+            ),
+            key=lambda job: job.date_submitted
+        )
+        return registered_jobs[:limit]
+
+    def summary(self) -> JobListInterface.Summary:
+        """
+
+        :return: The number of jobs with each status, and the date of the
+            oldest registered job
+        """
+        counts = {
+            status.name.lower(): 0 for status in JobInterface.JobStatus
+        }
+        for job in self._jobs.values():
+            counts[job.status.name.lower()] += 1
+
+        registered_jobs = self.registered_jobs(1)
+        return self.Summary(
+            oldest_registered_job_date=registered_jobs[0].date_submitted
+            if registered_jobs else None,
+            **counts
+        )
+
+    def claim_next_job(self) -> Optional[JobInterface]:
+        """
+
+        :return: The oldest registered job, after having been set to
+            ``WORKING``, or ``None`` if there are no registered jobs
+        """
+        registered_jobs = self.registered_jobs(1)
+        if not registered_jobs:
+            return None
+
+        next_job = registered_jobs[0]
+        next_job.status = JobInterface.JobStatus.WORKING
+        return next_job
+
+    def claim_next_jobs(self, count: int) -> Sequence[JobInterface]:
+        """
+
+        :param count: The maximum number of jobs to claim
+        :return: The oldest ``count`` registered jobs, after having been
+            set to ``WORKING``
+        """
+        claimed_jobs = self.registered_jobs(count)
+        for job in claimed_jobs:
+            job.status = JobInterface.JobStatus.WORKING
+        return claimed_jobs
+
+    def extend_lease(
+            self, job_id: UUID, lease_token: UUID
+    ) -> Optional[datetime]:
+        """
+
+        :param job_id: The ID of the job whose lease is to be extended
+        :param lease_token: The token of the worker holding the lease
+        :return: A date five minutes from now if the job is leased with
+            that token, otherwise ``None``
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.status is not JobInterface.JobStatus.WORKING \
+                or job.lease_token != lease_token:
+            return None
+        return datetime.utcnow() + timedelta(minutes=5)
+
     def __eq__(self, other: JobListInterface) -> bool:
         return set(self) == set(other)
 
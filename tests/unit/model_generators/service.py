@@ -12,7 +12,7 @@ from topchef.models import Service as ServiceInterface
 from topchef.json_type import JSON_TYPE as JSON
 from uuid import UUID, uuid4
 from sqlalchemy.orm import Session
-from typing import Callable
+from typing import Callable, Sequence
 from topchef.database.models import Service as DatabaseService
 from topchef.database.models import Job as DatabaseJob
 from topchef.models import Job
@@ -148,6 +148,11 @@ class Service(ServiceInterface):
 
         return new_job
 
+    def new_jobs(self, parameter_sets: Sequence[JSON]) -> Sequence[UUID]:
+        return [
+            self.new_job(parameters).id for parameters in parameter_sets
+        ]
+
     @property
     def jobs(self) -> JobListInterface:
         return self._jobs
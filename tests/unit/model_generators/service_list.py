@@ -9,7 +9,7 @@ from tests.unit.model_generators.service import Service as MockService
 from topchef.models import ServiceList as ServiceListInterface
 from topchef.models import Service as ServiceInterface
 from topchef.json_type import JSON_TYPE as JSON
-from typing import Iterable, Union, Iterator
+from typing import Iterable, Union, Iterator, Optional, Sequence
 from uuid import UUID
 
 
@@ -43,6 +43,25 @@ class _ServiceList(ServiceListInterface):
     def __len__(self) -> int:
         return len(self._services.keys())
 
+    def page(
+            self, limit: int, after: Optional[UUID]=None,
+            is_available: Optional[bool]=None, is_alive: Optional[bool]=None
+    ) -> Sequence[ServiceInterface]:
+        services = sorted(self._services.values(), key=lambda s: s.id)
+        if after is not None:
+            services = [service for service in services if service.id > after]
+        if is_available is not None:
+            services = [
+                service for service in services
+                if service.is_service_available == is_available
+            ]
+        if is_alive is not None:
+            services = [
+                service for service in services
+                if service.has_timed_out != is_alive
+            ]
+        return services[:limit]
+
     def new(
             self, name: str, description: str, registration_schema: JSON,
             result_schema: JSON
@@ -7,9 +7,11 @@ import unittest.mock as mock
 
 from flask import Request, jsonify, Response, Flask
 from sqlalchemy.orm import Session
+from werkzeug.datastructures import MultiDict
 
 from topchef.api.abstract_endpoints.abstract_endpoint import AbstractEndpoint
 from topchef.models import APIError
+from topchef.models.errors import InvalidQueryParameterError
 
 
 class TestAbstractEndpoint(unittest.TestCase):
@@ -314,3 +316,47 @@ class TestDispatchRequest(TestAbstractEndpoint):
                 TestDispatchRequest.ConcreteAPIError(501)
             )
             return jsonify(dict())
+
+
+class TestIntegerQueryParameter(TestAbstractEndpoint):
+    """
+    Contains unit tests for reading integer query string parameters
+    """
+    def test_default(self) -> None:
+        """
+        Tests that the default is returned if the parameter is missing
+        """
+        self.request.args = MultiDict()
+        self.assertEqual(
+            10, self.endpoint.integer_query_parameter('limit', 10)
+        )
+
+    def test_value(self) -> None:
+        """
+        Tests that a valid integer is parsed
+        """
+        self.request.args = MultiDict([('limit', '5')])
+        self.assertEqual(
+            5, self.endpoint.integer_query_parameter(
+                'limit', 10, minimum=1, maximum=100
+            )
+        )
+
+    def test_not_an_integer(self) -> None:
+        """
+        Tests that a value that is not an integer is rejected
+        """
+        self.request.args = MultiDict([('limit', 'many')])
+        with self.assertRaises(InvalidQueryParameterError):
+            self.endpoint.integer_query_parameter('limit', 10)
+
+    def test_out_of_range(self) -> None:
+        """
+        Tests that values outside of the allowed range are rejected
+        """
+        for value in ('0', '101'):
+            self.request.args = MultiDict([('limit', value)])
+            with self.assertRaises(InvalidQueryParameterError):
+                self.endpoint.integer_query_parameter(
+                    'limit', 10, minimum=1, maximum=100
+                )
@@ -3,7 +3,7 @@ Contains unit tests for the endpoint with service wrapper
 """
 import unittest
 import unittest.mock as mock
-from uuid import UUID
+from uuid import UUID, uuid4
 from flask import Response, jsonify
 from topchef.api.abstract_endpoints import EndpointForServiceIdMeta
 from topchef.models import ServiceList, Service
@@ -126,6 +126,23 @@ class TestServiceDecorator(TestEndpointForService):
         response = endpoint.get(str(service_id))
         self.assertEqual(response.status_code, 200)
 
+    def test_service_resolved_once_per_instance(self) -> None:
+        """
+        Tests that calling two decorated handlers on the same endpoint
+        looks the service up only once
+        """
+        service = mock.MagicMock(spec=Service)
+        service.id = uuid4()
+        service_list = mock.MagicMock(spec=ServiceList)
+        service_list.__getitem__.return_value = service
+        endpoint = self.ServiceEndpointSubtype(service_list)
+
+        endpoint.get(str(service.id))
+        endpoint.get(str(service.id))
+
+        self.assertEqual(1, service_list.__getitem__.call_count)
+        self.assertIs(service, endpoint._service)
+
     @staticmethod
     def _is_uuid(service_id: str) -> bool:
         try:
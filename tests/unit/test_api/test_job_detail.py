@@ -3,12 +3,14 @@ Contains unit tests for the ``/jobs/<job_id>`` endpoint
 """
 import unittest
 import unittest.mock as mock
+from datetime import datetime
+from uuid import uuid4
 from jsonschema import Draft4Validator, ValidationError
 from sqlalchemy.orm import Session
 from flask import Request, Flask
 from hypothesis import given, assume
 from hypothesis.strategies import sampled_from, dictionaries, text
-from tests.unit.model_generators.job import jobs
+from tests.unit.model_generators.job import Job as MockJob, jobs
 from topchef.api.job_detail import JobDetail
 from topchef.models import Job
 
@@ -247,3 +249,47 @@ class TestPatch(TestJobDetail):
             endpoint.patch(job)
 
         self.assertTrue(endpoint.errors)
+
+
+class TestPatchLeasedJob(TestJobDetail):
+    """
+    Contains unit tests for modifying a job that is leased to a worker
+    """
+    def setUp(self) -> None:
+        TestJobDetail.setUp(self)
+        self.lease_token = uuid4()
+        self.job = MockJob(
+            uuid4(), Job.JobStatus.WORKING, {}, {}, datetime.utcnow(),
+            {'type': 'object'}, {'type': 'object'},
+            lease_token=self.lease_token, lease_expires_at=datetime.utcnow()
+        )
+
+    def test_patch_with_lease_token(self) -> None:
+        self.request.get_json = mock.MagicMock(return_value={
+            'status': 'COMPLETED', 'lease_token': str(self.lease_token)
+        })
+        endpoint = JobDetail(self.session, flask_request=self.request)
+        response = endpoint.patch(self.job)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(Job.JobStatus.COMPLETED, self.job.status)
+
+    def test_patch_without_lease_token(self) -> None:
+        """
+        Tests that a leased job cannot be modified by a request that does
+        not hold its lease, whether it sends no token or the wrong one
+        """
+        for request_body in [
+            {'status': 'COMPLETED'},
+            {'status': 'COMPLETED', 'lease_token': str(uuid4())}
+        ]:
+            with self.subTest(request_body=request_body):
+                self.request.get_json = mock.MagicMock(
+                    return_value=request_body
+                )
+                endpoint = JobDetail(self.session, flask_request=self.request)
+
+                with self.assertRaises(endpoint.Abort):
+                    endpoint.patch(self.job)
+
+                self.assertEqual(409, endpoint.errors[0].status_code)
+                self.assertEqual(Job.JobStatus.WORKING, self.job.status)
@@ -0,0 +1,90 @@
+"""
+Contains unit tests for :mod:`topchef.api.job_filters`
+"""
+import unittest
+from hypothesis import given
+from hypothesis.strategies import from_regex, integers
+from topchef.api.job_filters import parse_job_filter
+from topchef.models import JobList
+
+
+class TestParseJobFilter(unittest.TestCase):
+    """
+    Contains unit tests for reading filters from the query string
+    """
+    def test_number(self) -> None:
+        self.assertEqual(
+            JobList.Filter('parameters', ('pulse_time',), '>', 10),
+            parse_job_filter('parameters.pulse_time>10')
+        )
+
+    def test_unquoted_string(self) -> None:
+        """
+        Tests that a value that is not JSON is read as a string
+        """
+        self.assertEqual(
+            JobList.Filter('parameters', ('experiment_type',), '=', 'RABI'),
+            parse_job_filter('parameters.experiment_type=RABI')
+        )
+
+    def test_quoted_string(self) -> None:
+        """
+        Tests that a JSON string is read as a string, so that strings that
+        look like numbers can be filtered by
+        """
+        self.assertEqual(
+            JobList.Filter('results', ('run',), '!=', '10'),
+            parse_job_filter('results.run!="10"')
+        )
+
+    def test_nested_path(self) -> None:
+        self.assertEqual(
+            JobList.Filter('results', ('counts', 0, 'value'), '<=', 2.5),
+            parse_job_filter('results.counts[0].value<=2.5')
+        )
+
+    def test_boolean_and_null(self) -> None:
+        self.assertEqual(
+            JobList.Filter('parameters', ('flag',), '=', True),
+            parse_job_filter('parameters.flag=true')
+        )
+        self.assertEqual(
+            JobList.Filter('parameters', ('flag',), '=', None),
+            parse_job_filter('parameters.flag=null')
+        )
+
+    def test_non_finite_number(self) -> None:
+        """
+        Tests that ``NaN`` is read as a string, since it is not a JSON
+        number
+        """
+        self.assertEqual(
+            'NaN', parse_job_filter('parameters.value=NaN').value
+        )
+
+    @given(integers(), from_regex(r'\A[A-Za-z0-9_\-]+\Z'))
+    def test_round_trip(self, value: int, key: str) -> None:
+        """
+        Tests that any key and integer can be filtered by
+
+        :param value: The value to compare with
+        :param key: The key in the parameters
+        """
+        self.assertEqual(
+            JobList.Filter('parameters', (key,), '>=', value),
+            parse_job_filter('parameters.%s>=%d' % (key, value))
+        )
+
+    def test_invalid_filters(self) -> None:
+        """
+        Tests that filters that are malformed, or that cannot be evaluated,
+        are rejected
+        """
+        for expression in [
+            'parameters', 'parameters=1', 'parameters.a', 'jobs.a=1',
+            'parameters.a b=1', 'parameters.a=[1]', 'parameters.a={}',
+            'parameters.a<true', 'parameters.a!=null', 'parameters.a[x]=1'
+        ]:
+            with self.subTest(expression=expression):
+                with self.assertRaises(ValueError):
+                    parse_job_filter(expression)
@@ -0,0 +1,98 @@
+"""
+Contains unit tests for the ``/jobs/<job_id>/lease`` endpoint
+"""
+import json
+import unittest
+import unittest.mock as mock
+from datetime import datetime
+from uuid import uuid4
+from flask import Flask, Request
+from sqlalchemy.orm import Session
+from topchef.api.job_detail import JobDetailForJobID
+from topchef.api.job_lease import JobLease
+from topchef.models import Job, JobList
+from topchef.models.errors import LeaseNotHeldError
+
+
+class TestJobLease(unittest.TestCase):
+    """
+    Contains unit tests for extending the lease on a job
+    """
+    def setUp(self) -> None:
+        self.session = mock.MagicMock(spec=Session)
+        self.request = mock.MagicMock(spec=Request)
+        self.job_list = mock.MagicMock(spec=JobList)
+        self.job = mock.MagicMock(spec=Job)
+        self.job.id = uuid4()
+        self.lease_token = uuid4()
+
+        app = Flask(__name__)
+        app.add_url_rule(
+            '/jobs/<job_id>', view_func=JobDetailForJobID.as_view(
+                JobDetailForJobID.__name__
+            )
+        )
+        app.add_url_rule(
+            '/jobs/<job_id>/lease', view_func=JobLease.as_view(
+                JobLease.__name__
+            )
+        )
+        self.context = app.test_request_context()
+        self.context.push()
+
+        self.endpoint = JobLease(
+            self.session, self.request, job_list=self.job_list
+        )
+
+    def tearDown(self) -> None:
+        self.context.pop()
+
+    def test_extend_lease(self) -> None:
+        """
+        Tests that the lease is extended with the token in the request,
+        and that the new expiry date is returned
+        """
+        lease_expires_at = datetime(2017, 8, 15, 18, 34, 7)
+        self.job_list.extend_lease.return_value = lease_expires_at
+        self.request.get_json.return_value = {
+            'lease_token': str(self.lease_token)
+        }
+
+        response = self.endpoint.post(self.job)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            mock.call(self.job.id, self.lease_token),
+            self.job_list.extend_lease.call_args
+        )
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertEqual(str(self.lease_token), data['lease_token'])
+        self.assertEqual(
+            lease_expires_at.isoformat(), data['lease_expires_at'][:19]
+        )
+
+    def test_lease_not_held(self) -> None:
+        """
+        Tests that a lease that has expired, or is held by another worker,
+        cannot be extended
+        """
+        self.job_list.extend_lease.return_value = None
+        self.request.get_json.return_value = {
+            'lease_token': str(self.lease_token)
+        }
+
+        with self.assertRaises(self.endpoint.Abort):
+            self.endpoint.post(self.job)
+        self.assertIsInstance(self.endpoint.errors[0], LeaseNotHeldError)
+        self.assertEqual(409, self.endpoint.errors[0].status_code)
+
+    def test_missing_token(self) -> None:
+        """
+        Tests that a request without a lease token is rejected before any
+        lease is extended
+        """
+        self.request.get_json.return_value = {}
+
+        with self.assertRaises(self.endpoint.Abort):
+            self.endpoint.post(self.job)
+        self.assertFalse(self.job_list.extend_lease.called)
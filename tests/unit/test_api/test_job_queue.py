@@ -1,14 +1,20 @@
 """
 Contains unit tests for the job queue endpoint
 """
+import json
 import unittest
 import unittest.mock as mock
 from sqlalchemy.orm import Session
 from flask import Request, Flask
+from werkzeug.datastructures import MultiDict
 from topchef.api.job_queue import JobQueueForService
 from topchef.models import Service, ServiceList
+from topchef.models.errors import InvalidQueryParameterError
 from tests.unit.model_generators.service import services
+from tests.unit.model_generators.job_list import job_lists
+from tests.unit.model_generators.job import registered_jobs
 from hypothesis import given, assume, settings
+from hypothesis.strategies import integers
 from typing import Sized
 
 
@@ -16,6 +22,7 @@ class TestJobQueue(unittest.TestCase):
     def setUp(self) -> None:
         self.session = mock.MagicMock(spec=Session)  # type: Session
         self.request = mock.MagicMock(spec=Request)  # type: Request
+        self.request.args = MultiDict()
         self.service_list = mock.MagicMock(
             spec=ServiceList
         )  # type: ServiceList
@@ -58,3 +65,52 @@ class TestGet(TestJobQueue):
         return set(filter(
             lambda job: job.status is job.JobStatus.REGISTERED, service.jobs
         ))
+
+
+class TestGetWithLimit(TestJobQueue):
+    """
+    Contains unit tests for the ``limit`` query parameter
+    """
+    @given(
+        services(
+            service_job_lists=job_lists(min_size=1, jobs=registered_jobs())
+        ),
+        integers(min_value=1, max_value=100)
+    )
+    @settings(perform_health_check=False)
+    def test_limit_caps_number_of_jobs(
+            self, service: Service, limit: int
+    ) -> None:
+        """
+        Tests that no more than ``limit`` jobs are returned, and that they
+        are the oldest ones
+
+        :param service: A service with at least one registered job
+        :param limit: The limit to request
+        """
+        self.request.args = MultiDict([('limit', str(limit))])
+        endpoint = JobQueueForService(
+            self.session, self.request, self.service_list
+        )
+        response = endpoint.get(service)
+        self.assertEqual(200, response.status_code)
+
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertEqual(
+            [str(job.id) for job in service.jobs.registered_jobs(limit)],
+            [job['id'] for job in data]
+        )
+
+    @given(services())
+    def test_invalid_limit(self, service: Service) -> None:
+        """
+        Tests that a limit of zero is rejected
+
+        :param service: The service whose queue is to be retrieved
+        """
+        self.request.args = MultiDict([('limit', '0')])
+        endpoint = JobQueueForService(
+            self.session, self.request, self.service_list
+        )
+        with self.assertRaises(InvalidQueryParameterError):
+            endpoint.get(service)
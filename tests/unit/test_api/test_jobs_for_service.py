@@ -2,18 +2,24 @@
 Contains unit tests for :mod:`topchef.api.jobs_for_service`
 """
 import json
+from urllib.parse import parse_qs, urlparse
 import unittest.mock as mock
 from tests.unit.test_api import TestAPI
 from sqlalchemy.orm import Session
 from flask import Request
+from werkzeug.datastructures import MultiDict
 from topchef.models import Service
 from hypothesis import given, assume
 from hypothesis.strategies import fixed_dictionaries, dictionaries, text
+from hypothesis.strategies import lists
+from typing import List
+from uuid import UUID
 from tests.unit.model_generators.service import services
 from topchef.serializers import JobDetail as JobDetailSerializer
 from topchef.serializers import NewJob as NewJobSerializer
 from topchef.api.jobs_for_service import JobsForServiceEndpoint
 from topchef.models import ServiceList
+from topchef.config import config
 from jsonschema import Draft4Validator as JSONSchemaValidator
 
 
@@ -25,6 +31,7 @@ class TestJobsForService(TestAPI):
         TestAPI.setUp(self)
         self.session = mock.MagicMock(spec=Session)
         self.request = mock.MagicMock(spec=Request)
+        self.request.args = MultiDict()
         self.service_list = mock.MagicMock(spec=ServiceList)
         self.testing_app.add_url_rule(
             '/test_url/<service_id>', view_func=JobsForServiceEndpoint.as_view(
@@ -53,9 +60,75 @@ class TestGet(TestJobsForService):
         serializer = JobDetailSerializer()
         self.assertEqual(
             json.loads(response.data.decode('utf-8'))['data'],
-            serializer.dump(service.jobs, many=True).data
+            serializer.dump(
+                service.jobs.page(config.DEFAULT_PAGE_SIZE), many=True
+            ).data
         )
 
+    @given(services())
+    def test_next_link(self, service: Service) -> None:
+        """
+        Tests that a ``next`` link is only returned if there are jobs
+        after the first page
+
+        :param service: The service for which the endpoint is to be tested
+        """
+        self.request.args = MultiDict([('limit', '1')])
+        endpoint = JobsForServiceEndpoint(
+            self.session, self.request, self.service_list
+        )
+        response = endpoint.get(service)
+        links = json.loads(response.data.decode('utf-8'))['links']
+        self.assertEqual(len(service.jobs) > 1, 'next' in links)
+        if 'next' in links:
+            self.assertEqual(
+                ['1'], parse_qs(urlparse(links['next']).query)['limit']
+            )
+
+    @given(services())
+    def test_stream(self, service: Service) -> None:
+        """
+        Tests that streaming the jobs returns all of them in one response
+
+        :param service: The service whose jobs are to be streamed
+        """
+        self.request.args = MultiDict([('stream', 'true')])
+        endpoint = JobsForServiceEndpoint(
+            self.session, self.request, self.service_list
+        )
+        response = endpoint.get(service)
+        data = json.loads(response.get_data().decode('utf-8'))
+
+        serializer = JobDetailSerializer()
+        self.assertEqual(
+            serializer.dump(
+                service.jobs.page(len(service.jobs)), many=True
+            ).data,
+            data['data']
+        )
+        self.assertNotIn('next', data['links'])
+
+    @given(services())
+    def test_filter(self, service: Service) -> None:
+        """
+        Tests that only the jobs matching the ``filter`` query parameter
+        are returned, whether or not they are streamed. The parameters of
+        the generated jobs only hold strings, so no job has a number in
+        its parameters
+
+        :param service: The service whose jobs are to be filtered
+        """
+        for stream in ('false', 'true'):
+            self.request.args = MultiDict([
+                ('filter', 'parameters.pulse_time>10'), ('stream', stream)
+            ])
+            endpoint = JobsForServiceEndpoint(
+                self.session, self.request, self.service_list
+            )
+            response = endpoint.get(service)
+            data = json.loads(response.get_data().decode('utf-8'))
+            self.assertEqual([], data['data'])
+
 
 class TestPost(TestJobsForService):
     """
@@ -142,3 +215,108 @@ class TestPost(TestJobsForService):
 
         self.assertEqual(response.status_code, 201)
         self.assertIn('Location', response.headers)
+
+
+class TestPostSeveralJobs(TestJobsForService):
+    """
+    Contains unit tests for submitting a list of jobs in one ``POST``
+    request
+    """
+    def setUp(self) -> None:
+        TestJobsForService.setUp(self)
+        self.validator = mock.MagicMock(spec=JSONSchemaValidator)
+        self.validator.iter_errors = mock.MagicMock(return_value=[])
+        self.validator_factory = mock.MagicMock(return_value=self.validator)
+
+    @given(lists(dictionaries(text(), text()), min_size=1), services())
+    def test_all_jobs_valid(
+            self, parameter_sets: List[dict], service: Service
+    ) -> None:
+        """
+        Tests that every job is created, and that the validator is only
+        built once
+
+        :param parameter_sets: The parameters of the new jobs
+        :param service: The service for which the jobs are to be created
+        """
+        self.validator_factory.reset_mock()
+        self.request.get_json = mock.MagicMock(return_value=[
+            {'parameters': parameters} for parameters in parameter_sets
+        ])
+        endpoint = JobsForServiceEndpoint(
+            self.session, self.request, self.service_list,
+            self.validator_factory
+        )
+        response = endpoint.post(service)
+
+        self.assertEqual(201, response.status_code)
+        self.assertEqual(1, self.validator_factory.call_count)
+
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertEqual(len(parameter_sets), len(data['created_job_ids']))
+        for job_id in data['created_job_ids']:
+            self.assertIn(UUID(job_id), service.jobs)
+
+    @given(dictionaries(text(), text()), services())
+    def test_some_jobs_invalid(
+            self, parameters: dict, service: Service
+    ) -> None:
+        """
+        Tests that the valid jobs are created when others are invalid, and
+        that each invalid job is reported at its index
+
+        :param parameters: The parameters of the valid job
+        :param service: The service for which the jobs are to be created
+        """
+        self.request.get_json = mock.MagicMock(return_value=[
+            {'parameters': parameters}, 'not a job', {'no parameters': 1}
+        ])
+        endpoint = JobsForServiceEndpoint(
+            self.session, self.request, self.service_list,
+            self.validator_factory
+        )
+        response = endpoint.post(service)
+
+        self.assertEqual(207, response.status_code)
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertEqual(1, len(data['created_job_ids']))
+        self.assertEqual(
+            [201, 400, 400], [result['status'] for result in data['results']]
+        )
+        self.assertEqual(data['created_job_ids'][0], data['results'][0]['id'])
+
+    @given(services())
+    def test_all_jobs_invalid(self, service: Service) -> None:
+        """
+        Tests that ``400`` is returned if no job could be created
+
+        :param service: The service for which the jobs are to be created
+        """
+        self.validator.iter_errors = mock.MagicMock(
+            return_value=[mock.MagicMock()]
+        )
+        self.request.get_json = mock.MagicMock(return_value=[
+            {'parameters': {}}
+        ])
+        endpoint = JobsForServiceEndpoint(
+            self.session, self.request, self.service_list,
+            self.validator_factory
+        )
+        response = endpoint.post(service)
+
+        self.assertEqual(400, response.status_code)
+
+    @given(services())
+    def test_empty_list(self, service: Service) -> None:
+        """
+        Tests that an empty list of jobs is rejected
+
+        :param service: The service for which the jobs are to be created
+        """
+        self.request.get_json = mock.MagicMock(return_value=[])
+        endpoint = JobsForServiceEndpoint(
+            self.session, self.request, self.service_list,
+            self.validator_factory
+        )
+        with self.assertRaises(endpoint.Abort):
+            endpoint.post(service)
@@ -4,12 +4,19 @@ Contains unit tests for the ``/jobs`` endpoint
 import unittest
 import json
 import unittest.mock as mock
+from datetime import datetime
+from urllib.parse import urlparse, parse_qs
+from uuid import uuid4
 from flask import Request, Flask
 from sqlalchemy.orm import Session
+from werkzeug.datastructures import MultiDict
 from topchef.api import JobsList
+from topchef.config import config
+from topchef.models import Job as JobInterface
 from topchef.models import JobList as JobListInterface
 from topchef.serializers import JobOverview
 from hypothesis import given
+from hypothesis.strategies import integers
 from tests.unit.model_generators import job_lists
 
 
@@ -23,6 +30,7 @@ class TestJobList(unittest.TestCase):
         handle these fake requests
         """
         self.request = mock.MagicMock(spec=Request)
+        self.request.args = MultiDict()
         self.session = mock.MagicMock(spec=Session)
 
         self._app = Flask(__name__)
@@ -71,16 +79,127 @@ class TestGet(TestJobList):
     def test_get(self, job_list: JobListInterface) -> None:
         """
         Tests that the endpoint returns the ``200`` status code for a valid
-        list of jobs
+        list of jobs, and that the first page of jobs is returned
         """
         endpoint = JobsList(self.session, self.request, job_list)
         response = endpoint.get()
         self.assertEqual(200, response.status_code)
         self.assert_data_equal(
             json.loads(response.data.decode('utf-8')),
-            job_list
+            job_list.page(config.DEFAULT_PAGE_SIZE)
         )
 
+    @given(job_lists(), integers(min_value=1, max_value=5))
+    def test_following_next_links(
+            self, job_list: JobListInterface, limit: int
+    ) -> None:
+        """
+        Tests that following the ``next`` links from the first page visits
+        every job exactly once, in order
+
+        :param job_list: The jobs to paginate
+        :param limit: The page size
+        """
+        self.request.args = MultiDict([('limit', str(limit))])
+        visited_jobs = []
+
+        while True:
+            endpoint = JobsList(self.session, self.request, job_list)
+            response = json.loads(endpoint.get().data.decode('utf-8'))
+            self.assertLessEqual(len(response['data']), limit)
+            visited_jobs.extend(response['data'])
+
+            if 'next' not in response['links']:
+                break
+
+            query = parse_qs(urlparse(response['links']['next']).query)
+            self.assertEqual([str(limit)], query['limit'])
+            self.request.args = MultiDict(
+                (key, values[0]) for key, values in query.items()
+            )
+
+        self.assertEqual(
+            self.serialize_jobs(job_list.page(len(job_list))), visited_jobs
+        )
+
+    @given(job_lists())
+    def test_invalid_cursor(self, job_list: JobListInterface) -> None:
+        """
+        Tests that a cursor that was not made by the API is rejected
+
+        :param job_list: The jobs to paginate
+        """
+        self.request.args = MultiDict([('cursor', 'not a cursor')])
+        self.request.method = 'GET'
+        endpoint = JobsList(self.session, self.request, job_list)
+        response = endpoint.dispatch_request()
+        self.assertEqual(400, response.status_code)
+
+    def test_filters(self) -> None:
+        """
+        Tests that the ``filter`` query parameters are passed to the job
+        list, and kept in the ``next`` link
+        """
+        job_list = mock.MagicMock(spec=JobListInterface)
+        job_list.page.return_value = [
+            mock.MagicMock(
+                spec=JobInterface, date_submitted=datetime.utcnow(),
+                id=uuid4()
+            ),
+            mock.MagicMock(spec=JobInterface)
+        ]
+        self.request.args = MultiDict([
+            ('filter', 'parameters.pulse_time>10'), ('limit', '1')
+        ])
+        endpoint = JobsList(self.session, self.request, job_list)
+
+        with mock.patch.object(endpoint, '_data', return_value=[]):
+            response = json.loads(endpoint.get().data.decode('utf-8'))
+
+        job_list.page.assert_called_once_with(2, after=None, filters=[
+            JobListInterface.Filter('parameters', ('pulse_time',), '>', 10)
+        ])
+        self.assertEqual(
+            ['parameters.pulse_time>10'],
+            parse_qs(urlparse(response['links']['next']).query)['filter']
+        )
+
+    @given(job_lists())
+    def test_invalid_filter(self, job_list: JobListInterface) -> None:
+        """
+        Tests that a filter that cannot be read is rejected
+
+        :param job_list: The jobs to filter
+        """
+        self.request.args = MultiDict([('filter', 'parameters.a<true')])
+        self.request.method = 'GET'
+        endpoint = JobsList(self.session, self.request, job_list)
+        response = endpoint.dispatch_request()
+        self.assertEqual(400, response.status_code)
+
+    @given(job_lists(), integers(min_value=1, max_value=5))
+    def test_stream(self, job_list: JobListInterface, chunk_size: int) -> None:
+        """
+        Tests that streaming the list returns every job in one response, in
+        the same order as the pages
+
+        :param job_list: The jobs to stream
+        :param chunk_size: The number of jobs to read at once
+        """
+        self.request.args = MultiDict([('stream', 'true')])
+        endpoint = JobsList(self.session, self.request, job_list)
+
+        with mock.patch.object(config, 'STREAM_CHUNK_SIZE', chunk_size):
+            response = endpoint.get()
+            data = json.loads(response.get_data().decode('utf-8'))
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            self.serialize_jobs(job_list.page(len(job_list))), data['data']
+        )
+        self.assertNotIn('next', data['links'])
+        self.assertIn('data_schema', data['meta'])
+
     def assert_data_equal(
             self, data: dict, job_list: JobListInterface
     ) -> None:
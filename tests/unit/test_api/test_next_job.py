@@ -1,11 +1,16 @@
 """
 Contains unit tests for the next job endpoint
 """
+import json
 import unittest
 import unittest.mock as mock
+import itertools
+from uuid import UUID
 from topchef.api.next_job import NextJob
+from topchef.config import config
+from topchef.models.job_notifier import JobNotifier
 from hypothesis import given, assume
-from hypothesis.strategies import just
+from hypothesis.strategies import integers
 from topchef.models import Job
 from typing import Sequence
 from tests.unit.model_generators.service import services
@@ -14,6 +19,8 @@ from tests.unit.model_generators.job import registered_jobs
 from topchef.models import Service
 from sqlalchemy.orm import Session
 from flask import Request, Flask
+from werkzeug.datastructures import MultiDict
+from topchef.models.errors import InvalidQueryParameterError
 
 
 class TestNextJob(unittest.TestCase):
@@ -23,6 +30,7 @@ class TestNextJob(unittest.TestCase):
     def setUp(self) -> None:
         self.session = mock.MagicMock(spec=Session)  # type: Session
         self.request = mock.MagicMock(spec=Request)  # type: Request
+        self.request.args = MultiDict()
         app = Flask(__name__)
         app.add_url_rule('/', view_func=NextJob.as_view(
             NextJob.__name__
@@ -41,11 +49,20 @@ class TestGet(TestNextJob):
         )
     )
     def test_get_job_available(self, service: Service) -> None:
+        """
+        Tests that a job that is not claimed is returned without a lease
+        token
+
+        :param service: A service with at least one registered job
+        """
         endpoint = NextJob(self.session, self.request)
         response = endpoint.get(service)
         self.assertEqual(200, response.status_code)
 
-    @given(services(service_job_lists=just(list())))
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertNotIn('lease_token', data)
+
+    @given(services(service_job_lists=job_lists(max_size=0)))
     def test_get_job_unavailable(self, service: Service) -> None:
         assume(len(self._registered_jobs(service)) == 0)
         endpoint = NextJob(self.session, self.request)
@@ -58,3 +75,204 @@ class TestGet(TestNextJob):
             job for job in service.jobs
             if job.status == Job.JobStatus.REGISTERED
         )
+
+
+class TestGetWithClaim(TestNextJob):
+    """
+    Contains unit tests for claiming the next job with ``?claim=true``
+    """
+    def setUp(self) -> None:
+        TestNextJob.setUp(self)
+        self.request.args = MultiDict({'claim': 'true'})
+
+    @given(
+        services(
+            service_job_lists=job_lists(min_size=1, jobs=registered_jobs())
+        )
+    )
+    def test_claim_job_available(self, service: Service) -> None:
+        """
+        Tests that claiming a job returns it with a status of ``WORKING``,
+        and with the token of its lease
+
+        :param service: A service with at least one registered job
+        """
+        endpoint = NextJob(self.session, self.request)
+        response = endpoint.get(service)
+        self.assertEqual(200, response.status_code)
+
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertEqual('WORKING', data['status'])
+        self.assertIn('lease_token', data)
+        self.assertIs(
+            Job.JobStatus.WORKING, service.jobs[UUID(data['id'])].status
+        )
+
+    @given(services(service_job_lists=job_lists(max_size=0)))
+    def test_claim_job_unavailable(self, service: Service) -> None:
+        """
+        Tests that claiming a job from an empty queue returns ``204``
+
+        :param service: A service without any jobs
+        """
+        endpoint = NextJob(self.session, self.request)
+        response = endpoint.get(service)
+        self.assertEqual(204, response.status_code)
+
+    @given(services(service_job_lists=job_lists(max_size=0)))
+    def test_claim_not_boolean(self, service: Service) -> None:
+        """
+        Tests that a value for ``claim`` that isn't a boolean is reported
+
+        :param service: The service for which the request is made
+        """
+        self.request.args = MultiDict({'claim': 'maybe'})
+        endpoint = NextJob(self.session, self.request)
+        with self.assertRaises(InvalidQueryParameterError):
+            endpoint.get(service)
+
+
+class TestGetWithCount(TestNextJob):
+    """
+    Contains unit tests for claiming several jobs with ``?count=N``
+    """
+    @given(
+        services(
+            service_job_lists=job_lists(min_size=1, jobs=registered_jobs())
+        ),
+        integers(min_value=1, max_value=100)
+    )
+    def test_claim_several_jobs(self, service: Service, count: int) -> None:
+        """
+        Tests that at most ``count`` jobs are claimed and returned as a list
+
+        :param service: A service with at least one registered job
+        :param count: The number of jobs to claim
+        """
+        number_of_jobs = len(service.jobs)
+        self.request.args = MultiDict({'count': str(count)})
+        endpoint = NextJob(self.session, self.request)
+        response = endpoint.get(service)
+        self.assertEqual(200, response.status_code)
+
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertEqual(min(count, number_of_jobs), len(data))
+        for job in data:
+            self.assertEqual('WORKING', job['status'])
+            self.assertIn('lease_token', job)
+
+    @given(services(service_job_lists=job_lists(max_size=0)))
+    def test_claim_several_jobs_unavailable(self, service: Service) -> None:
+        """
+        Tests that claiming jobs from an empty queue returns ``204``
+
+        :param service: A service without any jobs
+        """
+        self.request.args = MultiDict({'count': '5'})
+        endpoint = NextJob(self.session, self.request)
+        response = endpoint.get(service)
+        self.assertEqual(204, response.status_code)
+
+    @given(services(service_job_lists=job_lists(max_size=0)))
+    def test_count_out_of_range(self, service: Service) -> None:
+        """
+        Tests that a count of zero is rejected
+
+        :param service: The service for which the request is made
+        """
+        self.request.args = MultiDict({'count': '0'})
+        endpoint = NextJob(self.session, self.request)
+        with self.assertRaises(InvalidQueryParameterError):
+            endpoint.get(service)
+
+
+class TestGetWithWait(TestNextJob):
+    """
+    Contains unit tests for long-polling with ``?wait=<seconds>``
+    """
+    def setUp(self) -> None:
+        TestNextJob.setUp(self)
+        self.job_notifier = mock.MagicMock(spec=JobNotifier)
+        self.job_notifier.generation.return_value = 0
+
+    @given(
+        services(
+            service_job_lists=job_lists(min_size=1, jobs=registered_jobs())
+        )
+    )
+    def test_job_available_does_not_wait(self, service: Service) -> None:
+        """
+        Tests that the endpoint returns right away if there is a job
+
+        :param service: A service with at least one registered job
+        """
+        self.job_notifier.reset_mock()
+        self.request.args = MultiDict({'wait': '30'})
+        endpoint = NextJob(
+            self.session, self.request, job_notifier=self.job_notifier
+        )
+        response = endpoint.get(service)
+        self.assertEqual(200, response.status_code)
+        self.assertFalse(self.job_notifier.wait.called)
+
+    @given(services(service_job_lists=job_lists(max_size=0)))
+    def test_timeout_returns_204(self, service: Service) -> None:
+        """
+        Tests that if no job shows up before the timeout, ``204`` is
+        returned, and that the transaction is ended before waiting
+
+        :param service: A service without any jobs
+        """
+        self.job_notifier.reset_mock()
+        self.request.args = MultiDict({'wait': '1'})
+        self.job_notifier.wait.return_value = False
+        endpoint = NextJob(
+            self.session, self.request, job_notifier=self.job_notifier
+        )
+        clock = mock.MagicMock(side_effect=itertools.count(0, 0.6))
+        with mock.patch('topchef.api.next_job.monotonic', clock):
+            response = endpoint.get(service)
+        self.assertEqual(204, response.status_code)
+        self.assertEqual(1, self.job_notifier.wait.call_count)
+        self.assertTrue(self.session.commit.called)
+
+    @given(
+        services(service_job_lists=job_lists(max_size=0)),
+        registered_jobs()
+    )
+    def test_job_submitted_while_waiting(
+            self, service: Service, job: Job
+    ) -> None:
+        """
+        Tests that a job submitted while the request waits is returned
+
+        :param service: A service that starts out without any jobs
+        :param job: The job that is submitted while waiting
+        """
+        def submit_job(*_) -> bool:
+            service.jobs[job.id] = job
+            return True
+
+        self.request.args = MultiDict({'wait': '30', 'claim': 'true'})
+        self.job_notifier.wait.side_effect = submit_job
+        endpoint = NextJob(
+            self.session, self.request, job_notifier=self.job_notifier
+        )
+        response = endpoint.get(service)
+        self.assertEqual(200, response.status_code)
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertEqual(str(job.id), data['id'])
+
+    @given(services(service_job_lists=job_lists(max_size=0)))
+    def test_wait_too_long(self, service: Service) -> None:
+        """
+        Tests that a wait above ``MAXIMUM_LONG_POLL_WAIT`` is rejected
+
+        :param service: The service for which the request is made
+        """
+        self.request.args = MultiDict({
+            'wait': str(config.MAXIMUM_LONG_POLL_WAIT + 1)
+        })
+        endpoint = NextJob(self.session, self.request)
+        with self.assertRaises(InvalidQueryParameterError):
+            endpoint.get(service)
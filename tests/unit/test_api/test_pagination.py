@@ -0,0 +1,81 @@
+"""
+Contains unit tests for :mod:`topchef.api.pagination`
+"""
+import unittest
+from datetime import datetime, timezone, timedelta
+from uuid import UUID
+from hypothesis import given
+from hypothesis.strategies import datetimes, uuids, text
+from topchef.api.pagination import Cursor, ServiceCursor
+
+
+class TestCursor(unittest.TestCase):
+    """
+    Contains unit tests for encoding and decoding cursors
+    """
+    @given(datetimes(), uuids())
+    def test_round_trip(self, date_submitted: datetime, job_id: UUID) -> None:
+        """
+        Tests that decoding an encoded cursor returns the original cursor
+
+        :param date_submitted: The date of the job at the cursor
+        :param job_id: The ID of the job at the cursor
+        """
+        cursor = Cursor(date_submitted, job_id)
+        self.assertEqual(cursor, Cursor.decode(cursor.encode()))
+
+    def test_time_zone_aware_date(self) -> None:
+        """
+        Tests that a date with a time zone is converted to naive UTC, which
+        is how dates are stored in the database
+        """
+        job_id = UUID(int=0)
+        cursor = Cursor(
+            datetime(2017, 1, 1, 12, tzinfo=timezone(timedelta(hours=2))),
+            job_id
+        )
+        self.assertEqual(
+            Cursor(datetime(2017, 1, 1, 10), job_id),
+            Cursor.decode(cursor.encode())
+        )
+
+    @given(text())
+    def test_invalid_cursor(self, token: str) -> None:
+        """
+        Tests that decoding something that is not a cursor raises
+        ``ValueError``
+
+        :param token: The string to decode
+        """
+        with self.assertRaises(ValueError):
+            Cursor.decode(token)
+
+
+class TestServiceCursor(unittest.TestCase):
+    """
+    Contains unit tests for encoding and decoding cursors into the list of
+    services
+    """
+    @given(uuids())
+    def test_round_trip(self, service_id: UUID) -> None:
+        """
+        Tests that decoding an encoded cursor returns the original cursor
+
+        :param service_id: The ID of the service at the cursor
+        """
+        cursor = ServiceCursor(service_id)
+        self.assertEqual(cursor, ServiceCursor.decode(cursor.encode()))
+
+    @given(datetimes(), uuids())
+    def test_job_cursor_is_invalid(
+            self, date_submitted: datetime, job_id: UUID
+    ) -> None:
+        """
+        Tests that a cursor into a list of jobs cannot be used to page
+        through services
+
+        :param date_submitted: The date of the job at the cursor
+        :param job_id: The ID of the job at the cursor
+        """
+        with self.assertRaises(ValueError):
+            ServiceCursor.decode(Cursor(date_submitted, job_id).encode())
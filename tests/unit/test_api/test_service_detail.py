@@ -7,6 +7,7 @@ import unittest.mock as mock
 from datetime import timedelta
 from math import floor
 from topchef.api.service_detail import ServiceDetail
+from topchef.api.jobs_for_service import JobsForServiceID as JobsForService
 from sqlalchemy.orm import Session
 from flask import Flask, Request
 from hypothesis import given, settings
@@ -14,6 +15,7 @@ from topchef.models import Service, ServiceList
 from topchef.serializers import ServiceDetail as ServiceSerializer
 from hypothesis.strategies import booleans, text, timedeltas
 from tests.unit.model_generators.service import services
+from werkzeug.datastructures import MultiDict
 from werkzeug.exceptions import BadRequest
 
 
@@ -27,6 +29,7 @@ class TestServiceDetail(unittest.TestCase):
         """
         self.session = mock.MagicMock(spec=Session)  # type: Session
         self.request = mock.MagicMock(spec=Request)  # type: Request
+        self.request.args = MultiDict()
         self.service_list = mock.MagicMock(
             spec=ServiceList
         )  # type: ServiceList
@@ -37,6 +40,11 @@ class TestServiceDetail(unittest.TestCase):
                 ServiceDetail.__name__, self.session
             )
         )
+        self._app.add_url_rule(
+            '/<service_id>/jobs', view_func=JobsForService.as_view(
+                JobsForService.__name__, self.session
+            )
+        )
 
         self._context = self._app.test_request_context()
 
@@ -66,6 +74,30 @@ class TestGet(TestServiceDetail):
 
         self._assert_data_equal(data['data'], service)
 
+    @given(services())
+    def test_get_summarizes_jobs(self, service: Service) -> None:
+        """
+        Tests that the jobs of the service are summarized instead of being
+        listed, and that the full list of jobs is linked to
+
+        :param service: The randomly-generated service to get
+        """
+        endpoint = ServiceDetail(
+            self.session, self.request, self.service_list
+        )
+        response = endpoint.get(service)
+        data = json.loads(response.data.decode('utf-8'))
+
+        self.assertNotIn('jobs', data['data'])
+        self.assertEqual(
+            len(service.jobs),
+            sum(
+                data['data']['job_summary'][status]
+                for status in ('registered', 'working', 'completed', 'error')
+            )
+        )
+        self.assertIn('/%s/jobs' % service.id, data['links']['jobs'])
+
     def _assert_data_equal(self, data: dict, service: Service) -> None:
         serializer = ServiceSerializer()
         self.assertEqual(data, serializer.dump(service).data)
@@ -90,7 +122,7 @@ class TestPatch(TestServiceDetail):
             self.session, self.request, self.service_list
         )
         response = endpoint.patch(service)
-        self.assertEqual(200, response.status_code)
+        self.assertEqual(204, response.status_code)
         self.assertFalse(service.has_timed_out)
 
     @given(services(), booleans())
@@ -142,6 +174,26 @@ class TestPatch(TestServiceDetail):
             floor(timeout.total_seconds()), service.timeout.total_seconds()
         )
 
+    @given(services(), text())
+    def test_patch_full_document(self, service: Service, name: str) -> None:
+        """
+        Tests that the modified service is returned if the full document is
+        asked for
+
+        :param service: The service to patch
+        :param name: The new name
+        """
+        self.request.args = MultiDict([('full', 'true')])
+        self.request.get_json = mock.MagicMock(return_value={'name': name})
+        endpoint = ServiceDetail(
+            self.session, self.request, self.service_list
+        )
+        response = endpoint.patch(service)
+
+        self.assertEqual(200, response.status_code)
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertEqual(name, data['name'])
+
     def _send_patch_request(
             self, service: Service, request_body: dict
     ) -> None:
@@ -150,4 +202,5 @@ class TestPatch(TestServiceDetail):
             self.session, self.request, self.service_list
         )
         response = endpoint.patch(service)
-        self.assertEqual(200, response.status_code)
+        self.assertEqual(204, response.status_code)
+        self.assertFalse(response.data)
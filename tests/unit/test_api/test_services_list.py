@@ -2,6 +2,9 @@
 Contains unit tests for the services list
 """
 import json
+from urllib.parse import urlparse, parse_qs
+from werkzeug.datastructures import MultiDict
+from topchef.config import config
 from topchef.models import ServiceList
 from topchef.serializers import ServiceOverview as ServiceSerializer
 from flask import Request
@@ -11,7 +14,8 @@ from sqlalchemy.orm import Session
 from topchef.api import ServicesList
 from topchef.models.errors import RequestNotJSONError
 from hypothesis import given, assume
-from hypothesis.strategies import composite, text, dictionaries
+from hypothesis.strategies import composite, text, dictionaries, integers
+from hypothesis.strategies import booleans, none, one_of
 from tests.unit.model_generators.service_list import service_lists
 
 
@@ -27,6 +31,7 @@ class TestServicesList(TestAPI):
         TestAPI.setUp(self)
         self.session = mock.MagicMock(spec=Session)  # type: Session
         self.request = mock.MagicMock(spec=Request)  # type: Request
+        self.request.args = MultiDict()
 
 
 class TestGet(TestServicesList):
@@ -41,17 +46,106 @@ class TestGet(TestServicesList):
     def test_200_status_code(self, service_list: ServiceList) -> None:
         """
 
-        Tests that the method returns the 200 status code
+        Tests that the method returns the 200 status code, and every
+        service, without a ``next`` link, if neither ``limit`` nor
+        ``cursor`` is given
         """
         endpoint = ServicesList(
             self.session, self.request, service_list
         )
         response = endpoint.get()
         self.assertEqual(self.expected_response_code, response.status_code)
+        response_body = json.loads(response.data.decode('utf-8'))
+        self.assert_data_equal(response_body, service_list.page(None))
+        self.assertNotIn('next', response_body['links'])
+
+    @given(service_lists())
+    def test_default_page_size(self, service_list: ServiceList) -> None:
+        """
+        Tests that a cursor without a ``limit`` gives a page of the default
+        size
+
+        :param service_list: The services to page through
+        """
+        self.request.args = MultiDict([('limit', '1')])
+        first_page = json.loads(ServicesList(
+            self.session, self.request, service_list
+        ).get().data.decode('utf-8'))
+        assume('next' in first_page['links'])
+
+        self.request.args = MultiDict([('cursor', parse_qs(urlparse(
+            first_page['links']['next']
+        ).query)['cursor'][0])])
+        response = ServicesList(
+            self.session, self.request, service_list
+        ).get()
+
         self.assert_data_equal(
-            json.loads(response.data.decode('utf-8')), service_list
+            json.loads(response.data.decode('utf-8')),
+            service_list.page(
+                config.DEFAULT_PAGE_SIZE,
+                after=service_list.page(1)[0].id
+            )
         )
 
+    @given(
+        service_lists(), integers(min_value=1, max_value=5),
+        one_of(none(), booleans()), one_of(none(), booleans())
+    )
+    def test_following_next_links(
+            self, service_list: ServiceList, limit: int,
+            is_available: bool, is_alive: bool
+    ) -> None:
+        """
+        Tests that following the ``next`` links from the first page visits
+        every service that matches the filters exactly once, in order
+
+        :param service_list: The services to paginate
+        :param limit: The page size
+        :param is_available: The availability filter, if any
+        :param is_alive: The liveness filter, if any
+        """
+        self.request.args = MultiDict([('limit', str(limit))])
+        if is_available is not None:
+            self.request.args['available'] = str(is_available).lower()
+        if is_alive is not None:
+            self.request.args['alive'] = str(is_alive).lower()
+        visited_services = []
+
+        while True:
+            endpoint = ServicesList(self.session, self.request, service_list)
+            response = json.loads(endpoint.get().data.decode('utf-8'))
+            self.assertLessEqual(len(response['data']), limit)
+            visited_services.extend(response['data'])
+
+            if 'next' not in response['links']:
+                break
+
+            query = parse_qs(urlparse(response['links']['next']).query)
+            self.request.args = MultiDict(
+                (key, values[0]) for key, values in query.items()
+            )
+
+        self.assert_data_equal(
+            {'data': visited_services}, service_list.page(
+                len(service_list), is_available=is_available,
+                is_alive=is_alive
+            )
+        )
+
+    @given(service_lists())
+    def test_invalid_filter(self, service_list: ServiceList) -> None:
+        """
+        Tests that a filter that is not a boolean is rejected
+
+        :param service_list: The services to filter
+        """
+        self.request.args = MultiDict([('alive', 'maybe')])
+        self.request.method = 'GET'
+        endpoint = ServicesList(self.session, self.request, service_list)
+        response = endpoint.dispatch_request()
+        self.assertEqual(400, response.status_code)
+
     def assert_data_equal(self, data: dict, service_list: ServiceList) -> None:
         """
 
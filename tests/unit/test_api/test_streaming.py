@@ -0,0 +1,64 @@
+"""
+Contains unit tests for :mod:`topchef.api.streaming`
+"""
+import json
+import unittest
+import unittest.mock as mock
+from hypothesis import given
+from hypothesis.strategies import integers, lists, dictionaries, text
+from topchef.api.streaming import jobs_in_chunks, json_document
+from topchef.models import JobList
+from tests.unit.model_generators import job_lists
+
+
+class TestJobsInChunks(unittest.TestCase):
+    """
+    Contains unit tests for iterating over a job list in chunks
+    """
+    @given(job_lists(), integers(min_value=1, max_value=5))
+    def test_all_jobs_in_order(self, job_list: JobList, chunk_size: int):
+        """
+        Tests that every job is visited once, in the order of the pages
+
+        :param job_list: The jobs to iterate over
+        :param chunk_size: The number of jobs to read at once
+        """
+        self.assertEqual(
+            list(job_list.page(len(job_list))),
+            list(jobs_in_chunks(job_list, chunk_size))
+        )
+
+    def test_filters(self) -> None:
+        """
+        Tests that the filters are applied to every chunk
+        """
+        job_list = mock.MagicMock(spec=JobList)
+        job_list.page.return_value = []
+        filters = [JobList.Filter('results', ('value',), '=', 1)]
+
+        self.assertEqual(
+            [], list(jobs_in_chunks(job_list, 2, filters=filters))
+        )
+        job_list.page.assert_called_once_with(2, after=None, filters=filters)
+
+
+class TestJSONDocument(unittest.TestCase):
+    """
+    Contains unit tests for writing a JSON document in pieces
+    """
+    @given(
+        lists(dictionaries(text(), integers())),
+        dictionaries(text(), text())
+    )
+    def test_document_is_json(self, data: list, links: dict) -> None:
+        """
+        Tests that joining the pieces gives the same JSON object that would
+        have been written in one go
+
+        :param data: The elements of the data array
+        :param links: Another member of the document
+        """
+        document = ''.join(json_document(iter(data), links=links))
+        self.assertEqual(
+            {'data': data, 'links': links}, json.loads(document)
+        )
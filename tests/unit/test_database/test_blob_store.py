@@ -0,0 +1,184 @@
+"""
+Contains unit tests for :mod:`topchef.database.blob_store`
+"""
+import json
+import os
+import unittest
+import unittest.mock as mock
+from tempfile import TemporaryDirectory
+from hypothesis import given
+from hypothesis.strategies import binary, dictionaries, text
+from sqlalchemy.dialects.sqlite.pysqlite import SQLiteDialect_pysqlite
+from topchef.database.blob_store import BlobStore
+from topchef.database.json_type import JSON
+
+
+class TestBlobStore(unittest.TestCase):
+    """
+    Base class for unit testing the blob store, in a temporary directory
+    """
+    def setUp(self) -> None:
+        self._directory = TemporaryDirectory()
+        self.blob_store = BlobStore(self._directory.name, threshold=64)
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+
+class TestPutAndGet(TestBlobStore):
+    """
+    Contains unit tests for writing and reading documents
+    """
+    @given(binary(min_size=1))
+    def test_round_trip(self, data: bytes) -> None:
+        """
+        Tests that a stored document is read back unchanged
+
+        :param data: The document to store
+        """
+        self.assertEqual(data, self.blob_store.get(self.blob_store.put(data)))
+
+    def test_identical_documents_stored_once(self) -> None:
+        """
+        Tests that storing the same document twice writes one file
+        """
+        digest = self.blob_store.put(b'{"value": 1}')
+        self.assertEqual(digest, self.blob_store.put(b'{"value": 1}'))
+        self.assertEqual(
+            [digest[2:]],
+            os.listdir(os.path.join(self._directory.name, digest[:2]))
+        )
+
+    def test_failed_write_leaves_no_file(self) -> None:
+        """
+        Tests that the temporary file is removed if the document cannot be
+        moved into place
+        """
+        with mock.patch('os.replace', side_effect=OSError()):
+            with self.assertRaises(OSError):
+                self.blob_store.put(b'{"value": 1}')
+
+        self.assertEqual([], [
+            file_name for _, _, file_names in os.walk(self._directory.name)
+            for file_name in file_names
+        ])
+
+    def test_missing_document(self) -> None:
+        """
+        Tests that reading a document that was never stored raises
+        ``KeyError``
+        """
+        with self.assertRaises(KeyError):
+            self.blob_store.get('0' * 64)
+
+
+class TestDumpAndLoad(TestBlobStore):
+    """
+    Contains unit tests for swapping large documents for references
+    """
+    def test_small_document_kept(self) -> None:
+        """
+        Tests that a document no longer than the threshold is not stored
+        """
+        document = json.dumps({'value': 1})
+        self.assertEqual(document, self.blob_store.dump(document))
+
+    @given(dictionaries(text(), text(), min_size=1))
+    def test_large_document_stored(self, value: dict) -> None:
+        """
+        Tests that a document longer than the threshold is replaced by a
+        reference, which loads the original document
+
+        :param value: The document
+        """
+        value['padding'] = 'x' * 64
+        reference = json.loads(self.blob_store.dump(json.dumps(value)))
+
+        self.assertEqual(['$blob'], list(reference.keys()))
+        self.assertEqual(value, self.blob_store.load(reference))
+
+    def test_value_that_is_not_a_reference(self) -> None:
+        """
+        Tests that values that do not refer to a stored document are loaded
+        unchanged
+        """
+        for value in [
+            {'$blob': '../../etc/passwd'}, {'$blob': 'a' * 64, 'other': 1},
+            ['$blob'], 'text', None
+        ]:
+            self.assertEqual(value, self.blob_store.load(value))
+
+
+class TestEscape(unittest.TestCase):
+    """
+    Contains unit tests for wrapping documents that look like references
+    """
+    def test_reference_like_documents_escaped(self) -> None:
+        for value in [
+            {'$blob': 'a' * 64}, {'$blob': 1}, {'$document': None},
+            {'$document': {'$blob': 'a' * 64}}
+        ]:
+            with self.subTest(value=value):
+                escaped_value = BlobStore.escape(value)
+                self.assertEqual({'$document': value}, escaped_value)
+                self.assertEqual(value, BlobStore.unescape(escaped_value))
+
+    def test_other_values_unchanged(self) -> None:
+        for value in [
+            {'$blob': 'a' * 64, 'other': 1}, {'value': 1}, {}, ['$blob'],
+            'text', None
+        ]:
+            with self.subTest(value=value):
+                self.assertEqual(value, BlobStore.escape(value))
+                self.assertEqual(value, BlobStore.unescape(value))
+
+
+class TestJSONWithBlobStore(TestBlobStore):
+    """
+    Contains unit tests for the JSON database type with a blob store
+    """
+    def setUp(self) -> None:
+        TestBlobStore.setUp(self)
+        self.json_type = JSON(blob_store=self.blob_store)
+        self.dialect = SQLiteDialect_pysqlite()
+
+    def test_round_trip(self) -> None:
+        """
+        Tests that a large document is written as a reference, and read
+        back in full
+        """
+        value = {'results': list(range(100))}
+        column_value = self.json_type.process_bind_param(value, self.dialect)
+
+        self.assertLess(len(column_value), len(json.dumps(value)))
+        self.assertEqual(
+            value,
+            self.json_type.process_result_value(column_value, self.dialect)
+        )
+
+    def test_copy_keeps_blob_store(self) -> None:
+        """
+        Tests that copies of the type, which SQLAlchemy makes for each
+        column, use the same blob store
+        """
+        self.assertIs(self.blob_store, self.json_type.copy().blob_store)
+
+    def test_reference_like_documents_round_trip(self) -> None:
+        """
+        Tests that documents shaped like references are read back as they
+        were written, with or without a blob store, whether they are kept
+        in the column or in the store
+        """
+        digest = self.blob_store.put(b'{"value": 1}')
+        for json_type in [self.json_type, JSON()]:
+            for value in [
+                {'$blob': digest}, {'$blob': '0' * 64},
+                {'$blob': 'x' * 100}, {'$document': {'value': 1}}
+            ]:
+                with self.subTest(json_type=json_type, value=value):
+                    column_value = json_type.process_bind_param(
+                        value, self.dialect
+                    )
+                    self.assertEqual(value, json_type.process_result_value(
+                        column_value, self.dialect
+                    ))
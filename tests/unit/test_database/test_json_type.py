@@ -0,0 +1,187 @@
+"""
+Contains unit tests for :mod:`topchef.database.json_type`
+"""
+import json
+import tempfile
+import unittest
+from hypothesis import given
+from hypothesis.strategies import dictionaries, integers, lists, text
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from sqlalchemy.dialects.sqlite.pysqlite import SQLiteDialect_pysqlite
+from topchef.database.blob_store import BlobStore
+from topchef.database.json_type import JSON, CompressedJSON
+from topchef.json_codec import JSON_CODEC
+
+
+class TestCompressedJSON(unittest.TestCase):
+    """
+    Contains unit tests for the compressed JSON type
+    """
+    def setUp(self) -> None:
+        self.json_type = CompressedJSON(threshold=64, level=6)
+        self.sqlite_dialect = SQLiteDialect_pysqlite()
+        self.pg_sql_dialect = PGDialect_psycopg2()
+        self.large_document = {'results': [0.5] * 1000}
+
+    @given(dictionaries(text(), lists(integers())))
+    def test_round_trip(self, value: dict) -> None:
+        """
+        Tests that every document is read back unchanged, whether or not it
+        was long enough to be compressed
+
+        :param value: The document to write
+        """
+        self.assertEqual(value, self._round_trip(value))
+
+    def test_large_document_compressed(self) -> None:
+        """
+        Tests that a long, repetitive document is stored compressed
+        """
+        column_value = self.json_type.process_bind_param(
+            self.large_document, self.sqlite_dialect
+        )
+        self.assertTrue(column_value.startswith('zlib:'))
+        self.assertLess(
+            5 * len(column_value), len(json.dumps(self.large_document))
+        )
+
+    def test_small_document_not_compressed(self) -> None:
+        """
+        Tests that a document no longer than the threshold is stored as it
+        is
+        """
+        value = {'value': 1}
+        self.assertEqual(
+            JSON_CODEC.dumps(value),
+            self.json_type.process_bind_param(value, self.sqlite_dialect)
+        )
+
+    def test_legacy_row(self) -> None:
+        """
+        Tests that a large document that was written before compression was
+        turned on is read as it is
+        """
+        legacy_value = JSON().process_bind_param(
+            self.large_document, self.sqlite_dialect
+        )
+        self.assertEqual(
+            self.large_document,
+            self.json_type.process_result_value(
+                legacy_value, self.sqlite_dialect
+            )
+        )
+
+    def test_native_json_not_compressed(self) -> None:
+        """
+        Tests that documents are not compressed on databases with a JSON
+        type
+        """
+        self.assertEqual(
+            self.large_document,
+            self.json_type.process_bind_param(
+                self.large_document, self.pg_sql_dialect
+            )
+        )
+
+    def test_copy(self) -> None:
+        """
+        Tests that copies of the type keep the threshold and level
+        """
+        copy = self.json_type.copy()
+        self.assertIsInstance(copy, CompressedJSON)
+        self.assertEqual(
+            (self.json_type.threshold, self.json_type.level),
+            (copy.threshold, copy.level)
+        )
+
+    def _round_trip(self, value: dict) -> dict:
+        """
+
+        :param value: The document to write
+        :return: The document, written to and read back from SQLite
+        """
+        return self.json_type.process_result_value(
+            self.json_type.process_bind_param(value, self.sqlite_dialect),
+            self.sqlite_dialect
+        )
+
+
+class TestJSONOnNativeDatabases(unittest.TestCase):
+    """
+    Contains unit tests for the JSON type on databases with a JSON type of
+    their own
+    """
+    def setUp(self) -> None:
+        self.json_type = JSON()
+        self.pg_sql_dialect = PGDialect_psycopg2()
+        self.mysql_dialect = mysql.dialect()
+        self.mysql_dialect.ischema_names = dict(
+            self.mysql_dialect.ischema_names, JSON=mysql.JSON
+        )
+
+    def test_document_stored_as_json(self) -> None:
+        """
+        Tests that the column holds the document, rather than a JSON string
+        holding the document
+        """
+        for dialect in (self.pg_sql_dialect, self.mysql_dialect):
+            with self.subTest(dialect=dialect.name):
+                self.assertEqual(
+                    {'a': 1}, json.loads(self._bind({'a': 1}, dialect))
+                )
+
+    def test_string_escaped(self) -> None:
+        """
+        Tests that a string is written in an envelope, so that it is not
+        read as a row written before documents were stored as JSON
+        """
+        self.assertEqual(
+            {'$document': 'done'},
+            json.loads(self._bind('done', self.pg_sql_dialect))
+        )
+        self.assertEqual(
+            'done', self.json_type.process_result_value(
+                {'$document': 'done'}, self.pg_sql_dialect
+            )
+        )
+
+    def test_legacy_row(self) -> None:
+        """
+        Tests that a row holding its document as a JSON string is decoded
+        """
+        self.assertEqual(
+            {'a': 1}, self.json_type.process_result_value(
+                json.dumps({'a': 1}), self.pg_sql_dialect
+            )
+        )
+
+    def test_blob_reference(self) -> None:
+        """
+        Tests that a large document is replaced with a reference that the
+        database can read
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            json_type = JSON(blob_store=BlobStore(directory, 16))
+            document = {'results': [0.5] * 10}
+
+            value = json_type.process_bind_param(
+                document, self.pg_sql_dialect
+            )
+
+            self.assertEqual({'$blob'}, set(value))
+            self.assertEqual(
+                document,
+                json_type.process_result_value(value, self.pg_sql_dialect)
+            )
+
+    def _bind(self, value, dialect) -> str:
+        """
+
+        :param value: The value to write
+        :param dialect: The dialect to write it with
+        :return: The value sent to the database
+        """
+        return self.json_type.dialect_impl(dialect).bind_processor(
+            dialect
+        )(value)
@@ -0,0 +1,77 @@
+"""
+Contains unit tests for :mod:`topchef.database_engine`
+"""
+import unittest
+import unittest.mock as mock
+from sqlalchemy import create_engine, select
+from topchef.config import Config
+from topchef.database_engine import create_database_engine
+
+
+class TestCreateDatabaseEngine(unittest.TestCase):
+    """
+    Contains unit tests for making the database engine
+    """
+    def setUp(self) -> None:
+        self.config = Config({'DATABASE_URI': 'sqlite://', 'LOGFILE': ''})
+        self.engine_factory = mock.MagicMock(wraps=create_engine)
+
+    def test_sqlite_has_no_pool_parameters(self) -> None:
+        """
+        Tests that the pool size parameters are not given to SQLite, which
+        does not use a queued pool
+        """
+        create_database_engine(self.config, self.engine_factory)
+        self.assertEqual(
+            mock.call('sqlite://'), self.engine_factory.call_args
+        )
+
+    def test_pool_parameters(self) -> None:
+        """
+        Tests that the pool parameters are taken from the configuration
+        for databases other than SQLite
+        """
+        self.config.DATABASE_URI = 'postgresql://user@localhost/topchef'
+        self.config.DATABASE_POOL_SIZE = 20
+        self.config.DATABASE_POOL_PRE_PING = False
+
+        engine_factory = mock.MagicMock()
+        create_database_engine(self.config, engine_factory)
+
+        self.assertEqual(
+            mock.call(
+                self.config.DATABASE_URI,
+                pool_size=20,
+                max_overflow=self.config.DATABASE_MAX_OVERFLOW,
+                pool_timeout=self.config.DATABASE_POOL_TIMEOUT,
+                pool_recycle=self.config.DATABASE_POOL_RECYCLE
+            ),
+            engine_factory.call_args
+        )
+
+    def test_pre_ping(self) -> None:
+        """
+        Tests that connections are pinged when they are taken out of the
+        pool
+        """
+        engine = create_database_engine(self.config, self.engine_factory)
+        with mock.patch(
+                'topchef.database_engine.select', wraps=select
+        ) as ping:
+            with engine.connect():
+                pass
+        self.assertEqual(1, ping.call_count)
+
+    def test_no_pre_ping(self) -> None:
+        """
+        Tests that connections are not pinged if pinging is turned off
+        """
+        self.config.DATABASE_POOL_PRE_PING = False
+        engine = create_database_engine(self.config, self.engine_factory)
+        with mock.patch(
+                'topchef.database_engine.select', wraps=select
+        ) as ping:
+            with engine.connect():
+                pass
+        self.assertFalse(ping.called)
+
@@ -0,0 +1,175 @@
+"""
+Contains unit tests for :mod:`topchef.json_codec`
+"""
+import json
+import math
+import unittest
+import unittest.mock as mock
+from datetime import datetime
+from uuid import UUID
+from flask import Flask
+from flask import json as flask_json
+from hypothesis import given
+from hypothesis.strategies import dictionaries, floats, integers, lists
+from hypothesis.strategies import none, one_of, recursive, text
+from topchef.json_codec import OrjsonCodec, StandardLibraryCodec
+from topchef.json_codec import codec_named, jsonify
+
+JSON_VALUES = recursive(
+    one_of(none(), integers(), floats(allow_nan=False), text()),
+    lambda children: one_of(
+        lists(children), dictionaries(text(), children)
+    ),
+    max_leaves=20
+)
+
+
+class TestStandardLibraryCodec(unittest.TestCase):
+    """
+    Contains unit tests for the codec that uses the standard library
+    """
+    def setUp(self) -> None:
+        self.codec = StandardLibraryCodec()
+
+    @given(JSON_VALUES)
+    def test_round_trip(self, value) -> None:
+        """
+        Tests that decoding an encoded value returns the value
+
+        :param value: The value to encode
+        """
+        self.assertEqual(value, self.codec.loads(self.codec.dumps(value)))
+
+    def test_values_encoded_like_flask(self) -> None:
+        """
+        Tests that dates and UUIDs are encoded the same way as Flask's own
+        encoder encodes them
+        """
+        value = {
+            'date': datetime(2017, 1, 1, 12), 'id': UUID(int=1)
+        }
+        with Flask(__name__).app_context():
+            self.assertEqual(
+                json.loads(flask_json.dumps(value)),
+                self.codec.loads(self.codec.dumps(value))
+            )
+
+    def test_value_that_cannot_be_encoded(self) -> None:
+        """
+        Tests that encoding an arbitrary object raises ``TypeError``
+        """
+        with self.assertRaises(TypeError):
+            self.codec.dumps(object())
+
+
+class TestOrjsonCodec(unittest.TestCase):
+    """
+    Contains unit tests for the codec that uses orjson, with a fake orjson
+    module, so that the tests run whether or not orjson is installed
+    """
+    def setUp(self) -> None:
+        self.orjson = mock.MagicMock()
+        self.orjson.dumps.return_value = b'{}'
+        with mock.patch.dict('sys.modules', {'orjson': self.orjson}):
+            self.codec = OrjsonCodec()
+
+    def test_dumps(self) -> None:
+        """
+        Tests that orjson's bytes are returned as text
+        """
+        self.assertEqual('{}', self.codec.dumps({}))
+
+    def test_integer_too_large_for_orjson(self) -> None:
+        """
+        Tests that values that orjson cannot encode are encoded with the
+        standard library
+        """
+        self.orjson.dumps.side_effect = TypeError()
+        self.assertEqual('[18446744073709551616]', self.codec.dumps([2 ** 64]))
+
+    def test_non_finite_floats_encoded_with_standard_library(self) -> None:
+        """
+        Tests that ``NaN`` and infinite floats, which orjson writes as
+        ``null``, are written as the standard library writes them
+        """
+        self.orjson.dumps.return_value = b'{"a":[null,null,null]}'
+        value = {'a': [float('nan'), float('inf'), -float('inf')]}
+        self.assertEqual(
+            '{"a": [NaN, Infinity, -Infinity]}', self.codec.dumps(value)
+        )
+
+    def test_null_encoded_with_orjson(self) -> None:
+        self.orjson.dumps.return_value = b'{"a":null}'
+        self.assertEqual('{"a":null}', self.codec.dumps({'a': None}))
+
+    def test_non_finite_floats_decoded_with_standard_library(self) -> None:
+        """
+        Tests that documents that orjson rejects, because they hold the
+        tokens that the standard library writes for ``NaN`` and infinite
+        floats, are read with the standard library
+        """
+        self.orjson.loads.side_effect = ValueError()
+        value = self.codec.loads('{"a": [NaN, Infinity, -Infinity]}')
+        self.assertTrue(math.isnan(value['a'][0]))
+        self.assertEqual([float('inf'), -float('inf')], value['a'][1:])
+
+    def test_invalid_document(self) -> None:
+        self.orjson.loads.side_effect = ValueError()
+        with self.assertRaises(ValueError):
+            self.codec.loads('{')
+
+
+class TestCodecNamed(unittest.TestCase):
+    """
+    Contains unit tests for choosing a codec by name
+    """
+    def test_json(self) -> None:
+        self.assertIsInstance(codec_named('json'), StandardLibraryCodec)
+
+    def test_auto_without_orjson(self) -> None:
+        """
+        Tests that the standard library is used if orjson is not installed
+        """
+        with mock.patch.dict('sys.modules', {'orjson': None}):
+            self.assertIsInstance(codec_named('auto'), StandardLibraryCodec)
+
+    def test_auto_with_orjson(self) -> None:
+        """
+        Tests that orjson is used if it is installed
+        """
+        with mock.patch.dict('sys.modules', {'orjson': mock.MagicMock()}):
+            self.assertIsInstance(codec_named('auto'), OrjsonCodec)
+
+    def test_orjson_not_installed(self) -> None:
+        """
+        Tests that asking for orjson when it is not installed fails
+        """
+        with mock.patch.dict('sys.modules', {'orjson': None}):
+            with self.assertRaises(ImportError):
+                codec_named('orjson')
+
+    def test_unknown_codec(self) -> None:
+        with self.assertRaises(ValueError):
+            codec_named('yaml')
+
+
+class TestJsonify(unittest.TestCase):
+    """
+    Contains unit tests for making JSON responses
+    """
+    def test_dictionary(self) -> None:
+        response = jsonify({'data': [1, 2]})
+        self.assertEqual('application/json', response.mimetype)
+        self.assertEqual(
+            {'data': [1, 2]}, json.loads(response.data.decode('utf-8'))
+        )
+
+    def test_keyword_arguments(self) -> None:
+        response = jsonify(data=[1, 2])
+        self.assertEqual(
+            {'data': [1, 2]}, json.loads(response.data.decode('utf-8'))
+        )
+
+    def test_args_and_kwargs(self) -> None:
+        with self.assertRaises(TypeError):
+            jsonify({'data': 1}, data=2)
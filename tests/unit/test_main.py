@@ -3,7 +3,10 @@ Contains unit tests for :mod:`topchef.__main__`
 """
 import unittest
 import unittest.mock as mock
+from uuid import uuid4
 from flask import Flask
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table
+from sqlalchemy import create_engine, inspect
 from topchef.__main__ import TopchefManager
 from topchef.wsgi_app import DatabaseEngineFactory, WSGIAppFactory
 from topchef.database import DatabaseSchema
@@ -74,3 +77,204 @@ class TestCreateDB(TestMain):
             mock.call(bind=self.db_engine_factory.engine),
             self.database_schema.metadata.create_all.call_args
         )
+
+
+class TestUpgradeDB(TestMain):
+    """
+    Contains unit tests for the ``upgrade-db`` command
+    """
+    def setUp(self) -> None:
+        """
+        Create a mock schema with one table carrying two indexes, and a mock
+        inspector that reports only one of those indexes as present in the
+        database
+        """
+        TestMain.setUp(self)
+        self.existing_index = mock.MagicMock()
+        self.existing_index.name = 'ix_existing'
+        self.missing_index = mock.MagicMock()
+        self.missing_index.name = 'ix_missing'
+
+        self.table = mock.MagicMock()
+        self.table.name = 'jobs'
+        self.table.indexes = {self.existing_index, self.missing_index}
+
+        self.database_schema = mock.MagicMock(spec=DatabaseSchema)
+        self.database_schema.metadata.sorted_tables = [self.table]
+
+        self.inspector = mock.MagicMock()
+        self.inspector.get_indexes.return_value = [{'name': 'ix_existing'}]
+        self.inspector_factory = mock.MagicMock(return_value=self.inspector)
+
+        self.command = self.manager.UpgradeDB(
+            self.db_engine_factory, self.database_schema,
+            self.inspector_factory
+        )
+
+    def test_run_creates_missing_tables(self) -> None:
+        """
+        Tests that missing tables are created before indexes are checked
+        """
+        self.command.run()
+        self.assertEqual(
+            mock.call(bind=self.db_engine_factory.engine),
+            self.database_schema.metadata.create_all.call_args
+        )
+
+    def test_run_creates_only_missing_indexes(self) -> None:
+        """
+        Tests that indexes already present in the database are left alone,
+        and that missing ones are created
+        """
+        self.command.run()
+        self.assertEqual(
+            mock.call(self.table.name), self.inspector.get_indexes.call_args
+        )
+        self.assertEqual(
+            mock.call(bind=self.db_engine_factory.engine),
+            self.missing_index.create.call_args
+        )
+        self.assertFalse(self.existing_index.create.called)
+
+    def test_run_adds_missing_columns(self) -> None:
+        """
+        Tests that columns missing from a table created by an older version
+        are added, and that existing columns are left alone
+        """
+        engine = create_engine('sqlite://')
+        self.db_engine_factory.engine = engine
+        old_table = Table(
+            'jobs', MetaData(), Column('job_id', Integer, primary_key=True)
+        )
+        old_table.create(bind=engine)
+        self.table = Table(
+            'jobs', MetaData(), Column('job_id', Integer, primary_key=True),
+            Column('lease_expires_at', DateTime, nullable=True)
+        )
+        self.database_schema.metadata.sorted_tables = [self.table]
+
+        self.manager.UpgradeDB(
+            self.db_engine_factory, self.database_schema
+        ).run()
+
+        self.assertEqual(
+            ['job_id', 'lease_expires_at'],
+            [column['name'] for column in inspect(engine).get_columns('jobs')]
+        )
+
+
+class TestRepairJobCounters(TestMain):
+    """
+    Contains unit tests for the ``repair-job-counters`` command
+    """
+    def setUp(self) -> None:
+        """
+        Create the command with a mock repair function and session
+        """
+        TestMain.setUp(self)
+        self.repair = mock.MagicMock()
+        self.session = mock.MagicMock()
+        self.session_factory = mock.MagicMock(return_value=self.session)
+        self.command = self.manager.RepairJobCounters(
+            self.db_engine_factory, self.repair, self.session_factory
+        )
+
+    def test_run_commits_repair(self) -> None:
+        """
+        Tests that the counters are repaired and committed in a session
+        bound to the engine
+        """
+        self.command.run()
+        self.assertEqual(
+            mock.call(bind=self.db_engine_factory.engine),
+            self.session_factory.call_args
+        )
+        self.assertEqual(mock.call(self.session), self.repair.call_args)
+        self.assertTrue(self.session.commit.called)
+        self.assertTrue(self.session.close.called)
+
+    def test_run_rolls_back_on_error(self) -> None:
+        """
+        Tests that a failed repair is rolled back, and the error is raised
+        """
+        self.repair.side_effect = RuntimeError()
+        with self.assertRaises(RuntimeError):
+            self.command.run()
+        self.assertTrue(self.session.rollback.called)
+        self.assertFalse(self.session.commit.called)
+        self.assertTrue(self.session.close.called)
+
+
+class TestReapExpiredLeases(TestMain):
+    """
+    Contains unit tests for the ``reap-expired-leases`` command
+    """
+    def setUp(self) -> None:
+        """
+        Create the command with a mock reaping function and session
+        """
+        TestMain.setUp(self)
+        self.reap = mock.MagicMock()
+        self.session = mock.MagicMock()
+        self.session_factory = mock.MagicMock(return_value=self.session)
+        self.command = self.manager.ReapExpiredLeases(
+            self.db_engine_factory, self.reap, self.session_factory
+        )
+
+    def test_run_commits_reaped_jobs(self) -> None:
+        """
+        Tests that expired leases are reaped and committed in a session
+        bound to the engine
+        """
+        self.command.run()
+        self.assertEqual(mock.call(self.session), self.reap.call_args)
+        self.assertTrue(self.session.commit.called)
+        self.assertTrue(self.session.close.called)
+
+
+class TestDeleteService(TestMain):
+    """
+    Contains unit tests for the ``delete-service`` command
+    """
+    def setUp(self) -> None:
+        """
+        Create the command with mock deletion functions and session
+        """
+        TestMain.setUp(self)
+        self.service_id = uuid4()
+        self.delete_jobs = mock.MagicMock(side_effect=[2, 2, 1, 0])
+        self.delete = mock.MagicMock(return_value=True)
+        self.session = mock.MagicMock()
+        self.session_factory = mock.MagicMock(return_value=self.session)
+        self.command = self.manager.DeleteService(
+            self.db_engine_factory, self.delete_jobs, self.delete,
+            self.session_factory
+        )
+
+    def test_run_commits_each_chunk(self) -> None:
+        """
+        Tests that jobs are deleted a chunk at a time until none are left,
+        that each chunk is committed, and that the service is deleted last
+        """
+        self.command.run(self.service_id, 2)
+        self.assertEqual(
+            [mock.call(self.session, self.service_id, 2)] * 4,
+            self.delete_jobs.call_args_list
+        )
+        self.assertEqual(
+            mock.call(self.session, self.service_id), self.delete.call_args
+        )
+        self.assertEqual(4, self.session.commit.call_count)
+        self.assertTrue(self.session.close.called)
+
+    def test_run_rolls_back_on_error(self) -> None:
+        """
+        Tests that a failed chunk is rolled back, and that the chunks
+        committed before it stay deleted
+        """
+        self.delete_jobs.side_effect = [2, RuntimeError()]
+        with self.assertRaises(RuntimeError):
+            self.command.run(self.service_id, 2)
+        self.assertEqual(1, self.session.commit.call_count)
+        self.assertTrue(self.session.rollback.called)
+        self.assertFalse(self.delete.called)
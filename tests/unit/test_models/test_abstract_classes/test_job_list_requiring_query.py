@@ -2,6 +2,7 @@
 Contains unit tests for
 :mod:`topchef.models.abstract_classes.job_list_requiring_query`
 """
+import asyncio
 import unittest
 import unittest.mock as mock
 from topchef.models.abstract_classes import JobListFromQuery
@@ -155,7 +156,7 @@ class TestContains(TestJobListRequiringQuery):
             mock.call(id=job_id),
             self.root_query.filter_by.call_args
         )
-        self.assertTrue(self.root_query.filter_by().count.called)
+        self.assertTrue(self.root_query.filter_by().exists.called)
 
     def test_that_contains_can_check_membership_for_jobs(
             self
@@ -171,7 +172,7 @@ class TestContains(TestJobListRequiringQuery):
             mock.call(id=job.id),
             self.root_query.filter_by.call_args
         )
-        self.assertTrue(self.root_query.filter_by().count.called)
+        self.assertTrue(self.root_query.filter_by().exists.called)
 
 
 class TestIter(TestJobListRequiringQuery):
@@ -192,6 +193,27 @@ class TestIter(TestJobListRequiringQuery):
                 job.id, self.root_query.all()[0].id
             )
 
+    def test_iter_fetches_in_chunks(self) -> None:
+        """
+        Tests that the jobs are fetched with ``yield_per``, and that jobs
+        without unflushed changes are removed from the session after each
+        chunk
+        """
+        database_jobs = [mock.MagicMock() for _ in range(5)]
+        self.root_query.yield_per.return_value = iter(database_jobs)
+        self.session.is_modified.side_effect = \
+            lambda database_job: database_job is database_jobs[0]
+
+        with mock.patch.object(self.job_list, '_ITERATION_CHUNK_SIZE', 2):
+            jobs = list(self.job_list)
+
+        self.assertEqual(5, len(jobs))
+        self.assertEqual(mock.call(2), self.root_query.yield_per.call_args)
+        self.assertEqual(
+            [mock.call(database_job) for database_job in database_jobs[1:4]],
+            self.session.expunge.call_args_list
+        )
+
 
 class TestAsyncIter(TestJobListRequiringQuery):
     """
@@ -205,8 +227,12 @@ class TestAsyncIter(TestJobListRequiringQuery):
         async_job_iterable = self.job_list.__aiter__()
         self.assertTrue(hasattr(async_job_iterable, '__anext__'))
 
-        job = async_job_iterable.__anext__()
-        self.assertIsNotNone(job)
+        job = mock.MagicMock(spec=Job)
+        with mock.patch.object(self.job_list, '_page', return_value=[job]):
+            result = asyncio.get_event_loop().run_until_complete(
+                async_job_iterable.__anext__()
+            )
+        self.assertEqual(job, result)
 
 
 class TestLen(TestJobListRequiringQuery):
@@ -231,3 +257,195 @@ class TestLen(TestJobListRequiringQuery):
         """
         self.root_query.count = mock.MagicMock(return_value=length)
         self.assertEqual(length, len(self.job_list))
+
+
+class TestPage(TestJobListRequiringQuery):
+    """
+    Contains unit tests for the ``page`` method
+    """
+    @given(integers(min_value=1, max_value=100))
+    def test_first_page(self, limit: int) -> None:
+        """
+        Tests that the first page is not filtered, and is limited in the
+        query
+
+        :param limit: The size of the page
+        """
+        self.job_list.page(limit)
+        self.assertFalse(self.root_query.filter.called)
+        self.assertEqual(
+            mock.call(limit), self.root_query.order_by().limit.call_args
+        )
+
+    @given(integers(min_value=1, max_value=100), uuids())
+    def test_next_page(self, limit: int, job_id: UUID) -> None:
+        """
+        Tests that the jobs after the cursor are selected by a filter
+
+        :param limit: The size of the page
+        :param job_id: The ID of the last job on the previous page
+        """
+        after = (mock.MagicMock(), job_id)
+        self.job_list.page(limit, after=after)
+        self.assertTrue(self.root_query.filter.called)
+        self.assertEqual(
+            mock.call(limit),
+            self.root_query.filter().order_by().limit.call_args
+        )
+
+
+class TestRegisteredJobs(TestJobListRequiringQuery):
+    """
+    Contains unit tests for the ``registered_jobs`` method
+    """
+    @given(integers(min_value=1, max_value=100))
+    def test_limit_is_applied_in_query(self, limit: int) -> None:
+        """
+        Tests that the limit is sent to the database, rather than being
+        applied after all jobs are loaded
+
+        :param limit: The number of jobs to request
+        """
+        queue_query = self.root_query.filter().order_by()
+        queue_query.limit().all.return_value = [
+            mock.MagicMock() for _ in range(limit)
+        ]
+
+        jobs = self.job_list.registered_jobs(limit)
+
+        self.assertEqual(mock.call(limit), queue_query.limit.call_args)
+        self.assertEqual(limit, len(jobs))
+        self.assertFalse(self.root_query.all.called)
+
+
+class TestClaimNextJob(TestJobListRequiringQuery):
+    """
+    Contains unit tests for the ``claim_next_job`` method, which atomically
+    takes the next registered job off the queue
+    """
+    def setUp(self) -> None:
+        TestJobListRequiringQuery.setUp(self)
+        self.session.get_bind().dialect.name = 'sqlite'
+        self.candidate_query = self.root_query.filter().order_by()
+        self.update = self.session.query().filter().update
+
+    def test_no_registered_jobs(self) -> None:
+        """
+        Tests that ``None`` is returned if there is nothing to claim
+        """
+        self.candidate_query.with_entities().first.return_value = None
+        self.assertIsNone(self.job_list.claim_next_job())
+        self.assertFalse(self.update.called)
+
+    @given(uuids())
+    def test_compare_and_swap_succeeds(self, job_id: UUID) -> None:
+        """
+        Tests that the job is returned if the guarded ``UPDATE`` claimed it
+
+        :param job_id: The ID of the job to claim
+        """
+        self.candidate_query.with_entities().first.return_value = (job_id,)
+        self.update.return_value = 1
+
+        job = self.job_list.claim_next_job()
+
+        self.assertIsInstance(job, Job)
+        self.assertEqual(
+            mock.call(job_id),
+            self.session.query().populate_existing().get.call_args
+        )
+
+    def test_compare_and_swap_always_loses(self) -> None:
+        """
+        Tests that claiming gives up if every candidate job is claimed by
+        someone else before the ``UPDATE`` runs
+        """
+        self.candidate_query.with_entities().first.return_value = (
+            mock.MagicMock(spec=UUID),
+        )
+        self.update.return_value = 0
+
+        self.assertIsNone(self.job_list.claim_next_job())
+        self.assertEqual(
+            self.job_list._MAXIMUM_CLAIM_ATTEMPTS, self.update.call_count
+        )
+
+    def test_row_lock(self) -> None:
+        """
+        Tests that on PostgreSQL, the next job is locked with
+        ``FOR UPDATE SKIP LOCKED`` and set to ``WORKING``
+        """
+        self.session.get_bind().dialect.name = 'postgresql'
+        locked_query = self.candidate_query.with_for_update
+        database_job = locked_query().populate_existing().first()
+
+        job = self.job_list.claim_next_job()
+
+        self.assertEqual(
+            mock.call(skip_locked=True), locked_query.call_args
+        )
+        self.assertEqual(DatabaseJobStatus.WORKING, database_job.status)
+        self.assertEqual(job.id, database_job.id)
+
+
+class TestClaimNextJobs(TestJobListRequiringQuery):
+    """
+    Contains unit tests for the ``claim_next_jobs`` method, which claims a
+    batch of jobs at once
+    """
+    def setUp(self) -> None:
+        TestJobListRequiringQuery.setUp(self)
+        self.session.get_bind().dialect.name = 'sqlite'
+        self.candidate_query = self.root_query.filter().order_by()
+        self.update = self.session.query().filter().update
+        self.locked_ids = self.candidate_query.with_entities(
+        ).with_for_update().limit().all
+
+    def test_nothing_to_claim(self) -> None:
+        """
+        Tests that nothing is claimed if the first job cannot be claimed
+        """
+        self.candidate_query.with_entities().first.return_value = None
+        self.assertEqual([], self.job_list.claim_next_jobs(10))
+        self.assertFalse(self.update.called)
+
+    @given(uuids(), uuids())
+    def test_rest_of_batch_claimed_in_one_update(
+            self, first_job_id: UUID, second_job_id: UUID
+    ) -> None:
+        """
+        Tests that after the first job is claimed, the rest of the jobs
+        are claimed with one more ``UPDATE``
+
+        :param first_job_id: The ID of the first job to claim
+        :param second_job_id: The ID of the second job to claim
+        """
+        self.update.reset_mock()
+        self.update.return_value = 1
+        self.candidate_query.with_entities().first.return_value = (
+            first_job_id,
+        )
+        self.locked_ids.return_value = [(second_job_id,)]
+        self.session.query().filter().order_by(
+        ).populate_existing().all.return_value = [mock.MagicMock()]
+
+        jobs = self.job_list.claim_next_jobs(2)
+
+        self.assertEqual(2, len(jobs))
+        self.assertEqual(2, self.update.call_count)
+
+    def test_row_lock(self) -> None:
+        """
+        Tests that on PostgreSQL, the jobs are selected with
+        ``FOR UPDATE SKIP LOCKED``, and claimed with one ``UPDATE``
+        """
+        self.session.get_bind().dialect.name = 'postgresql'
+        self.locked_ids.return_value = [(mock.MagicMock(spec=UUID),)]
+
+        self.job_list.claim_next_jobs(10)
+
+        self.assertEqual(
+            mock.call(skip_locked=True),
+            self.candidate_query.with_entities().with_for_update.call_args
+        )
+        self.assertEqual(1, self.update.call_count)
@@ -0,0 +1,101 @@
+"""
+Contains unit tests for :mod:`topchef.models.async_chunk_iterator`
+"""
+import asyncio
+import unittest
+import unittest.mock as mock
+from concurrent.futures import ThreadPoolExecutor
+from threading import current_thread
+from typing import List, Optional
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from topchef.models.async_chunk_iterator import AsyncChunkIterator
+from topchef.models.async_chunk_iterator import SQLITE_EXECUTOR
+
+
+class TestAsyncChunkIterator(unittest.TestCase):
+    """
+    Contains unit tests for the asynchronous chunk iterator
+    """
+    def setUp(self) -> None:
+        self.bind = mock.MagicMock(spec=Engine)  # type: Engine
+        self.bind.dialect = mock.MagicMock()
+        self.bind.dialect.name = 'postgresql'
+        self.items = list(range(5))
+        self.chunks_read = []  # type: List[Optional[int]]
+        self.reading_threads = set()
+        self.reading_sessions = []  # type: List[Session]
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def tearDown(self) -> None:
+        self.executor.shutdown()
+
+    def read_chunk(
+            self, session: Session, last_item: Optional[int]
+    ) -> List[int]:
+        """
+
+        :param session: The session in which the chunk is read
+        :param last_item: The last item of the previous chunk
+        :return: The next two items
+        """
+        self.chunks_read.append(last_item)
+        self.reading_threads.add(current_thread())
+        self.reading_sessions.append(session)
+        start = 0 if last_item is None else last_item + 1
+        return self.items[start:start + 2]
+
+    def iterate(self) -> List[int]:
+        """
+
+        :return: All the items, read through an asynchronous chunk iterator
+        """
+        async def collect() -> List[int]:
+            return [item async for item in AsyncChunkIterator(
+                self.bind, self.read_chunk, 2, executor=self.executor
+            )]
+        return asyncio.get_event_loop().run_until_complete(collect())
+
+    def test_items_are_read_in_chunks(self) -> None:
+        """
+        Tests that every item is returned once, in order, and that each
+        chunk starts after the last item of the chunk before it
+        """
+        self.assertEqual(self.items, self.iterate())
+        self.assertEqual([None, 1, 3], self.chunks_read)
+
+    def test_full_last_chunk(self) -> None:
+        """
+        Tests that iteration stops after an empty chunk, if the last chunk
+        was full
+        """
+        self.items = list(range(4))
+        self.assertEqual(self.items, self.iterate())
+        self.assertEqual([None, 1, 3], self.chunks_read)
+
+    def test_chunks_are_read_in_executor(self) -> None:
+        """
+        Tests that chunks are not read in the event loop's thread
+        """
+        self.iterate()
+        self.assertNotIn(current_thread(), self.reading_threads)
+
+    def test_chunks_are_read_in_own_sessions(self) -> None:
+        """
+        Tests that each chunk is read in a new session on the engine
+        """
+        self.iterate()
+        self.assertEqual(
+            len(self.chunks_read), len(set(map(id, self.reading_sessions)))
+        )
+        for session in self.reading_sessions:
+            self.assertIs(self.bind, session.bind)
+
+    def test_sqlite_executor(self) -> None:
+        """
+        Tests that SQLite databases are read by the executor with a single
+        thread, so that their connections stay in that thread
+        """
+        self.bind.dialect.name = 'sqlite'
+        iterator = AsyncChunkIterator(self.bind, self.read_chunk, 2)
+        self.assertIs(SQLITE_EXECUTOR, iterator._executor)
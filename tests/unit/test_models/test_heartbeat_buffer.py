@@ -0,0 +1,113 @@
+"""
+Contains unit tests for :mod:`topchef.models.heartbeat_buffer`
+"""
+import unittest
+import unittest.mock as mock
+from datetime import datetime, timedelta
+from uuid import uuid4
+from sqlalchemy.orm import Session
+from topchef.models.heartbeat_buffer import HeartbeatBuffer, HeartbeatWriter
+
+
+class TestHeartbeatBuffer(unittest.TestCase):
+    """
+    Contains unit tests for the heartbeat buffer
+    """
+    def setUp(self) -> None:
+        self.write = mock.MagicMock()
+        self.buffer = HeartbeatBuffer(self.write)
+        self.service_id = uuid4()
+        self.date = datetime(2017, 8, 15, 18, 29, 7)
+
+    def test_record_keeps_latest_check_in(self) -> None:
+        """
+        Tests that an older check in does not replace a newer one
+        """
+        self.buffer.record(self.service_id, self.date)
+        self.buffer.record(self.service_id, self.date - timedelta(seconds=1))
+        self.assertEqual(
+            self.date, self.buffer.last_checked_in(self.service_id)
+        )
+
+    def test_write_batches_check_ins(self) -> None:
+        """
+        Tests that the check ins of every service are written in one call,
+        and are forgotten once the write is committed
+        """
+        other_service_id = uuid4()
+        self.buffer.record(self.service_id, self.date)
+        self.buffer.record(other_service_id, self.date)
+        session = Session()
+
+        self.assertEqual(2, self.buffer.write(session))
+        self.assertEqual(
+            mock.call(session, {
+                self.service_id: self.date, other_service_id: self.date
+            }),
+            self.write.call_args
+        )
+        self.assertEqual(
+            self.date, self.buffer.last_checked_in(self.service_id)
+        )
+
+        session.commit()
+        self.assertIsNone(self.buffer.last_checked_in(self.service_id))
+
+    def test_check_ins_kept_after_rollback(self) -> None:
+        """
+        Tests that check ins whose write was rolled back are written again
+        """
+        self.buffer.record(self.service_id, self.date)
+        session = Session()
+        self.buffer.write(session)
+        session.rollback()
+
+        self.assertEqual(
+            self.date, self.buffer.last_checked_in(self.service_id)
+        )
+        self.assertEqual(1, self.buffer.write(session))
+
+    def test_newer_check_in_kept_after_commit(self) -> None:
+        """
+        Tests that a check in recorded while an older one is being written
+        is not forgotten when the older one is committed
+        """
+        newer_date = self.date + timedelta(seconds=1)
+        self.buffer.record(self.service_id, self.date)
+        session = Session()
+        self.buffer.write(session)
+        self.buffer.record(self.service_id, newer_date)
+        session.commit()
+
+        self.assertEqual(
+            newer_date, self.buffer.last_checked_in(self.service_id)
+        )
+
+    def test_empty_buffer_not_written(self) -> None:
+        """
+        Tests that nothing is written if no service has checked in
+        """
+        self.assertEqual(0, self.buffer.write(Session()))
+        self.assertFalse(self.write.called)
+
+
+class TestHeartbeatWriter(unittest.TestCase):
+    """
+    Contains unit tests for the thread writing buffered check ins
+    """
+    def test_sweep_writes_and_commits(self) -> None:
+        """
+        Tests that each run writes the buffer in a new session, and commits
+        """
+        session = mock.MagicMock(spec=Session)
+        heartbeat_buffer = mock.MagicMock(spec=HeartbeatBuffer)
+        writer = HeartbeatWriter(
+            mock.MagicMock(return_value=session), 5, heartbeat_buffer
+        )
+
+        writer.sweep()
+
+        self.assertEqual(
+            mock.call(session), heartbeat_buffer.write.call_args
+        )
+        self.assertTrue(session.commit.called)
@@ -0,0 +1,64 @@
+"""
+Contains unit tests for :class:`topchef.models.JobList.Filter`
+"""
+import unittest
+import unittest.mock as mock
+from topchef.models import Job, JobList
+
+
+class TestMatches(unittest.TestCase):
+    """
+    Contains unit tests for checking whether a job matches a filter
+    """
+    def setUp(self) -> None:
+        self.job = mock.MagicMock(spec=Job)
+        self.job.parameters = {
+            'pulse_time': 15, 'name': 'RABI', 'enabled': True,
+            'sweep': [{'frequency': 2.8e9}], 'offset': None
+        }
+        self.job.results = None
+
+    def test_comparisons(self) -> None:
+        for operator, value, expected_match in [
+            ('>', 10, True), ('>', 15, False), ('>=', 15, True),
+            ('<', 15.5, True), ('<=', 14, False), ('=', 15.0, True),
+            ('!=', 15, False)
+        ]:
+            with self.subTest(operator=operator, value=value):
+                self.assertEqual(expected_match, JobList.Filter(
+                    'parameters', ('pulse_time',), operator, value
+                ).matches(self.job))
+
+    def test_nested_value(self) -> None:
+        self.assertTrue(JobList.Filter(
+            'parameters', ('sweep', 0, 'frequency'), '>', 1e9
+        ).matches(self.job))
+
+    def test_null(self) -> None:
+        self.assertTrue(JobList.Filter(
+            'parameters', ('offset',), '=', None
+        ).matches(self.job))
+
+    def test_other_type_never_matches(self) -> None:
+        """
+        Tests that values are only compared with values of the same JSON
+        type. In particular, booleans are not numbers
+        """
+        for path, value in [
+            (('name',), 1), (('pulse_time',), '15'), (('enabled',), 1),
+            (('offset',), 'null')
+        ]:
+            with self.subTest(path=path):
+                self.assertFalse(JobList.Filter(
+                    'parameters', path, '!=', value
+                ).matches(self.job))
+
+    def test_missing_path_never_matches(self) -> None:
+        for document, path in [
+            ('parameters', ('missing',)), ('parameters', ('sweep', 1)),
+            ('parameters', ('name', 'first')), ('results', ('value',))
+        ]:
+            with self.subTest(document=document, path=path):
+                self.assertFalse(JobList.Filter(
+                    document, path, '!=', 0
+                ).matches(self.job))
@@ -0,0 +1,110 @@
+"""
+Contains unit tests for :mod:`topchef.models.job_notifier`
+"""
+import unittest
+from threading import Thread
+from uuid import uuid4
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from topchef.models.job_notifier import JobNotifier
+
+
+class TestJobNotifier(unittest.TestCase):
+    """
+    Contains unit tests for the job notifier
+    """
+    def setUp(self) -> None:
+        self.notifier = JobNotifier()
+        self.service_id = uuid4()
+
+    def test_notify_increments_generation(self) -> None:
+        """
+        Tests that announcing a job changes the generation of only that
+        service
+        """
+        other_service_id = uuid4()
+        generation = self.notifier.generation(self.service_id)
+        other_generation = self.notifier.generation(other_service_id)
+        self.notifier.notify(self.service_id)
+        self.assertEqual(1, self.notifier.generation(self.service_id).count)
+        self.assertEqual(0, self.notifier.generation(other_service_id).count)
+        self.assertTrue(self.notifier.wait(self.service_id, generation, 0))
+        self.assertFalse(
+            self.notifier.wait(other_service_id, other_generation, 0)
+        )
+
+    def test_counters_are_dropped_after_waiting(self) -> None:
+        """
+        Tests that a service's counter is thrown away once nobody holds a
+        generation read from it, and that announcing a job for a service
+        that nobody waits for does not keep a counter
+        """
+        generation = self.notifier.generation(self.service_id)
+        self.notifier.wait(self.service_id, generation, 0)
+        del generation
+        self.notifier.notify(uuid4())
+        self.assertEqual(0, len(self.notifier._announcements))
+
+    def test_wait_times_out(self) -> None:
+        """
+        Tests that waiting without any announcement returns ``False``
+        """
+        self.assertFalse(self.notifier.wait(
+            self.service_id, self.notifier.generation(self.service_id), 0.01
+        ))
+
+    def test_wait_returns_if_job_was_missed(self) -> None:
+        """
+        Tests that a job announced between reading the generation and
+        waiting is not slept through
+        """
+        generation = self.notifier.generation(self.service_id)
+        self.notifier.notify(self.service_id)
+        self.assertTrue(self.notifier.wait(self.service_id, generation, 10))
+
+    def test_wait_is_woken_by_another_thread(self) -> None:
+        """
+        Tests that a waiting thread is woken up by an announcement from
+        another thread
+        """
+        generation = self.notifier.generation(self.service_id)
+        results = []
+        waiter = Thread(target=lambda: results.append(
+            self.notifier.wait(self.service_id, generation, 10)
+        ))
+        waiter.start()
+        self.notifier.notify(self.service_id)
+        waiter.join(10)
+        self.assertEqual([True], results)
+
+    def test_notify_after_commit(self) -> None:
+        """
+        Tests that a job is announced once the session is committed, and
+        only once
+        """
+        generation = self.notifier.generation(self.service_id)
+        session = Session()
+        self.notifier.notify_after_commit(session, self.service_id)
+        self.assertEqual(0, self.notifier.generation(self.service_id).count)
+
+        session.commit()
+        self.assertEqual(1, self.notifier.generation(self.service_id).count)
+
+        session.commit()
+        self.assertEqual(1, generation.announcements.count)
+
+    def test_notify_after_commit_with_registry(self) -> None:
+        """
+        Tests that a job added through a registry of sessions is announced
+        when the registry's current session commits, and not when some
+        other session from the same registry commits
+        """
+        generation = self.notifier.generation(self.service_id)
+        registry = scoped_session(sessionmaker())
+        self.notifier.notify_after_commit(registry, self.service_id)
+
+        other_session = registry.session_factory()
+        other_session.commit()
+        self.assertEqual(0, generation.announcements.count)
+
+        registry.commit()
+        self.assertEqual(1, generation.announcements.count)
@@ -0,0 +1,62 @@
+"""
+Contains unit tests for :mod:`topchef.models.lease_reaper`
+"""
+import unittest
+import unittest.mock as mock
+from uuid import uuid4
+from sqlalchemy.orm import Session
+from topchef.models.job_notifier import JobNotifier
+from topchef.models.lease_reaper import LeaseReaper
+
+
+class TestLeaseReaper(unittest.TestCase):
+    """
+    Contains unit tests for the lease reaper
+    """
+    def setUp(self) -> None:
+        self.session = mock.MagicMock(spec=Session)
+        self.session_factory = mock.MagicMock(return_value=self.session)
+        self.job_notifier = mock.MagicMock(spec=JobNotifier)
+        self.service_id = uuid4()
+        self.reap = mock.MagicMock(return_value={self.service_id: 2})
+        self.reaper = LeaseReaper(
+            self.session_factory, 0.01, self.job_notifier, self.reap
+        )
+
+    def test_sweep(self) -> None:
+        """
+        Tests that a sweep reaps in a new session, commits, and wakes the
+        workers waiting for the reaped jobs
+        """
+        self.assertEqual(2, self.reaper.sweep())
+        self.assertEqual(mock.call(self.session), self.reap.call_args)
+        self.assertEqual(
+            mock.call(self.session, self.service_id),
+            self.job_notifier.notify_after_commit.call_args
+        )
+        self.assertTrue(self.session.commit.called)
+        self.assertTrue(self.session.close.called)
+
+    def test_sweep_rolls_back_on_error(self) -> None:
+        """
+        Tests that a failed sweep is rolled back, and the error is raised
+        """
+        self.reap.side_effect = RuntimeError()
+        with self.assertRaises(RuntimeError):
+            self.reaper.sweep()
+        self.assertTrue(self.session.rollback.called)
+        self.assertFalse(self.session.commit.called)
+        self.assertTrue(self.session.close.called)
+
+    def test_run_survives_failed_sweeps(self) -> None:
+        """
+        Tests that the thread keeps sweeping after a sweep fails, and stops
+        when asked to
+        """
+        self.reap.side_effect = RuntimeError()
+        self.reaper.start()
+        while self.reap.call_count < 2:
+            self.reaper.join(0.01)
+        self.reaper.stop()
+        self.reaper.join(10)
+        self.assertFalse(self.reaper.is_alive())
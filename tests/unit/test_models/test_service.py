@@ -6,11 +6,14 @@ import unittest.mock as mock
 from freezegun import freeze_time
 from datetime import timedelta, datetime
 from topchef.models.service import Service
+from topchef.models.heartbeat_buffer import HeartbeatBuffer
+from topchef.models.job_notifier import JobNotifier
 from sqlalchemy.orm import Session
 from topchef.database.models import Service as DatabaseService
 from topchef.models import JobList as JobListInterface
 from hypothesis.strategies import text, booleans, dictionaries, composite
-from hypothesis.strategies import timedeltas
+from hypothesis.strategies import timedeltas, lists
+from typing import List
 from hypothesis import given, assume, settings
 from tests.unit.database_model_generators import services as service_generator
 
@@ -24,9 +27,13 @@ class TestService(unittest.TestCase):
             spec=DatabaseService
         )  # type: DatabaseService
 
+        self.database_service.last_checked_in = datetime(2017, 1, 1)
+
         self.session_getter = mock.MagicMock(spec=Session.object_session)
+        self.heartbeat_buffer = HeartbeatBuffer()
         self.service = Service(self.database_service,
-                               session_getter_for_model=self.session_getter)
+                               session_getter_for_model=self.session_getter,
+                               heartbeat_buffer=self.heartbeat_buffer)
 
     @staticmethod
     @composite
@@ -193,6 +200,50 @@ class TestHasTimedOut(TestService):
         ):  # ZA WARUDO!
             self.assertFalse(self.service.has_timed_out)
 
+    def test_check_in_is_buffered(self) -> None:
+        """
+        Tests that checking in does not write to the database model, and
+        that the buffered check in resets the timeout
+        """
+        self.service.timeout = timedelta(seconds=30)
+        self.service.check_in()
+
+        self.assertEqual(
+            datetime(2017, 1, 1), self.database_service.last_checked_in
+        )
+        self.assertIsNotNone(
+            self.heartbeat_buffer.last_checked_in(self.service.id)
+        )
+        self.assertFalse(self.service.has_timed_out)
+
+    def test_check_in_without_buffer(self) -> None:
+        """
+        Tests that if the heartbeat buffer is turned off, checking in
+        writes to the database model, and leaves the buffer empty
+        """
+        heartbeat_buffer = HeartbeatBuffer(is_enabled=False)
+        self.service = Service(
+            self.database_service,
+            session_getter_for_model=self.session_getter,
+            heartbeat_buffer=heartbeat_buffer
+        )
+        self.service.check_in()
+
+        self.assertGreater(
+            self.database_service.last_checked_in, datetime(2017, 1, 1)
+        )
+        self.assertIsNone(heartbeat_buffer.last_checked_in(self.service.id))
+
+    def test_later_check_in_from_database(self) -> None:
+        """
+        Tests that a check in written by another process counts, if it is
+        later than the buffered one
+        """
+        self.service.timeout = timedelta(seconds=30)
+        self.heartbeat_buffer.record(self.service.id, datetime(2017, 1, 1))
+        self.database_service.last_checked_in = datetime.utcnow()
+        self.assertFalse(self.service.has_timed_out)
+
     @staticmethod
     def _target_time_in_range(
             base: datetime, timeout: timedelta, time_to_wait: timedelta
@@ -259,6 +310,12 @@ class TestNewJob(TestService):
         TestService.setUp(self)
         self.job_constructor = mock.MagicMock(spec=type)
         self.job_constructor.new = mock.MagicMock()
+        self.job_notifier = mock.MagicMock(spec=JobNotifier)
+        self.service = Service(
+            self.database_service,
+            session_getter_for_model=self.session_getter,
+            job_notifier=self.job_notifier
+        )
 
     @given(dictionaries(text(), text()))
     def test_creating_a_new_job(self, parameters: dict) -> None:
@@ -268,6 +325,51 @@ class TestNewJob(TestService):
             self.job_constructor(self.service.db_model, parameters)
         )
 
+    @given(dictionaries(text(), text()))
+    def test_new_job_is_announced(self, parameters: dict) -> None:
+        """
+        Tests that waiters are told about the new job once the session that
+        added it is committed
+
+        :param parameters: The job parameters
+        """
+        self.service.new_job(parameters, self.job_constructor)
+        self.assertEqual(
+            mock.call(
+                self.session_getter(self.database_service),
+                self.database_service.id
+            ),
+            self.job_notifier.notify_after_commit.call_args
+        )
+
+
+class TestNewJobs(TestNewJob):
+    """
+    Contains unit tests for creating several jobs at once
+    """
+    @given(lists(dictionaries(text(), text())))
+    def test_new_jobs_are_inserted_at_once(
+            self, parameter_sets: List[dict]
+    ) -> None:
+        """
+        Tests that all the jobs are written with one bulk insert, and that
+        one ID is returned for each job
+
+        :param parameter_sets: The parameters of the new jobs
+        """
+        session = self.session_getter(self.database_service)
+        session.bulk_insert_mappings.reset_mock()
+
+        job_ids = self.service.new_jobs(parameter_sets)
+
+        self.assertEqual(len(parameter_sets), len(job_ids))
+        self.assertEqual(1, session.bulk_insert_mappings.call_count)
+        rows = session.bulk_insert_mappings.call_args[0][1]
+        self.assertEqual(
+            parameter_sets, [row['parameters'] for row in rows]
+        )
+        self.assertEqual(job_ids, [row['id'] for row in rows])
+
 
 class TestJobs(TestService):
     """
@@ -24,6 +24,7 @@ class TestServiceList(TestCase):
         session for testing
         """
         self.db_session = MagicMock(spec=Session)  # type: Session
+        self.db_session.identity_map.get.return_value = None
         self.service_list = ServiceList(self.db_session)
         self.service_id = MagicMock(spec=UUID)  # type: UUID
 
@@ -49,6 +50,19 @@ class TestGetItem(TestServiceList):
         )
 
 
+    def test_getitem_loaded_service(self) -> None:
+        """
+        Tests that a service that is already in the session is not queried
+        """
+        loaded_service = MagicMock(spec=DatabaseService)
+        self.db_session.identity_map.get.return_value = loaded_service
+
+        self.assertEqual(
+            Service(loaded_service), self.service_list[self.service_id]
+        )
+        self.assertFalse(self.db_session.query.called)
+
+
 class TestSetItem(TestServiceList):
     """
     Contains unit tests for the services setter
@@ -81,26 +95,45 @@ class TestSetItem(TestServiceList):
 
 
 class TestDelItem(TestServiceList):
+    """
+    Contains unit tests for deleting a service with set-based ``DELETE``
+    statements
+    """
     def setUp(self):
         TestServiceList.setUp(self)
+        self.db_service = MagicMock(spec=DatabaseService)
+        self.db_service.id = self.service_id
         self.job = MagicMock(spec=DatabaseJob)
+        self.job.service_id = self.service_id
+        self.other_job = MagicMock(spec=DatabaseJob)
 
-        self.db_model.jobs = [self.job]
+        self.db_session.identity_map.values.return_value = [
+            self.db_service, self.job, self.other_job
+        ]
 
-    def test_delitem_service_deleted(self):
+    def test_delitem_does_not_load_jobs(self):
         del self.service_list[self.service_id]
-        self.assertEqual(
-            call(self.db_model),
-            self.db_session.delete.call_args
-        )
+        self.assertTrue(self.db_session.flush.called)
+        self.assertFalse(self.db_session.delete.called)
+        self.assertEqual(3, self.db_session.execute.call_count)
+
+    def test_delitem_leaves_transaction_to_caller(self):
+        del self.service_list[self.service_id]
+        self.assertFalse(self.db_session.commit.called)
 
-    def test_delitem_job_deleted(self):
+    def test_delitem_loaded_objects_expunged(self):
         del self.service_list[self.service_id]
-        self.assertIn(
-            call(self.job),
-            self.db_session.delete.call_args_list
+        self.assertEqual(
+            [call(self.db_service), call(self.job)],
+            self.db_session.expunge.call_args_list
         )
 
+    def test_delitem_missing_service(self):
+        self.db_session.execute.return_value.rowcount = 0
+        with self.assertRaises(KeyError):
+            del self.service_list[self.service_id]
+        self.assertFalse(self.db_session.expunge.called)
+
 
 class TestContains(TestServiceList):
     def setUp(self):
@@ -113,6 +146,11 @@ class TestContains(TestServiceList):
     def test_contains_service(self):
         self.assertIn(self.service, self.service_list)
 
+    def test_contains_queries_exists(self):
+        self.db_session.query.return_value.scalar.return_value = False
+        self.assertNotIn(self.service_id, self.service_list)
+        self.assertFalse(self.db_session.query.return_value.count.called)
+
 
 class TestLen(TestServiceList):
     def test_len(self):
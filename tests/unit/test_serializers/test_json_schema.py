@@ -132,6 +132,73 @@ class TestDump(TestJSONSchema):
         )
 
 
+class TestDumpCache(TestJSONSchema):
+    """
+    Contains unit tests for caching the JSON schemas made by
+    :meth:`topchef.serializers.json_schema.JSONSchema.dump`
+    """
+    def setUp(self) -> None:
+        """
+        Have the mock marshmallow-jsonschema serializer return a schema
+        """
+        TestJSONSchema.setUp(self)
+        self.marshmallow_jsonschema.dump.return_value.data = {
+            'type': 'object', 'properties': {'data': {'type': 'string'}}
+        }
+
+    def test_schema_is_reflected_once(self) -> None:
+        """
+        Tests that a schema class is only reflected once by serializers
+        with the same title and description
+        """
+        for _ in range(2):
+            serializer = JSONSchema(
+                title='Title', description='Description',
+                json_schema_serializer=self.marshmallow_jsonschema
+            )
+            serializer.dump(self.UnitTestingSchema())
+        self.assertEqual(1, self.marshmallow_jsonschema.dump.call_count)
+
+    def test_title_is_not_shared(self) -> None:
+        """
+        Tests that a serializer with a different title does not get the
+        cached schema for another title
+        """
+        first_result = JSONSchema(
+            title='First', json_schema_serializer=self.marshmallow_jsonschema
+        ).dump(self.UnitTestingSchema())
+        second_result = JSONSchema(
+            title='Second', json_schema_serializer=self.marshmallow_jsonschema
+        ).dump(self.UnitTestingSchema())
+        self.assertEqual('First', first_result['title'])
+        self.assertEqual('Second', second_result['title'])
+
+    def test_many_is_reflected_separately(self) -> None:
+        """
+        Tests that dumping a list schema does not return the cached schema
+        for a single object
+        """
+        serializer = JSONSchema(
+            json_schema_serializer=self.marshmallow_jsonschema
+        )
+        serializer.dump(self.UnitTestingSchema())
+        serializer.dump(self.UnitTestingSchema(), many=True)
+        self.assertEqual(2, self.marshmallow_jsonschema.dump.call_count)
+
+    def test_dumps_are_copies(self) -> None:
+        """
+        Tests that modifying a dumped schema does not modify the next one
+        """
+        serializer = JSONSchema(
+            json_schema_serializer=self.marshmallow_jsonschema
+        )
+        first_result = serializer.dump(self.UnitTestingSchema())
+        first_result['properties']['data']['type'] = 'integer'
+
+        second_result = serializer.dump(self.UnitTestingSchema())
+        self.assertEqual('string', second_result['properties']['data']['type'])
+
+
 class TestDumps(TestJSONSchema):
     """
     Contains unit tests for
@@ -0,0 +1,110 @@
+"""
+Contains unit tests for :mod:`topchef.validator_cache`
+"""
+import unittest
+from collections import OrderedDict
+from threading import Thread
+from jsonschema import Draft4Validator
+from topchef.validator_cache import ValidatorCache
+
+
+class TestValidatorCache(unittest.TestCase):
+    """
+    Base class for unit testing the validator cache
+    """
+    def setUp(self) -> None:
+        """
+        Create a small cache, so that eviction can be tested
+        """
+        self.cache = ValidatorCache(2)
+        self.schema = {'type': 'object', 'required': ['value']}
+
+
+class TestCall(TestValidatorCache):
+    """
+    Contains unit tests for getting validators out of the cache
+    """
+    def test_validator_validates(self) -> None:
+        """
+        Tests that the returned validator validates against the schema
+        """
+        validator = self.cache(self.schema)
+        self.assertIsInstance(validator, Draft4Validator)
+        self.assertTrue(validator.is_valid({'value': 1}))
+        self.assertFalse(validator.is_valid({}))
+
+    def test_validator_is_reused(self) -> None:
+        """
+        Tests that asking for the same schema twice, even with its keys in
+        a different order, returns the same validator
+        """
+        reordered_schema = OrderedDict(
+            reversed(list(self.schema.items()))
+        )
+        self.assertIs(self.cache(self.schema), self.cache(reordered_schema))
+        self.assertEqual(1, len(self.cache))
+
+    def test_changed_schema_gets_new_validator(self) -> None:
+        """
+        Tests that changing the schema results in a new validator
+        """
+        validator = self.cache(self.schema)
+        self.schema['required'] = []
+        new_validator = self.cache(self.schema)
+
+        self.assertIsNot(validator, new_validator)
+        self.assertTrue(new_validator.is_valid({}))
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        """
+        Tests that the cache does not grow past its maximum size, and that
+        the least recently used validator is the one that is evicted
+        """
+        first_validator = self.cache({'type': 'object'})
+        self.cache({'type': 'array'})
+        self.cache({'type': 'object'})
+        self.cache({'type': 'string'})
+
+        self.assertEqual(2, len(self.cache))
+        self.assertIs(first_validator, self.cache({'type': 'object'}))
+
+    def test_clear(self) -> None:
+        """
+        Tests that clearing the cache removes all validators
+        """
+        self.cache(self.schema)
+        self.cache.clear()
+        self.assertEqual(0, len(self.cache))
+
+
+class TestThreadSafety(TestValidatorCache):
+    """
+    Contains unit tests for sharing validators between threads
+    """
+    def test_references_resolved_in_several_threads(self) -> None:
+        """
+        Tests that a schema with references can be validated by the same
+        validator in several threads at once
+        """
+        schema = {
+            'id': 'http://example.com/schema',
+            'definitions': {'value': {'type': 'integer'}},
+            'type': 'array',
+            'items': {'$ref': '#/definitions/value'}
+        }
+        validator = self.cache(schema)
+        results = []
+
+        def validate() -> None:
+            for _ in range(100):
+                results.append(validator.is_valid(list(range(20))))
+                results.append(not validator.is_valid(['not an integer']))
+
+        threads = [Thread(target=validate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(800, len(results))
+        self.assertTrue(all(results))
@@ -0,0 +1,46 @@
+"""
+Contains unit tests for :mod:`topchef.wsgi_app`
+"""
+import unittest
+from threading import Thread
+from topchef.wsgi_app import TestingWSGIAPPFactory
+
+
+class TestSessionRegistry(unittest.TestCase):
+    """
+    Contains unit tests for the sessions given to each request
+    """
+    def setUp(self) -> None:
+        self.app_factory = TestingWSGIAPPFactory()
+        self.registry = self.app_factory.session_registry
+
+    def test_session_removed_on_teardown(self) -> None:
+        """
+        Tests that the session for a request is removed once the request's
+        application context is torn down
+        """
+        with self.app_factory.app.app_context():
+            session = self.registry()
+            self.assertIs(session, self.registry())
+
+        self.assertFalse(self.registry.registry.has())
+
+    def test_sessions_not_shared_between_threads(self) -> None:
+        """
+        Tests that requests served by different threads get different
+        sessions
+        """
+        sessions = []
+
+        def get_session() -> None:
+            with self.app_factory.app.app_context():
+                sessions.append(self.registry())
+
+        threads = [Thread(target=get_session) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(2, len(sessions))
+        self.assertIsNot(sessions[0], sessions[1])
@@ -12,11 +12,21 @@ Flask development server.
     web server like Apache, it is recommended to use the ``APP_FACTORY``
     variable in :mod:`topchef.wsgi_app`.
 """
+from typing import Callable
+from uuid import UUID
 from flask import Flask
-from flask_script import Manager, Command
+from flask_script import Manager, Command, Option
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateColumn, Table
 from topchef.wsgi_app import WSGIAppFactory
 from topchef.wsgi_app import DatabaseEngineFactory
 from topchef import APP_FACTORY
+from topchef.config import config
+from topchef.database import reap_expired_leases, repair_job_counters
+from topchef.database import delete_jobs_of_service, delete_service
 from topchef.database.schemas import DatabaseSchema, AbstractDatabaseSchema
 
 
@@ -39,6 +49,16 @@ class TopchefManager(Manager):
         self.add_default_commands()
         self.add_command('run', self.Run(self.app))
         self.add_command('create-db', self.CreateDB(db_engine_factory))
+        self.add_command('upgrade-db', self.UpgradeDB(db_engine_factory))
+        self.add_command(
+            'repair-job-counters', self.RepairJobCounters(db_engine_factory)
+        )
+        self.add_command(
+            'reap-expired-leases', self.ReapExpiredLeases(db_engine_factory)
+        )
+        self.add_command(
+            'delete-service', self.DeleteService(db_engine_factory)
+        )
 
     class Run(Command):
         def __init__(self, app: Flask) -> None:
@@ -62,6 +82,160 @@ class TopchefManager(Manager):
             engine = self.app_factory.engine
             self.schema.metadata.create_all(bind=engine)
 
+    class UpgradeDB(Command):
+        """
+        Bring an existing database up to date with the schema without
+        dropping any data. Tables missing from the database are created,
+        and columns and indexes missing from existing tables are added in
+        place. Added columns MUST be nullable, or have a server default.
+        """
+        def __init__(
+                self,
+                app_factory: DatabaseEngineFactory,
+                database_schema: AbstractDatabaseSchema=DatabaseSchema(),
+                inspector_factory: Callable[[Engine], Inspector]=inspect
+        ) -> None:
+            super(self.__class__, self).__init__()
+            self.app_factory = app_factory
+            self.schema = database_schema
+            self.inspector_factory = inspector_factory
+
+        def run(self):
+            engine = self.app_factory.engine
+            self.schema.metadata.create_all(bind=engine)
+            inspector = self.inspector_factory(engine)
+
+            for table in self.schema.metadata.sorted_tables:
+                self._add_missing_columns(table, inspector, engine)
+                self._create_missing_indexes(table, inspector, engine)
+
+        @staticmethod
+        def _add_missing_columns(
+                table: Table, inspector: Inspector, engine: Engine
+        ) -> None:
+            existing_column_names = {
+                column['name'] for column in inspector.get_columns(table.name)
+            }
+            for column in table.columns:
+                if column.name not in existing_column_names:
+                    engine.execute('ALTER TABLE %s ADD COLUMN %s' % (
+                        engine.dialect.identifier_preparer.format_table(table),
+                        CreateColumn(column).compile(dialect=engine.dialect)
+                    ))
+
+        @staticmethod
+        def _create_missing_indexes(
+                table, inspector: Inspector, engine: Engine
+        ) -> None:
+            existing_index_names = {
+                index['name'] for index in inspector.get_indexes(table.name)
+            }
+            for index in table.indexes:
+                if index.name not in existing_index_names:
+                    index.create(bind=engine)
+
+    class RepairJobCounters(Command):
+        """
+        Recount the jobs of every service, and overwrite the job counters
+        with the result. Run this after upgrading a database that was
+        created before the job counters existed, or if the counters have
+        drifted because jobs were changed outside of the API.
+        """
+        def __init__(
+                self,
+                app_factory: DatabaseEngineFactory,
+                repair: Callable[[Session], None]=repair_job_counters,
+                session_factory: Callable[..., Session]=Session
+        ) -> None:
+            super(self.__class__, self).__init__()
+            self.app_factory = app_factory
+            self.repair = repair
+            self.session_factory = session_factory
+
+        def run(self):
+            session = self.session_factory(bind=self.app_factory.engine)
+            try:
+                self.repair(session)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+    class ReapExpiredLeases(Command):
+        """
+        Return every job whose lease has expired to its service's queue.
+        The API does this by itself every ``LEASE_REAPER_INTERVAL`` seconds.
+        Run this if the reaper has been turned off, for instance from a
+        scheduled job.
+        """
+        def __init__(
+                self,
+                app_factory: DatabaseEngineFactory,
+                reap: Callable[[Session], dict]=reap_expired_leases,
+                session_factory: Callable[..., Session]=Session
+        ) -> None:
+            super(self.__class__, self).__init__()
+            self.app_factory = app_factory
+            self.reap = reap
+            self.session_factory = session_factory
+
+        def run(self):
+            session = self.session_factory(bind=self.app_factory.engine)
+            try:
+                self.reap(session)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+    class DeleteService(Command):
+        """
+        Delete a service and all of its jobs. The jobs are deleted
+        ``--chunk-size`` at a time, and each chunk is committed on its own,
+        so that a service with a long history does not hold the database's
+        write lock until all of its jobs are gone. If the command is
+        interrupted, the service is left with fewer jobs, and the command
+        can be run again.
+        """
+        option_list = (
+            Option('service_id', type=UUID),
+            Option(
+                '--chunk-size', dest='chunk_size', type=int,
+                default=config.SERVICE_DELETION_CHUNK_SIZE
+            )
+        )
+
+        def __init__(
+                self,
+                app_factory: DatabaseEngineFactory,
+                delete_jobs: Callable[
+                    [Session, UUID, int], int]=delete_jobs_of_service,
+                delete: Callable[[Session, UUID], bool]=delete_service,
+                session_factory: Callable[..., Session]=Session
+        ) -> None:
+            super(self.__class__, self).__init__()
+            self.app_factory = app_factory
+            self.delete_jobs = delete_jobs
+            self.delete = delete
+            self.session_factory = session_factory
+
+        def run(self, service_id: UUID, chunk_size: int) -> None:
+            session = self.session_factory(bind=self.app_factory.engine)
+            try:
+                while self.delete_jobs(session, service_id, chunk_size):
+                    session.commit()
+                self.delete(session, service_id)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
 
 if __name__ == '__main__':
     manager = TopchefManager()
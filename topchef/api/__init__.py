@@ -9,4 +9,5 @@ from .jobs_for_service import JobsForServiceID as JobsForService
 from .job_queue import JobQueueForServiceID as JobQueueForService
 from .next_job import NextJobForServiceID as NextJob
 from .job_detail import JobDetailForJobID as JobDetail
+from .job_lease import JobLeaseForJobID as JobLease
 from .validator import JSONSchemaValidator
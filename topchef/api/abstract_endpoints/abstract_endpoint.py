@@ -4,18 +4,26 @@ endpoints will inherit. This takes care of managing the database session,
 as well as providing a ``links`` object containing the endpoint to itself.
 """
 from functools import reduce
-from flask import Response, jsonify
+from flask import Response, stream_with_context
+from topchef.json_codec import jsonify
 from flask.views import View, http_method_funcs
 from flask import url_for, Request
 from flask import request as flask_request
 from werkzeug.exceptions import BadRequest
 from sqlalchemy.orm import Session
+from marshmallow import Schema
 import abc
-from typing import List, Iterable, Callable, Optional, Any, Set
-from topchef.models import APIError
+from typing import List, Iterable, Callable, Optional, Any, Set, Sequence
+from typing import Tuple, Union
+from topchef.config import config
+from topchef.api.job_filters import parse_job_filter
+from topchef.api.pagination import Cursor, ServiceCursor
+from topchef.api.streaming import jobs_in_chunks, json_document
+from topchef.models import APIError, Job, JobList
 from topchef.models.errors import MethodNotAllowedError
 from topchef.models.errors import SQLAlchemyError
 from topchef.models.errors import RequestNotJSONError
+from topchef.models.errors import InvalidQueryParameterError
 from topchef.serializers import APIException as ExceptionSerializer
 from topchef.serializers import JSONSchema
 
@@ -84,6 +92,9 @@ class AbstractEndpoint(View, metaclass=AbstractMethodViewType):
     endpoint. If an endpoint will be paginated, the pagination links should
     go into this object.
     """
+    _TRUE_QUERY_VALUES = frozenset(['true', '1'])
+    _FALSE_QUERY_VALUES = frozenset(['false', '0'])
+
     def __init__(
             self, session: Session, request: Request=flask_request
     ) -> None:
@@ -144,6 +155,177 @@ class AbstractEndpoint(View, metaclass=AbstractMethodViewType):
         else:
             return json
 
+    def boolean_query_parameter(
+            self, name: str, default: Optional[bool]=False
+    ) -> Optional[bool]:
+        """
+
+        :param name: The name of the query string parameter to read
+        :param default: The value to return if the parameter was not supplied
+        :return: The value of the parameter as a boolean
+        :raises: :exc:`InvalidQueryParameterError` if the parameter is not
+            one of ``true``, ``false``, ``1``, or ``0``
+        """
+        value = self._request.args.get(name)
+        if value is None:
+            return default
+
+        if value.lower() in self._TRUE_QUERY_VALUES:
+            return True
+        elif value.lower() in self._FALSE_QUERY_VALUES:
+            return False
+        else:
+            raise InvalidQueryParameterError(
+                name, value, 'The value must be either "true" or "false"'
+            )
+
+    def integer_query_parameter(
+            self, name: str, default: int, minimum: Optional[int]=None,
+            maximum: Optional[int]=None
+    ) -> int:
+        """
+
+        :param name: The name of the query string parameter to read
+        :param default: The value to return if the parameter was not supplied
+        :param minimum: The smallest allowed value of the parameter, if any
+        :param maximum: The largest allowed value of the parameter, if any
+        :return: The value of the parameter as an integer
+        :raises: :exc:`InvalidQueryParameterError` if the parameter is not an
+            integer, or if it lies outside of the allowed range
+        """
+        value = self._request.args.get(name)
+        if value is None:
+            return default
+
+        try:
+            integer_value = int(value)
+        except ValueError:
+            raise InvalidQueryParameterError(
+                name, value, 'The value must be an integer'
+            )
+
+        if minimum is not None and integer_value < minimum:
+            raise InvalidQueryParameterError(
+                name, value, 'The value must be at least %d' % minimum
+            )
+        if maximum is not None and integer_value > maximum:
+            raise InvalidQueryParameterError(
+                name, value, 'The value must be at most %d' % maximum
+            )
+
+        return integer_value
+
+    def cursor_query_parameter(
+            self, name: str='cursor', cursor_type: type=Cursor
+    ) -> Optional[Union[Cursor, ServiceCursor]]:
+        """
+
+        :param name: The name of the query string parameter to read
+        :param cursor_type: The type of cursor to decode. Defaults to a
+            cursor into a list of jobs
+        :return: The decoded cursor, or ``None`` if no cursor was supplied
+        :raises: :exc:`InvalidQueryParameterError` if the parameter is not a
+            cursor returned by this API
+        """
+        value = self._request.args.get(name)
+        if value is None:
+            return None
+
+        try:
+            return cursor_type.decode(value)
+        except ValueError:
+            raise InvalidQueryParameterError(
+                name, value, 'The value must be a cursor taken from a "next" '
+                             'link returned by this API'
+            )
+
+    def job_filters_query_parameter(
+            self, name: str='filter'
+    ) -> List[JobList.Filter]:
+        """
+
+        :param name: The name of the query string parameter to read. The
+            parameter may be given several times
+        :return: The filters, in the order in which they were given
+        :raises: :exc:`InvalidQueryParameterError` if one of the values is
+            not a valid filter
+        """
+        filters = []
+        for value in self._request.args.getlist(name):
+            try:
+                filters.append(parse_job_filter(value))
+            except ValueError as error:
+                raise InvalidQueryParameterError(name, value, str(error))
+        return filters
+
+    def page_size_query_parameter(self) -> int:
+        """
+
+        :return: The ``limit`` query parameter, which is the number of items
+            on a page. This defaults to ``DEFAULT_PAGE_SIZE``
+        :raises: :exc:`InvalidQueryParameterError` if the limit is not an
+            integer between 1 and ``MAXIMUM_PAGE_SIZE``
+        """
+        return self.integer_query_parameter(
+            'limit', config.DEFAULT_PAGE_SIZE,
+            minimum=1, maximum=config.MAXIMUM_PAGE_SIZE
+        )
+
+    def page_of_jobs(
+            self, job_list: JobList
+    ) -> Tuple[Sequence[Job], Optional[Cursor]]:
+        """
+        Get the page of jobs requested by the ``limit``, ``cursor`` and
+        ``filter`` query parameters. One more job than requested is
+        fetched, in order to tell whether a next page exists without
+        counting the list.
+
+        :param job_list: The jobs to paginate
+        :return: The jobs on the page, and the cursor for the next page. If
+            this is the last page, the cursor is ``None``
+        """
+        limit = self.page_size_query_parameter()
+        jobs = job_list.page(
+            limit + 1, after=self.cursor_query_parameter(),
+            filters=self.job_filters_query_parameter()
+        )
+
+        if len(jobs) > limit:
+            return jobs[:limit], Cursor.from_job(jobs[limit - 1])
+        else:
+            return jobs, None
+
+    def stream_of_jobs(
+            self, job_list: JobList, serializer: Schema, links: dict,
+            meta: dict
+    ) -> Response:
+        """
+        Stream every job in the list that matches the ``filter`` query
+        parameters, starting after the ``cursor`` query parameter if it was
+        supplied. Jobs are read from the database in
+        chunks of ``STREAM_CHUNK_SIZE``, and each job is serialized just
+        before it is written.
+
+        :param job_list: The jobs to stream
+        :param serializer: The serializer to use for each job
+        :param links: The links to write after the jobs
+        :param meta: The metadata to write after the jobs
+        :return: A response whose body is written while it is sent
+        """
+        jobs = jobs_in_chunks(
+            job_list, config.STREAM_CHUNK_SIZE,
+            after=self.cursor_query_parameter(),
+            filters=self.job_filters_query_parameter()
+        )
+        data = (serializer.dump(job).data for job in jobs)
+
+        response = Response(
+            stream_with_context(json_document(data, links=links, meta=meta)),
+            mimetype='application/json'
+        )
+        response.status_code = 200
+        return response
+
     @property
     def links(self) -> dict:
         """
@@ -67,10 +67,22 @@ class EndpointForJobIdMeta(AbstractMethodViewType):
 
     @staticmethod
     def _get_job(instance, job_id: UUID) -> Job:
-        try:
-            return instance.job_list[job_id]
-        except KeyError:
-            raise JobWithUUIDNotFound(job_id)
+        """
+        Resolve the job once for each endpoint instance, in the same way
+        as services are resolved for service endpoints
+
+        :param instance: The endpoint handling the request
+        :param job_id: The ID of the requested job
+        :return: The job
+        :raises: :exc:`JobWithUUIDNotFound` if the job does not exist
+        """
+        resolved_jobs = instance.__dict__.setdefault('_resolved_jobs', {})
+        if job_id not in resolved_jobs:
+            try:
+                resolved_jobs[job_id] = instance.job_list[job_id]
+            except KeyError:
+                raise JobWithUUIDNotFound(job_id)
+        return resolved_jobs[job_id]
 
     def _decorate_endpoints(cls) -> None:
         if hasattr(cls, 'get'):
@@ -97,6 +109,8 @@ class AbstractEndpointForJob(AbstractEndpoint, metaclass=abc.ABCMeta):
         super(AbstractEndpointForJob, self).__init__(session, flask_request)
         if job_list is None:
             self._job_list = JobListModel(self.database_session)
+        else:
+            self._job_list = job_list
 
     @property
     def job_list(self) -> JobList:
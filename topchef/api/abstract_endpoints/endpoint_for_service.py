@@ -68,10 +68,28 @@ class EndpointForServiceIdMeta(AbstractMethodViewType):
 
     @staticmethod
     def _get_service(instance, service_id: UUID) -> Service:
-        try:
-            return instance.service_list[service_id]
-        except KeyError:
-            raise ServiceWithUUIDNotFound(service_id)
+        """
+        Resolve the service once for each endpoint instance. Flask makes a
+        new instance for every request, so a handler that calls another
+        decorated handler reuses the service resolved for the request,
+        instead of looking it up again.
+
+        :param instance: The endpoint handling the request
+        :param service_id: The ID of the requested service
+        :return: The service
+        :raises: :exc:`ServiceWithUUIDNotFound` if the service does not
+            exist
+        """
+        resolved_services = instance.__dict__.setdefault(
+            '_resolved_services', {}
+        )
+        if service_id not in resolved_services:
+            try:
+                resolved_services[service_id] = \
+                    instance.service_list[service_id]
+            except KeyError:
+                raise ServiceWithUUIDNotFound(service_id)
+        return resolved_services[service_id]
 
     def _decorate_endpoints(cls) -> None:
         if hasattr(cls, 'get'):
@@ -2,7 +2,8 @@
 Describes the root endpoint of the API, which provides some metadata about
 the API.
 """
-from flask import jsonify, Response, Request, request
+from flask import Response, Request, request
+from topchef.json_codec import jsonify
 from sqlalchemy.orm import Session
 
 from topchef.api.abstract_endpoints.abstract_endpoint import AbstractEndpoint
@@ -4,16 +4,18 @@ Maps the ``jobs/<job_id>`` endpoint
 from jsonschema import Draft4Validator as JsonschemaValidator
 from jsonschema import ValidationError as JsonSchemaValidatorError
 from sqlalchemy.orm import Session
-from flask import Response, jsonify, url_for, Request, request
+from flask import Response, url_for, Request, request
+from topchef.json_codec import jsonify
 from topchef.models import Job, JobList
-from topchef.models.errors import ValidationError
+from topchef.models.errors import LeaseNotHeldError, ValidationError
 from topchef.api.abstract_endpoints import AbstractEndpointForJob
 from topchef.api.abstract_endpoints import AbstractEndpointForJobMeta
 from topchef.serializers import JSONSchema
 from topchef.serializers import JobDetail as JobSerializer
 from topchef.serializers import JobModification as JobModificationSerializer
 from topchef.models.errors import DeserializationError
-from typing import Dict, Optional, Type, Iterable
+from topchef.validator_cache import VALIDATOR_CACHE
+from typing import Dict, Optional, Callable, Iterable
 from uuid import UUID
 
 
@@ -26,7 +28,8 @@ class JobDetail(AbstractEndpointForJob):
             session: Session,
             flask_request: Request=request,
             job_list:Optional[JobList]=None,
-            validator_factory: Type[JsonschemaValidator]=JsonschemaValidator
+            validator_factory: Callable[
+                [dict], JsonschemaValidator]=VALIDATOR_CACHE
     ) -> None:
         super(JobDetail, self).__init__(
             session, flask_request, job_list
@@ -158,7 +161,9 @@ class JobDetail(AbstractEndpointForJob):
         Modify the mutable properties of the job. These are the job status
         and the job results. A request to this endpoint must satisfy the
         schema in the ``patch_request_schema`` key in the ``meta`` key of
-        the GET request of this endpoint
+        the GET request of this endpoint. A ``WORKING`` job that was
+        claimed by a worker is leased to that worker, and can only be
+        modified with the ``lease_token`` handed out when it was claimed
 
         **Example Request**
 
@@ -183,7 +188,8 @@ class JobDetail(AbstractEndpointForJob):
                     "light_count": 153,
                     "dark_count": 100,
                     "result_count": 113
-                }
+                },
+                "lease_token": "7b1a6f5e-9a61-4b8e-a3a4-0f6b3c1b2d90"
             }
 
         **Example Response**
@@ -209,6 +215,10 @@ class JobDetail(AbstractEndpointForJob):
 
         :statuscode 200: The request completed successfully
         :statuscode 404: A job with that ID could not be found
+        :statuscode 409: The job is leased, and the ``lease_token`` is
+            missing or is not the token of the lease. Either the lease
+            expired and the job was returned to the queue, or the job was
+            claimed by another worker
 
         :param job: The job to be modified
         :return: The response
@@ -222,6 +232,10 @@ class JobDetail(AbstractEndpointForJob):
             self._report_loading_errors(errors)
             raise self.Abort()
 
+        if not self._is_lease_held(job, data.get('lease_token')):
+            self.errors.append(LeaseNotHeldError(job.id))
+            raise self.Abort()
+
         if 'results' in data.keys():
             if data['results'] is not None:
                 self._modify_job_results(job, data['results'])
@@ -234,6 +248,19 @@ class JobDetail(AbstractEndpointForJob):
         response.status_code = 200
         return response
 
+    @staticmethod
+    def _is_lease_held(job: Job, lease_token: Optional[UUID]) -> bool:
+        """
+
+        :param job: The job to be modified
+        :param lease_token: The lease token sent with the request, if any
+        :return: ``True`` if the job is not leased, or if it is leased
+            with this token, otherwise ``False``
+        """
+        if job.status is not Job.JobStatus.WORKING or job.lease_token is None:
+            return True
+        return job.lease_token == lease_token
+
     def _report_loading_errors(self, errors: Dict[str, str]) -> None:
         self.errors.extend(
             DeserializationError(key, errors[key]) for key in errors.keys()
@@ -0,0 +1,102 @@
+"""
+Parses the ``filter`` query parameter of the endpoints that list jobs. A
+filter is written as
+
+.. code-block:: none
+
+    <document>.<path><operator><value>
+
+where ``document`` is either ``parameters`` or ``results``, ``path`` is a
+sequence of object keys separated by ``.``, and array indices written as
+``[<index>]``, and ``operator`` is one of ``=``, ``!=``, ``<``, ``<=``,
+``>`` or ``>=``. The value is read as JSON if it is a JSON string, number,
+boolean or ``null``, and as a string otherwise. For instance
+
+.. code-block:: none
+
+    parameters.pulse_time>10
+    parameters.experiment_type=RABI
+    results.counts[0]>=1000
+
+Object keys may only contain letters, digits, ``_`` and ``-``.
+"""
+import math
+import re
+from typing import Union
+from topchef.json_codec import JSON_CODEC
+from topchef.models import JobList
+
+__all__ = ['parse_job_filter']
+
+_FILTER_PATTERN = re.compile(
+    r'^(?P<document>[a-z]+)'
+    r'(?P<path>(?:\.[A-Za-z0-9_\-]+|\[[0-9]+\])+)'
+    r'(?P<operator><=|>=|!=|=|<|>)'
+    r'(?P<value>.*)$'
+)
+
+_PATH_KEY_PATTERN = re.compile(r'\.([A-Za-z0-9_\-]+)|\[([0-9]+)\]')
+
+_ORDERED_TYPES = frozenset(['string', 'number'])
+
+
+def parse_job_filter(expression: str) -> JobList.Filter:
+    """
+
+    :param expression: The value of a ``filter`` query parameter
+    :return: The filter
+    :raises: :exc:`ValueError` if the expression is not a valid filter
+    """
+    match = _FILTER_PATTERN.match(expression)
+    if match is None:
+        raise ValueError(
+            '%s is not of the form <document>.<path><operator><value>' %
+            expression
+        )
+
+    document = match.group('document')
+    if document not in JobList.Filter.DOCUMENTS:
+        raise ValueError(
+            'Jobs can only be filtered by their parameters or results'
+        )
+
+    value = _value(match.group('value'))
+    json_type = JobList.Filter.json_type(value)
+    operator = match.group('operator')
+
+    if json_type is None:
+        raise ValueError(
+            'Jobs can only be filtered by strings, numbers, booleans and null'
+        )
+    if json_type == 'null' and operator != '=':
+        raise ValueError('Only = can be used to compare with null')
+    if operator not in ('=', '!=') and json_type not in _ORDERED_TYPES:
+        raise ValueError(
+            'Only strings and numbers can be compared with %s' % operator
+        )
+
+    return JobList.Filter(
+        document, tuple(
+            int(index) if index else key for key, index in
+            _PATH_KEY_PATTERN.findall(match.group('path'))
+        ), operator, value
+    )
+
+
+def _value(text: str) -> Union[str, int, float, bool, None, list, dict]:
+    """
+
+    :param text: The value written in a filter
+    :return: The value read as JSON, if it is valid JSON, otherwise the
+        value as a string. ``NaN`` and ``Infinity`` are read as strings,
+        since they are not numbers in JSON
+    """
+    try:
+        value = JSON_CODEC.loads(text)
+    except ValueError:
+        return text
+
+    if isinstance(value, float) and not math.isfinite(value):
+        return text
+    else:
+        return value
@@ -0,0 +1,114 @@
+"""
+Maps the ``/jobs/<job_id>/lease`` endpoint
+"""
+from flask import Response, url_for
+from topchef.json_codec import jsonify
+from topchef.api.abstract_endpoints import AbstractEndpointForJob
+from topchef.api.abstract_endpoints import AbstractEndpointForJobMeta
+from topchef.api.job_detail import JobDetailForJobID
+from topchef.models import Job
+from topchef.models.errors import DeserializationError, LeaseNotHeldError
+from topchef.serializers import JobLease as JobLeaseSerializer
+from typing import Dict
+
+
+class JobLease(AbstractEndpointForJob):
+    """
+    Lets the worker running a job extend its lease on the job
+    """
+    def post(self, job: Job) -> Response:
+        """
+        Extend the lease on a job. A job that is claimed from
+        ``/services/<service_id>/jobs/next`` is leased to the worker that
+        claimed it until the job's ``lease_expires_at`` date. If the worker
+        has not finished the job by then, and has not extended the lease,
+        the job is returned to the queue so that another worker can claim
+        it. Workers running long jobs should extend their leases well
+        before they expire.
+
+        .. :quickref: Job; Extend the lease on a job
+
+        **Example Request**
+
+        .. sourcecode:: http
+
+            POST /jobs/42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7/lease HTTP/1.1
+            Content-Type: application/json
+
+            {
+                "lease_token": "7b1a6f5e-9a61-4b8e-a3a4-0f6b3c1b2d90"
+            }
+
+        **Example Response**
+
+        .. sourcecode:: http
+
+            HTTP/1.1 200 OK
+            Content-Type: application/json
+
+            {
+                "data": {
+                    "lease_expires_at": "2017-08-15T18:34:07.902093+00:00",
+                    "lease_token": "7b1a6f5e-9a61-4b8e-a3a4-0f6b3c1b2d90"
+                },
+                "links": {
+                    "job": "http://localhost:5000/jobs/42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7",
+                    "self": "http://localhost:5000/jobs/42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7/lease"
+                }
+            }
+
+        :statuscode 200: The lease was extended
+        :statuscode 400: The request body does not contain a valid
+            ``lease_token``
+        :statuscode 404: A job with that ID could not be found
+        :statuscode 409: The job is not leased with that token. Either the
+            lease expired and the job was returned to the queue, or the job
+            was claimed by another worker
+
+        :param job: The job whose lease is to be extended
+        :return: The response
+        """
+        serializer = JobLeaseSerializer()
+        data, errors = serializer.load(self.request_json)
+
+        if errors:
+            self._report_loading_errors(errors)
+            raise self.Abort()
+
+        lease_expires_at = self.job_list.extend_lease(
+            job.id, data['lease_token']
+        )
+
+        if lease_expires_at is None:
+            self.errors.append(LeaseNotHeldError(job.id))
+            raise self.Abort()
+
+        response = jsonify({
+            'data': serializer.dump({
+                'lease_token': data['lease_token'],
+                'lease_expires_at': lease_expires_at
+            }).data,
+            'links': {
+                'self': url_for(
+                    self.__class__.__name__, job_id=str(job.id),
+                    _external=True
+                ),
+                'job': url_for(
+                    JobDetailForJobID.__name__, job_id=str(job.id),
+                    _external=True
+                )
+            }
+        })
+        response.status_code = 200
+        return response
+
+    def _report_loading_errors(self, errors: Dict[str, str]) -> None:
+        self.errors.extend(
+            DeserializationError(key, errors[key]) for key in errors.keys()
+        )
+
+
+class JobLeaseForJobID(JobLease, metaclass=AbstractEndpointForJobMeta):
+    """
+    Maps the job UUID in the URL to the job whose lease is extended
+    """
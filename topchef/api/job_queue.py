@@ -1,13 +1,13 @@
 """
 Maps the ``/services/<service_id>/queue`` endpoint
 """
-from datetime import datetime
-from flask import Response, jsonify
+from flask import Response
+from topchef.json_codec import jsonify
 from topchef.api.abstract_endpoints import AbstractEndpointForService
 from topchef.api.abstract_endpoints import AbstractEndpointForServiceMeta
+from topchef.config import config
 from topchef.models import Service, Job
 from topchef.serializers import JobDetail, JSONSchema
-from itertools import islice
 from typing import Iterable
 
 
@@ -17,7 +17,8 @@ class JobQueueForService(AbstractEndpointForService):
     """
     def get(self, service: Service) -> Response:
         r"""
-        Returns the next 10 jobs available for a given service
+        Returns the next few jobs available for a given service, oldest
+        first. By default, the next 10 jobs are returned.
 
         .. :quickref: Job; Get the next few jobs
 
@@ -25,7 +26,7 @@ class JobQueueForService(AbstractEndpointForService):
 
         .. sourcecode:: http
 
-            GET /services/495d76fd-044c-4f02-8815-5ec6e7634330/queue HTTP/1.1
+            GET /services/495d76fd-044c-4f02-8815-5ec6e7634330/queue?limit=1 HTTP/1.1
             Content-Type: application/json
 
         **Example Response With A Job**
@@ -105,24 +106,25 @@ class JobQueueForService(AbstractEndpointForService):
 
             HTTP/1.1 204 NO CONTENT
 
+        :query limit: The maximum number of jobs to return. This must be
+            between 1 and ``MAXIMUM_PAGE_SIZE``, and defaults to
+            ``DEFAULT_PAGE_SIZE``.
+
         :statuscode 200: The request completed successfully
         :statuscode 204: The request completed successfully, but there are
             no jobs in the queue right now.
+        :statuscode 400: The ``limit`` parameter is not a valid page size
         :statuscode 404: A service with that ID could not be found
 
         :param service: The service for which the next few jobs are to be
             retrieved
         :return: A flask response with the appropriate data
         """
-        registered_jobs = filter(
-            self._is_job_registered, service.jobs
-        )
-        first_few_jobs = islice(registered_jobs, 10)
-        sorted_jobs_by_date = sorted(
-            first_few_jobs,
-            key=self._get_date_submitted,
-            reverse=False
+        limit = self.integer_query_parameter(
+            'limit', config.DEFAULT_PAGE_SIZE,
+            minimum=1, maximum=config.MAXIMUM_PAGE_SIZE
         )
+        sorted_jobs_by_date = service.jobs.registered_jobs(limit)
 
         if not sorted_jobs_by_date:
             response = Response()
@@ -139,19 +141,6 @@ class JobQueueForService(AbstractEndpointForService):
 
         return response
 
-    @staticmethod
-    def _is_job_registered(job: Job):
-        """
-
-        :param job: The job to check if it is registered
-        :return:
-        """
-        return job.status is Job.JobStatus.REGISTERED
-
-    @staticmethod
-    def _get_date_submitted(job: Job) -> datetime:
-        return job.date_submitted
-
     @staticmethod
     def _get_data(sorted_jobs_by_date: Iterable[Job]) -> dict:
         serializer = JobDetail()
@@ -1,17 +1,21 @@
 """
 Maps the ``/services/<service_id>/jobs`` endpoint
 """
-from flask import Response, jsonify, url_for, Request, request
+from flask import Response, url_for, Request, request
+from topchef.json_codec import jsonify
 from topchef.api.abstract_endpoints import AbstractEndpointForService
 from topchef.api.abstract_endpoints import AbstractEndpointForServiceMeta
 from topchef.api.job_detail import JobDetailForJobID as JobDetail
-from topchef.models import Service, ServiceList
+from topchef.config import config
+from topchef.models import Service, ServiceList, APIError
 from topchef.models.errors import DeserializationError, ValidationError
 from topchef.serializers import JSONSchema
+from topchef.serializers import APIException as ExceptionSerializer
 from topchef.serializers import JobDetail as JobDetailSerializer
 from topchef.serializers.new_job import NewJob as NewJobSerializer
 from jsonschema import Draft4Validator as JSONSchemaValidator
-from typing import Iterable, Optional
+from topchef.validator_cache import VALIDATOR_CACHE
+from typing import Iterable, Optional, List, Tuple, Any, Callable
 from jsonschema import ValidationError as JSONSchemaError
 from sqlalchemy.orm import Session
 
@@ -29,19 +33,23 @@ class JobsForServiceEndpoint(AbstractEndpointForService):
             session: Session,
             flask_request: Request=request,
             service_list: Optional[ServiceList]=None,
-            validator_factory: Optional[type]=None
+            validator_factory: Optional[
+                Callable[[dict], JSONSchemaValidator]]=None
     ):
         super(JobsForServiceEndpoint, self).__init__(
             session, flask_request, service_list=service_list
         )
         if validator_factory is None:
-            self._validator_factory = JSONSchemaValidator
+            self._validator_factory = VALIDATOR_CACHE
         else:
             self._validator_factory = validator_factory
 
     def get(self, service: Service) -> Response:
         """
-        Get the list of jobs available for a service
+        Get the list of jobs available for a service. The list is
+        paginated, with the oldest jobs first. If there are more jobs after
+        this page, the ``links`` object contains a ``next`` link to the next
+        page.
 
         .. :quickref: Service; Get jobs for the service
 
@@ -67,7 +75,8 @@ class JobsForServiceEndpoint(AbstractEndpointForService):
                     }
                 ],
                 "links": {
-                    "self": "http://localhost:5000/services/495d76fd-044c-4f02-8815-5ec6e7634330/jobs"
+                    "self": "http://localhost:5000/services/495d76fd-044c-4f02-8815-5ec6e7634330/jobs",
+                    "next": "http://localhost:5000/services/495d76fd-044c-4f02-8815-5ec6e7634330/jobs?cursor=WyIyMDE3LTA4LTE1VDE4OjI5OjA3LjkwMjA5MyIsICI0MjA5NGZlNC05YzcxLTRkNmUtOTRmZC03ZWQ2ZTJiNDZjZTciXQ%3D%3D&limit=1"
                 },
                 "meta": {
                     "data_schema": {
@@ -131,20 +140,58 @@ class JobsForServiceEndpoint(AbstractEndpointForService):
                 }
             }
 
+        :query limit: The maximum number of jobs on the page. This must be
+            between 1 and ``MAXIMUM_PAGE_SIZE``, and defaults to
+            ``DEFAULT_PAGE_SIZE``.
+        :query cursor: The position in the list at which the page starts.
+            Cursors are opaque, and are taken from the ``next`` link of the
+            previous page.
+
+        :query stream: If ``true``, every job after ``cursor`` is returned
+            in one response, instead of a page of jobs. The jobs are
+            written while they are read from the database, so the response
+            is not paginated, and has no ``next`` link.
+        :query filter: A condition on the parameters or results of the
+            jobs, such as ``parameters.pulse_time>10``. Only the jobs
+            matching every ``filter`` are returned. The conditions are
+            evaluated by the database. See
+            :mod:`topchef.api.job_filters` for the syntax.
+
         :statuscode 200: The request completed successfully
+        :statuscode 400: The ``limit``, ``cursor``, ``stream``, or
+            ``filter`` parameters are invalid
         :statuscode 404: A service with that ID could not be found
 
         :param service: The service for which jobs are to be retrieved
         :return: A flask response containing the data to display to the user
         """
+        meta = {
+            'new_job_schema': self._new_job_schema(service),
+            'data_schema': self._data_schema
+        }
+
+        if self.boolean_query_parameter('stream'):
+            return self.stream_of_jobs(
+                service.jobs, JobDetailSerializer(),
+                {'self': self.self_url(service)}, meta
+            )
+
+        jobs, next_cursor = self.page_of_jobs(service.jobs)
+
+        links = {'self': self.self_url(service)}
+        if next_cursor is not None:
+            links['next'] = url_for(
+                self.__class__.__name__, service_id=service.id,
+                cursor=next_cursor.encode(),
+                limit=self.page_size_query_parameter(),
+                filter=self._request.args.getlist('filter'), _external=True
+            )
+
         serializer = JobDetailSerializer()
         response = jsonify({
-            'data': serializer.dump(service.jobs, many=True).data,
-            'meta': {
-                'new_job_schema': self._new_job_schema(service),
-                'data_schema': self._data_schema
-            },
-            'links': {'self': self.self_url(service)}
+            'data': serializer.dump(jobs, many=True).data,
+            'meta': meta,
+            'links': links
         })
         response.status_code = 200
         return response
@@ -194,14 +241,72 @@ class JobsForServiceEndpoint(AbstractEndpointForService):
                 "meta": "new job ID is b0b58425-165f-4add-97b0-86da6b38757f"
             }
 
-        :statuscode 201: The job was successfully created
-        :statuscode 400: The job could not be created.
+        **Example Request Submitting Several Jobs**
+
+        To submit many jobs at once, send a list of new jobs instead. Each
+        job in the list is validated on its own. The valid jobs are created,
+        even if some of the other jobs are invalid. The ``data`` key of the
+        response holds the IDs of the jobs that were created, and a result
+        for each job in the request, in the same order as the request.
+
+        .. sourcecode:: http
+
+            POST /services/668ac2ea-063d-4122-ba7a-97a3e8e46a8a/jobs HTTP/1.1
+            Content-Type: application/json
+
+            [
+                {"parameters": {"experiment_type": "RABI"}},
+                {"parameters": {"experiment_type": 1}}
+            ]
+
+        **Example Response**
+
+        .. sourcecode:: http
+
+            HTTP/1.1 207 MULTI-STATUS
+            Content-Type: application/json
+
+            {
+                "data": {
+                    "created_job_ids": [
+                        "42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7"
+                    ],
+                    "results": [
+                        {
+                            "id": "42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7",
+                            "index": 0,
+                            "status": 201
+                        },
+                        {
+                            "errors": [
+                                {
+                                    "detail": "Validation of schema deque([]) threw error 1 is not of type 'string'",
+                                    "status_code": 400,
+                                    "title": "JSONSchema Validation Error"
+                                }
+                            ],
+                            "index": 1,
+                            "status": 400
+                        }
+                    ]
+                }
+            }
+
+        :statuscode 201: The job was successfully created. If several jobs
+            were submitted, all of them were created
+        :statuscode 207: Several jobs were submitted, and only some of them
+            were created
+        :statuscode 400: The job could not be created. If several jobs were
+            submitted, none of them were created
         :statuscode 404: A service with the ID could not be found
 
         :param service: The service for which the new job is to be made
         :return: A flask response with the appropriate response as per the
             documentation in this endpoint
         """
+        if isinstance(self.request_json, list):
+            return self._post_several_jobs(service, self.request_json)
+
         data, errors = NewJobSerializer().load(self.request_json)
         if errors:
             self.errors.extend(
@@ -231,6 +336,114 @@ class JobsForServiceEndpoint(AbstractEndpointForService):
         )
         return response
 
+    def _post_several_jobs(
+            self, service: Service, new_jobs: List[dict]
+    ) -> Response:
+        """
+        Validate every job in the request against the same validator, and
+        create all the valid jobs at once
+
+        :param service: The service for which the new jobs are to be made
+        :param new_jobs: The new jobs in the request body
+        :return: A response with the result for each job
+        """
+        if not 0 < len(new_jobs) <= config.MAXIMUM_JOBS_PER_REQUEST:
+            self.errors.append(DeserializationError(
+                'root', 'A list of new jobs must contain between 1 and %d '
+                        'jobs' % config.MAXIMUM_JOBS_PER_REQUEST
+            ))
+            raise self.Abort()
+
+        serializer = NewJobSerializer()
+        validator = self._validator_factory(service.job_registration_schema)
+
+        results = []
+        valid_parameters = []
+        for index, new_job in enumerate(new_jobs):
+            parameters, item_errors = self._validate_new_job(
+                new_job, serializer, validator
+            )
+            if item_errors:
+                results.append({
+                    'index': index, 'status': 400,
+                    'errors': ExceptionSerializer(many=True).dump(
+                        item_errors
+                    ).data
+                })
+            else:
+                results.append({'index': index, 'status': 201})
+                valid_parameters.append(parameters)
+
+        if valid_parameters:
+            created_job_ids = service.new_jobs(valid_parameters)
+        else:
+            created_job_ids = []
+
+        created_results = (
+            result for result in results if result['status'] == 201
+        )
+        for result, job_id in zip(created_results, created_job_ids):
+            result['id'] = str(job_id)
+
+        response = jsonify({
+            'data': {
+                'created_job_ids': [str(job_id) for job_id in created_job_ids],
+                'results': results
+            }
+        })
+        response.status_code = self._bulk_status_code(
+            len(created_job_ids), len(new_jobs)
+        )
+        return response
+
+    @staticmethod
+    def _validate_new_job(
+            new_job: Any, serializer: NewJobSerializer,
+            validator: JSONSchemaValidator
+    ) -> Tuple[Optional[dict], List[APIError]]:
+        """
+
+        :param new_job: One of the new jobs in the request body
+        :param serializer: The serializer used to load the new job
+        :param validator: The validator for the service's job registration
+            schema
+        :return: The parameters of the job, and the errors that make the job
+            invalid
+        """
+        if not isinstance(new_job, dict):
+            return None, [
+                DeserializationError('root', 'Each new job must be an object')
+            ]
+
+        data, errors = serializer.load(new_job)
+        if errors:
+            return None, [
+                DeserializationError(key, errors[key]) for key in errors.keys()
+            ]
+
+        return data['parameters'], [
+            ValidationError(error)
+            for error in validator.iter_errors(data['parameters'])
+        ]
+
+    @staticmethod
+    def _bulk_status_code(
+            number_of_created_jobs: int, number_of_submitted_jobs: int
+    ) -> int:
+        """
+
+        :param number_of_created_jobs: The number of jobs that were created
+        :param number_of_submitted_jobs: The number of jobs in the request
+        :return: ``201`` if all the jobs were created, ``400`` if none were,
+            and ``207`` otherwise
+        """
+        if number_of_created_jobs == number_of_submitted_jobs:
+            return 201
+        elif number_of_created_jobs == 0:
+            return 400
+        else:
+            return 207
+
     @staticmethod
     def _new_job_schema(service: Service) -> dict:
         json_schema = JSONSchema(
@@ -2,13 +2,15 @@
 """
 Describes an API endpoint that describes the endpoint for ``/jobs``
 """
-from typing import Optional
+from typing import Optional, Sequence
 
 from flask import Request, Response
-from flask import request, jsonify
+from flask import request, url_for
+from topchef.json_codec import jsonify
 from sqlalchemy.orm import Session
 
 from topchef.api.abstract_endpoints.abstract_endpoint import AbstractEndpoint
+from topchef.models import Job as JobInterface
 from topchef.models import JobList as JobListInterface
 from topchef.models.job_list import JobList as JobListModel
 from topchef.serializers import JSONSchema
@@ -41,7 +43,9 @@ class JobsList(AbstractEndpoint):
 
     def get(self) -> Response:
         r"""
-        Get the list of all jobs on the system
+        Get the list of all jobs on the system. The list is paginated,
+        with the oldest jobs first. If there are more jobs after this page,
+        the ``links`` object contains a ``next`` link to the next page.
 
         .. :quickref: Job List; Get all the jobs in the API
 
@@ -61,7 +65,8 @@ class JobsList(AbstractEndpoint):
                     }
                 ],
                 "links": {
-                    "self": "http://127.0.0.1:5000/jobs"
+                    "self": "http://127.0.0.1:5000/jobs",
+                    "next": "http://127.0.0.1:5000/jobs?cursor=WyIyMDE3LTA4LTE1VDE4OjI5OjA3LjkwMjA5MyIsICI0MjA5NGZlNC05YzcxLTRkNmUtOTRmZC03ZWQ2ZTJiNDZjZTciXQ%3D%3D&limit=1"
                 },
                 "meta": {
                     "data_schema": {
@@ -105,24 +110,60 @@ class JobsList(AbstractEndpoint):
                 }
             }
 
+        :query limit: The maximum number of jobs on the page. This must be
+            between 1 and ``MAXIMUM_PAGE_SIZE``, and defaults to
+            ``DEFAULT_PAGE_SIZE``.
+        :query cursor: The position in the list at which the page starts.
+            Cursors are opaque, and are taken from the ``next`` link of the
+            previous page.
+
+        :query stream: If ``true``, every job after ``cursor`` is returned
+            in one response, instead of a page of jobs. The jobs are
+            written while they are read from the database, so the response
+            is not paginated, and has no ``next`` link.
+        :query filter: A condition on the parameters or results of the
+            jobs, such as ``parameters.pulse_time>10``. Only the jobs
+            matching every ``filter`` are returned. The conditions are
+            evaluated by the database. See
+            :mod:`topchef.api.job_filters` for the syntax.
+
         :statuscode 200: The request completed successfully
+        :statuscode 400: The ``limit``, ``cursor``, ``stream``, or
+            ``filter`` parameters are invalid
 
-        :return: The list of all jobs on the system
+        :return: A page of jobs on the system
         """
+        if self.boolean_query_parameter('stream'):
+            return self.stream_of_jobs(
+                self.job_list, JobSerializer(), self.links, self._meta
+            )
+
+        jobs, next_cursor = self.page_of_jobs(self.job_list)
+
+        links = self.links
+        if next_cursor is not None:
+            links['next'] = url_for(
+                self.__class__.__name__, cursor=next_cursor.encode(),
+                limit=self.page_size_query_parameter(),
+                filter=self._request.args.getlist('filter'),
+                _external=True
+            )
+
         response = jsonify({
-            'data': self._data, 'meta': self._meta, 'links': self.links
+            'data': self._data(jobs), 'meta': self._meta, 'links': links
         })
         response.status_code = 200
         return response
 
-    @property
-    def _data(self) -> dict:
+    @staticmethod
+    def _data(jobs: Sequence[JobInterface]) -> dict:
         """
 
-        :return: The JSON containing a list of all the jobs on the system
+        :param jobs: The jobs on this page
+        :return: The JSON containing the list of jobs on this page
         """
         serializer = JobSerializer()
-        return serializer.dump(self.job_list, many=True).data
+        return serializer.dump(jobs, many=True).data
 
     @property
     def _meta(self) -> dict:
@@ -1,18 +1,34 @@
 """
 Maps the ``services/<service_id>/jobs/next`` endpoint
 """
-from datetime import datetime
+from time import monotonic
 from .abstract_endpoints import AbstractEndpointForService
 from .abstract_endpoints import AbstractEndpointForServiceMeta
-from topchef.models import Job, Service
-from typing import Optional
-from flask import Response, jsonify
-from itertools import islice
+from topchef.config import config
+from topchef.models import Job, Service, ServiceList
+from topchef.models.job_notifier import JobNotifier, JOB_NOTIFIER
+from typing import Optional, Sequence
+from flask import Response, Request, request
+from topchef.json_codec import jsonify
+from sqlalchemy.orm import Session
+from topchef.serializers import ClaimedJob as ClaimedJobSerializer
 from topchef.serializers import JobDetail as JobSerializer
 from topchef.serializers import JSONSchema
 
 
 class NextJob(AbstractEndpointForService):
+    def __init__(
+            self,
+            session: Session,
+            flask_request: Request=request,
+            service_list: Optional[ServiceList]=None,
+            job_notifier: JobNotifier=JOB_NOTIFIER
+    ) -> None:
+        super(NextJob, self).__init__(
+            session, flask_request, service_list=service_list
+        )
+        self._job_notifier = job_notifier
+
     def get(self, service: Service) -> Response:
         """
 
@@ -85,59 +101,180 @@ class NextJob(AbstractEndpointForService):
                 }
             }
 
+        **Example Request Claiming The Job**
+
+        A worker that intends to run the job should claim it. Claiming a
+        job sets its status to ``WORKING`` in the same database operation
+        that finds it, so two workers polling at the same time will never
+        be handed the same job. Only the response to a claim holds the
+        job's ``lease_token``, which the worker needs to extend its lease
+        and to modify the job.
+
+        .. sourcecode:: http
+
+            GET /services/495d76fd-044c-4f02-8815-5ec6e7634330/jobs/next?claim=true HTTP/1.1
+            Content-Type: application/json
+
+        **Example Request Claiming Several Jobs**
+
+        Workers that run short jobs can claim a batch of jobs in one
+        request. Up to ``count`` of the oldest registered jobs are claimed
+        at once, and the ``data`` key of the response holds a list of the
+        claimed jobs, oldest first. The list may be shorter than ``count``
+        if there are not enough registered jobs.
+
+        .. sourcecode:: http
+
+            GET /services/495d76fd-044c-4f02-8815-5ec6e7634330/jobs/next?count=10 HTTP/1.1
+            Content-Type: application/json
+
+        **Example Request Waiting For A Job**
+
+        Instead of polling this endpoint repeatedly, an idle worker can ask
+        to wait for a job. If there is no job available, the request is held
+        open until a job is submitted to the service, or until ``wait``
+        seconds have passed. ``wait`` can be combined with ``claim`` and
+        ``count``.
+
+        .. sourcecode:: http
+
+            GET /services/495d76fd-044c-4f02-8815-5ec6e7634330/jobs/next?claim=true&wait=30 HTTP/1.1
+            Content-Type: application/json
+
+        :query claim: If ``true``, the next job is claimed, and returned
+            with a status of ``WORKING``. Defaults to ``false``, which
+            returns the next job without changing it.
+        :query count: If supplied, claim up to this many jobs, and return
+            them as a list. This must be between 1 and
+            ``MAXIMUM_CLAIM_COUNT``.
+        :query wait: The maximum number of seconds to wait for a job if none
+            is available right away. This must be between 0 and
+            ``MAXIMUM_LONG_POLL_WAIT``, and defaults to 0, which returns
+            immediately.
+
         :statuscode 200: The request completed successfully. The next job is
             available in the request body
         :statuscode 204: The request completed successfully, but no next job
             is available
+        :statuscode 400: The ``claim`` parameter is not a boolean, or the
+            ``count`` or ``wait`` parameters are out of range
         :statuscode 404: A service with that ID could not be found
 
         :param service: The service for which the next job is to be obtained
         :return: A flask response with the appropriate data
         """
-        try:
+        wait = self.integer_query_parameter(
+            'wait', 0, minimum=0, maximum=config.MAXIMUM_LONG_POLL_WAIT
+        )
+        deadline = monotonic() + wait
+
+        while True:
+            generation = self._job_notifier.generation(service.id)
+            response = self._response_for_next_jobs(service)
+            remaining_time = deadline - monotonic()
+
+            if response.status_code != 204 or remaining_time <= 0:
+                return response
+
+            self._wait_for_new_job(service, generation, remaining_time)
+
+    def _wait_for_new_job(
+            self, service: Service, generation: JobNotifier.Generation,
+            timeout: float
+    ) -> None:
+        """
+        End the current transaction, so that the database connection is not
+        held while waiting, and so that jobs submitted while waiting can be
+        seen. Then, block until a job is submitted or the timeout expires.
+
+        :param service: The service for which jobs are awaited
+        :param generation: The generation of the service's jobs that was
+            seen before the last lookup
+        :param timeout: The maximum number of seconds to wait
+        """
+        self.database_session.commit()
+        self._job_notifier.wait(service.id, generation, timeout)
+
+    def _response_for_next_jobs(self, service: Service) -> Response:
+        """
+
+        :param service: The service for which the next jobs are to be found
+        :return: A response with the next job or jobs, or a ``204``
+            response if none are available
+        """
+        if 'count' in self._request.args:
+            return self._claim_several_jobs(service)
+
+        if self.boolean_query_parameter('claim'):
+            next_job = service.jobs.claim_next_job()
+            serializer = ClaimedJobSerializer()
+        else:
+            next_job = self._get_next_job(service)
+            serializer = JobSerializer()
+
+        if next_job is None:
+            response = self._response_for_no_job
+        else:
             response = self._get_response_for_job(
-                self._get_next_job(service),
-                service
+                next_job, service, serializer
             )
-        except StopIteration:
-            response = self._response_for_no_job
 
         return response
 
-    @staticmethod
-    def _is_registered(job: Job) -> bool:
-        return job.status is Job.JobStatus.REGISTERED
-
     @staticmethod
     def _get_next_job(service: Service) -> Optional[Job]:
-        registered_jobs = filter(
-            NextJob._is_registered, service.jobs
-        )
-        return next(
-            iter(
-                islice(
-                    sorted(registered_jobs, key=NextJob._get_date_for_job),
-                    1
-                )
-            )
+        return next(iter(service.jobs.registered_jobs(1)), None)
+
+    def _claim_several_jobs(self, service: Service) -> Response:
+        """
+
+        :param service: The service whose jobs are to be claimed
+        :return: A response with the claimed jobs, or a ``204`` response if
+            no jobs could be claimed
+        """
+        count = self.integer_query_parameter(
+            'count', 1, minimum=1, maximum=config.MAXIMUM_CLAIM_COUNT
         )
+        claimed_jobs = service.jobs.claim_next_jobs(count)
 
-    @staticmethod
-    def _get_date_for_job(job: Job) -> datetime:
-        return job.date_submitted
+        if not claimed_jobs:
+            response = self._response_for_no_job
+        else:
+            response = self._get_response_for_jobs(claimed_jobs, service)
+
+        return response
 
     def _get_response_for_job(
-            self, next_job: Job, service: Service
+            self, next_job: Job, service: Service, serializer: JobSerializer
     ) -> Response:
-        serializer = JobSerializer()
-        schema_serializer = JSONSchema(
-            title="Job Schema",
-            description="The schema representing the job"
-        )
+        """
+
+        :param next_job: The job to return
+        :param service: The service to which the job belongs
+        :param serializer: The serializer for the job. Claimed jobs are
+            serialized with their lease tokens
+        :return: A response with the job
+        """
         response = jsonify({
             'data': serializer.dump(next_job).data,
             'meta': {
-                'job_schema': schema_serializer.dump(serializer)
+                'job_schema': self._job_schema(serializer)
+            },
+            'links': {
+                'self': self.self_url(service)
+            }
+        })
+        response.status_code = 200
+        return response
+
+    def _get_response_for_jobs(
+            self, jobs: Sequence[Job], service: Service
+    ) -> Response:
+        serializer = ClaimedJobSerializer()
+        response = jsonify({
+            'data': serializer.dump(jobs, many=True).data,
+            'meta': {
+                'job_schema': self._job_schema(serializer)
             },
             'links': {
                 'self': self.self_url(service)
@@ -146,6 +283,14 @@ class NextJob(AbstractEndpointForService):
         response.status_code = 200
         return response
 
+    @staticmethod
+    def _job_schema(serializer: JobSerializer) -> dict:
+        schema_serializer = JSONSchema(
+            title="Job Schema",
+            description="The schema representing the job"
+        )
+        return schema_serializer.dump(serializer)
+
     @property
     def _response_for_no_job(self) -> Response:
         response = Response()
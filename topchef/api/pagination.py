@@ -0,0 +1,127 @@
+"""
+Contains the cursors used to paginate lists of jobs and services. Job lists
+are sorted by the date on which each job was submitted, and then by the
+job's ID. Service lists are sorted by service ID. A cursor points to the
+last item on a page, and the next page starts at the first item that sorts
+after it. Since the cursor is a position in an index, rather than an
+offset, getting the next page costs the same no matter how far into the
+list the page is.
+
+To clients, the cursor is an opaque URL-safe string. Clients SHOULD NOT
+construct cursors themselves, but SHOULD follow the ``next`` link returned
+by paginated endpoints.
+"""
+import base64
+import binascii
+import json
+from collections import namedtuple
+from datetime import datetime, timezone
+from uuid import UUID
+from topchef.models import Job, Service
+
+__all__ = ['Cursor', 'ServiceCursor']
+
+
+class Cursor(namedtuple('Cursor', ['date_submitted', 'job_id'])):
+    """
+    Describes a position in a list of jobs sorted by
+    ``(date_submitted, job_id)``
+    """
+    _DATE_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+
+    @classmethod
+    def from_job(cls, job: Job) -> 'Cursor':
+        """
+
+        :param job: The last job on a page
+        :return: A cursor pointing to that job
+        """
+        return cls(job.date_submitted, job.id)
+
+    @classmethod
+    def decode(cls, token: str) -> 'Cursor':
+        """
+
+        :param token: A cursor that was previously returned by
+            :meth:`Cursor.encode`
+        :return: The decoded cursor
+        :raises: :exc:`ValueError` if the token is not a valid cursor
+        """
+        try:
+            date_submitted, job_id = json.loads(
+                base64.urlsafe_b64decode(token.encode('ascii')).decode('utf-8')
+            )
+            return cls(
+                datetime.strptime(date_submitted, cls._DATE_FORMAT),
+                UUID(job_id)
+            )
+        except (binascii.Error, UnicodeError, TypeError, ValueError):
+            raise ValueError('%s is not a valid cursor' % token)
+
+    def encode(self) -> str:
+        """
+
+        :return: The cursor as an opaque, URL-safe string
+        """
+        position = json.dumps([
+            self._naive_utc_date.isoformat(timespec='microseconds'),
+            str(self.job_id)
+        ])
+        return base64.urlsafe_b64encode(
+            position.encode('utf-8')
+        ).decode('ascii')
+
+    @property
+    def _naive_utc_date(self) -> datetime:
+        """
+
+        :return: The submission date in UTC, without a time zone. This is
+            how the date is stored in the database
+        """
+        if self.date_submitted.tzinfo is None:
+            return self.date_submitted
+        else:
+            return self.date_submitted.astimezone(
+                timezone.utc
+            ).replace(tzinfo=None)
+
+
+class ServiceCursor(namedtuple('ServiceCursor', ['service_id'])):
+    """
+    Describes a position in a list of services sorted by ``service_id``
+    """
+    @classmethod
+    def from_service(cls, service: Service) -> 'ServiceCursor':
+        """
+
+        :param service: The last service on a page
+        :return: A cursor pointing to that service
+        """
+        return cls(service.id)
+
+    @classmethod
+    def decode(cls, token: str) -> 'ServiceCursor':
+        """
+
+        :param token: A cursor that was previously returned by
+            :meth:`ServiceCursor.encode`
+        :return: The decoded cursor
+        :raises: :exc:`ValueError` if the token is not a valid cursor
+        """
+        try:
+            service_id, = json.loads(
+                base64.urlsafe_b64decode(token.encode('ascii')).decode('utf-8')
+            )
+            return cls(UUID(service_id))
+        except (binascii.Error, UnicodeError, TypeError, ValueError):
+            raise ValueError('%s is not a valid cursor' % token)
+
+    def encode(self) -> str:
+        """
+
+        :return: The cursor as an opaque, URL-safe string
+        """
+        position = json.dumps([str(self.service_id)])
+        return base64.urlsafe_b64encode(
+            position.encode('utf-8')
+        ).decode('ascii')
@@ -2,10 +2,11 @@
 Describes an endpoint where detailed information about the service can be
 obtained
 """
-from datetime import datetime
-from flask import Response, jsonify
+from flask import Response, url_for
+from topchef.json_codec import jsonify
 from topchef.api.abstract_endpoints import AbstractEndpointForService
 from topchef.api.abstract_endpoints import AbstractEndpointForServiceMeta
+from topchef.api.jobs_for_service import JobsForServiceID as JobsForService
 from topchef.models import Service
 from topchef.models.errors import RequestNotJSONError
 from topchef.models.errors import DeserializationError
@@ -43,19 +44,22 @@ class ServiceDetail(AbstractEndpointForService):
                     "job_result_schema": {
                         "type": "object"
                     },
-                    "jobs": [
-                        {
-                        "date_submitted": "2017-08-15T18:29:07.902093+00:00",
-                        "id": "42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7",
-                        "status": "REGISTERED"
-                        }
-                    ],
+                    "job_summary": {
+                        "completed": 12,
+                        "error": 1,
+                        "oldest_registered_job_date":
+                            "2017-08-15T18:29:07.902093+00:00",
+                        "registered": 3,
+                        "working": 1
+                    },
                     "name": "Testing Service",
                     "timeout": 30
                     },
                     "links": {
                         "self":
-                            "/services/495d76fd-044c-4f02-8815-5ec6e7634330"
+                            "/services/495d76fd-044c-4f02-8815-5ec6e7634330",
+                        "jobs":
+                        "/services/495d76fd-044c-4f02-8815-5ec6e7634330/jobs"
                     },
                     "meta": {
                         "service_schema": {
@@ -95,11 +99,17 @@ class ServiceDetail(AbstractEndpointForService):
                                     "title": "job_result_schema",
                                     "type": "object"
                                 },
-                                "jobs": {
-                                    "items": {
-                                    "type": "object"
+                                "job_summary": {
+                                    "properties": {
+                                        "completed": {
+                                            "format": "integer",
+                                            "readonly": true,
+                                            "title": "completed",
+                                            "type": "number"
+                                        },
+                                        ...
                                     },
-                                    "type": "array"
+                                    "type": "object"
                                 },
                                 "name": {
                                     "readonly": true,
@@ -119,6 +129,7 @@ class ServiceDetail(AbstractEndpointForService):
                                 "is_service_available",
                                 "job_registration_schema",
                                 "job_result_schema",
+                                "job_summary",
                                 "name",
                                 "timeout"
                             ],
@@ -128,6 +139,12 @@ class ServiceDetail(AbstractEndpointForService):
                     }
                 }
 
+        The ``job_summary`` counts the service's jobs with each status, and
+        gives the date on which the oldest job still in the queue was
+        submitted. It is computed in the database, so this endpoint takes
+        the same time no matter how many jobs the service has. The jobs
+        themselves are listed, a page at a time, at the ``jobs`` link.
+
         :statuscode 200: The request completed successfully
         :statuscode 404: A service with the ID was not found
 
@@ -138,7 +155,11 @@ class ServiceDetail(AbstractEndpointForService):
 
     def patch(self, service: Service) -> Response:
         """
-        Change the mutable parameters of the service
+        Change the mutable parameters of the service, or check in. Sending
+        this request with no body only checks the service in. Either way,
+        the response has no body, unless the full service document is
+        asked for with ``full=true``. Workers checking in often should not
+        ask for the document, so that each check in stays cheap.
 
         .. :quickref: Service; Change service parameters or check in
 
@@ -158,6 +179,23 @@ class ServiceDetail(AbstractEndpointForService):
 
         **Example Response**
 
+        .. sourcecode:: http
+
+            HTTP/1.1 204 NO CONTENT
+
+        **Example Request For The Full Document**
+
+        .. sourcecode:: http
+
+            PATCH /services/<service_id>?full=true HTTP/1.1
+            Content-Type: application/json
+
+            {
+                "timeout": 30
+            }
+
+        **Example Response With The Full Document**
+
         .. sourcecode:: http
 
             HTTP/1.1 200 OK
@@ -174,47 +212,61 @@ class ServiceDetail(AbstractEndpointForService):
                 "job_result_schema": {
                     "type": "object"
                 },
-                "jobs": [
-                    {
-                        "date_submitted": "2017-08-15T18:29:07.902093+00:00",
-                        "id": "42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7",
-                        "status": "REGISTERED"
-                    }
-                ],
+                "job_summary": {
+                    "completed": 12,
+                    "error": 1,
+                    "oldest_registered_job_date":
+                        "2017-08-15T18:29:07.902093+00:00",
+                    "registered": 3,
+                    "working": 1
+                },
                 "name": "Testing Service",
                 "timeout": 30
             }
 
-        :statuscode 200: The request completed successfully
+        :query full: If ``true``, respond with the service document, as
+            returned by ``GET``. Defaults to ``false``.
+
+        :statuscode 200: The request completed successfully, and the
+            service document was asked for
+        :statuscode 204: The request completed successfully
         :statuscode 400: If an attempt is made to provide JSON as a request
             body, and the JSON is either syntactically or semantically
-            incorrect.
+            incorrect, or if ``full`` is not a boolean.
         :statuscode 404: A service with that ID was not found in the database
 
         :param service: The service to patch
         :return: Reset the service's timeout
         """
+        is_full_document_requested = self.boolean_query_parameter('full')
         service.check_in()
 
         try:
             request_body = self.request_json
         except RequestNotJSONError:
-            return self._handle_request_not_json()
+            pass
         else:
-            return self._handle_service_modification(request_body, service)
+            self._handle_service_modification(request_body, service)
 
-    @staticmethod
-    def _handle_request_not_json() -> Response:
-        response = jsonify({
-            'meta':
-                "Service checked in at %s" % datetime.utcnow().isoformat()
-        })
-        response.status_code = 200
+        if is_full_document_requested:
+            return self._get_detailed_response_for_service(service)
+        else:
+            return self._acknowledgement
+
+    @property
+    def _acknowledgement(self) -> Response:
+        """
+
+        :return: A response with no body, acknowledging a check in or a
+            modification
+        """
+        response = Response()
+        response.status_code = 204
         return response
 
     def _handle_service_modification(
             self, request_body: dict, service: Service
-    ) -> Response:
+    ) -> None:
         serializer = ModifyServiceSerializer()
         deserialized_body, errors = serializer.load(request_body)
 
@@ -224,8 +276,6 @@ class ServiceDetail(AbstractEndpointForService):
 
         self._modify_service(deserialized_body, service)
 
-        return self._get_detailed_response_for_service(service)
-
     def _report_deserialization_errors(self, errors: dict):
         self.errors.extend(
             (DeserializationError(key, errors[key]) for key in errors.keys())
@@ -240,11 +290,25 @@ class ServiceDetail(AbstractEndpointForService):
         response = jsonify({
             'data': serializer.dump(service, many=False).data,
             'meta': {'service_schema': serializer_schema.dump(serializer)},
-            'links': {'self': self.self_url(service)}
+            'links': {
+                'self': self.self_url(service),
+                'jobs': self._jobs_url(service)
+            }
         })
         response.status_code = 200
         return response
 
+    @staticmethod
+    def _jobs_url(service: Service) -> str:
+        """
+
+        :param service: The service whose jobs are to be listed
+        :return: The URL of the paginated list of the service's jobs
+        """
+        return url_for(
+            JobsForService.__name__, service_id=service.id, _external=True
+        )
+
     @staticmethod
     def _modify_service(request_body: dict, service: Service) -> None:
         request_body_keys = request_body.keys()
@@ -1,10 +1,12 @@
 """
 Describes the endpoint for listing services
 """
-from flask import jsonify, Response, request, Request, url_for
+from flask import Response, request, Request, url_for
+from topchef.json_codec import jsonify
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Optional, Sequence
 from topchef.api.abstract_endpoints.abstract_endpoint import AbstractEndpoint
+from topchef.api.pagination import ServiceCursor
 from topchef.api.service_detail import ServiceDetailForServiceID as \
     ServiceDetail
 from topchef.models import ServiceList as ServiceListInterface
@@ -41,7 +43,14 @@ class ServicesList(AbstractEndpoint):
 
     def get(self) -> Response:
         """
-        Returns a list of all services exposed by this API
+        Returns a page of the services exposed by this API, sorted by
+        service ID. The services can be filtered by whether they are
+        available and whether they have timed out. The filters are applied
+        by the database, so that pages stay quick to load when thousands of
+        services are registered. If there are more services after this
+        page, ``links`` has a ``next`` link to the next page, with the same
+        filters. Services are only paginated if a ``limit`` or a ``cursor``
+        is given.
 
         .. :quickref: Service List; Get all the services in the API
 
@@ -124,12 +133,58 @@ class ServicesList(AbstractEndpoint):
                 }
             }
 
+        :query available: If ``true``, only services that are available are
+            returned. If ``false``, only services that are unavailable are
+            returned.
+        :query alive: If ``true``, only services that checked in less than
+            their heartbeat timeout ago are returned. If ``false``, only
+            services that have timed out are returned.
+        :query limit: The maximum number of services on the page. This must
+            be between 1 and ``MAXIMUM_PAGE_SIZE``, and defaults to
+            ``DEFAULT_PAGE_SIZE``. If neither ``limit`` nor ``cursor`` is
+            given, every service is returned, as it was before the list
+            was paginated.
+        :query cursor: The position in the list at which the page starts.
+            Cursors are opaque, and are taken from the ``next`` link of the
+            previous page.
+
         :statuscode 200: The request completed successfully
+        :statuscode 400: The ``available``, ``alive``, ``limit``, or
+            ``cursor`` parameters are invalid
         :return: A Flask response with the appropriate data
         """
+        filters = {
+            'available': self.boolean_query_parameter('available', None),
+            'alive': self.boolean_query_parameter('alive', None)
+        }
+        cursor = self.cursor_query_parameter(cursor_type=ServiceCursor)
+        if cursor is None and 'limit' not in self._request.args:
+            limit = None
+        else:
+            limit = self.page_size_query_parameter()
+
+        services = self.service_list.page(
+            limit + 1 if limit is not None else None,
+            after=cursor.service_id if cursor is not None else None,
+            is_available=filters['available'],
+            is_alive=filters['alive']
+        )
+
+        links = self.links
+        if limit is not None and len(services) > limit:
+            services = services[:limit]
+            links['next'] = url_for(
+                self.__class__.__name__,
+                cursor=ServiceCursor.from_service(services[-1]).encode(),
+                limit=limit, _external=True,
+                **{
+                    name: str(value).lower()
+                    for name, value in filters.items() if value is not None
+                }
+            )
+
         response = jsonify({
-            'data': self._data, 'meta': self._meta, 'links':
-            self.links
+            'data': self._data(services), 'meta': self._meta, 'links': links
         })
         response.status_code = 200
         return response
@@ -247,15 +302,14 @@ class ServicesList(AbstractEndpoint):
 
         return response
 
-    @property
-    def _data(self) -> dict:
+    def _data(self, services: Sequence[Service]) -> dict:
         """
 
-        :return: The JSON corresponding to all the services loaded onto the
-            API
+        :param services: The services on this page
+        :return: The JSON corresponding to the services on this page
         """
         serializer = ServiceOverviewSerializer()
-        service_list, errors = serializer.dump(self.service_list, many=True)
+        service_list, errors = serializer.dump(services, many=True)
 
         if errors:
             self._report_server_serialization_errors(errors)
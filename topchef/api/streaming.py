@@ -0,0 +1,68 @@
+"""
+Contains helpers for streaming long lists of jobs to clients. A streamed
+response has the same shape as any other response from this API, but its
+``data`` array is written one element at a time, while the jobs are read
+from the database in chunks. Only one chunk of jobs is held in memory at a
+time, however many jobs are in the list.
+
+Streaming starts after the endpoint has returned its response, so errors
+that happen part of the way through the stream cannot be reported with an
+``errors`` object. Clients SHOULD treat a stream that does not end in a
+complete JSON document as failed.
+"""
+from typing import Iterable, Iterator, Optional, Sequence
+from topchef.api.pagination import Cursor
+from topchef.json_codec import JSON_CODEC
+from topchef.json_type import JSON_TYPE as JSON
+from topchef.models import Job, JobList
+
+__all__ = ['jobs_in_chunks', 'json_document']
+
+
+def jobs_in_chunks(
+        job_list: JobList, chunk_size: int, after: Optional[Cursor]=None,
+        filters: Sequence[JobList.Filter]=()
+) -> Iterator[Job]:
+    """
+    Iterate over a job list, one page at a time. Each page is a keyset
+    query starting after the last job of the page before it.
+
+    :param job_list: The jobs to iterate over
+    :param chunk_size: The number of jobs to read from the database at once
+    :param after: The position in the list after which to start
+    :param filters: The conditions that every job must match
+    :return: An iterator over the jobs, sorted by submission date and ID
+    """
+    while True:
+        jobs = job_list.page(chunk_size, after=after, filters=filters)
+        yield from jobs
+
+        if len(jobs) < chunk_size:
+            return
+        after = Cursor.from_job(jobs[-1])
+
+
+def json_document(data: Iterable[JSON], **members: JSON) -> Iterator[str]:
+    """
+    Write a JSON object with a ``data`` array, without holding the whole
+    document in memory
+
+    :param data: The elements of the ``data`` array. These are serialized
+        one at a time, as they are consumed
+    :param members: The other members of the JSON object. These are
+        written after the ``data`` array
+    :return: An iterator over the pieces of the JSON document
+    """
+    yield '{"data": ['
+
+    for index, element in enumerate(data):
+        if index:
+            yield ', '
+        yield JSON_CODEC.dumps(element)
+
+    yield ']'
+
+    for key, value in members.items():
+        yield ', %s: %s' % (JSON_CODEC.dumps(key), JSON_CODEC.dumps(value))
+
+    yield '}'
@@ -2,12 +2,15 @@
 Maps the ``/validator`` endpoint
 """
 from .abstract_endpoints import AbstractEndpoint
-from flask import Response, jsonify
+from flask import Response, Request, request
+from topchef.json_codec import jsonify
+from sqlalchemy.orm import Session
 from topchef.serializers import JSONSchema
 from topchef.serializers import JSONSchemaValidator as ValidatorSerializer
 from topchef.models.errors import DeserializationError
 from topchef.models.errors import ValidationError as ReportableValidationError
-from typing import Iterable
+from topchef.validator_cache import VALIDATOR_CACHE
+from typing import Iterable, Callable
 import jsonschema
 
 
@@ -15,6 +18,24 @@ class JSONSchemaValidator(AbstractEndpoint):
     """
     Maps an endpoint for validating objects against JSON Schemas
     """
+    def __init__(
+            self,
+            session: Session,
+            flask_request: Request=request,
+            validator_factory: Callable[
+                [dict], jsonschema.Draft4Validator]=VALIDATOR_CACHE
+    ) -> None:
+        """
+
+        :param session: The database session to use
+        :param flask_request: The request that this endpoint is to process
+        :param validator_factory: A callable that takes in a JSON schema,
+            and returns a validator for that schema. By default, validators
+            are taken from the process-wide validator cache
+        """
+        super(JSONSchemaValidator, self).__init__(session, flask_request)
+        self._validator_factory = validator_factory
+
     def get(self) -> Response:
         """
         Return a schema indicating how the endpoint is to be used. The
@@ -138,7 +159,7 @@ class JSONSchemaValidator(AbstractEndpoint):
             self._report_deserialization_errors(errors)
             raise self.Abort()
 
-        json_schema_validator = jsonschema.Draft4Validator(data['schema'])
+        json_schema_validator = self._validator_factory(data['schema'])
 
         if not json_schema_validator.is_valid(data['object']):
             self._report_validation_errors(
@@ -5,7 +5,6 @@ import os
 import logging
 from logging.handlers import RotatingFileHandler
 from collections import namedtuple, Iterable
-from sqlalchemy import create_engine
 
 LOG = logging.getLogger(__name__)
 
@@ -34,6 +33,39 @@ class Config(Iterable):
 
     # DATABASE
     DATABASE_URI = 'sqlite:///%s/db.sqlite3' % BASE_DIRECTORY
+    DATABASE_POOL_SIZE = 5
+    DATABASE_MAX_OVERFLOW = 10
+    DATABASE_POOL_TIMEOUT = 30
+    DATABASE_POOL_RECYCLE = 3600
+    DATABASE_POOL_PRE_PING = True
+
+    # BLOB STORE
+    BLOB_STORE_DIRECTORY = ''
+    BLOB_STORE_THRESHOLD = 65536
+
+    # JSON
+    JSON_CODEC = 'auto'
+
+    # JSON COMPRESSION
+    JSON_COMPRESSION_THRESHOLD = 1024
+    JSON_COMPRESSION_LEVEL = 1
+
+    # PAGINATION
+    DEFAULT_PAGE_SIZE = 10
+    MAXIMUM_PAGE_SIZE = 100
+    STREAM_CHUNK_SIZE = 500
+
+    # JOB QUEUE
+    MAXIMUM_CLAIM_COUNT = 100
+    MAXIMUM_LONG_POLL_WAIT = 30
+    MAXIMUM_JOBS_PER_REQUEST = 10000
+    JOB_LEASE_DURATION = 300
+    LEASE_REAPER_INTERVAL = 30
+    HEARTBEAT_WRITE_INTERVAL = 5
+    SERVICE_DELETION_CHUNK_SIZE = 1000
+
+    # JSON SCHEMA VALIDATION
+    VALIDATOR_CACHE_SIZE = 256
 
     def __init__(self, environment=os.environ):
 
@@ -65,8 +97,6 @@ class Config(Iterable):
         for parameter in new_parameters:
             self.__dict__[parameter.key] = parameter.value
 
-        self._engine = create_engine(self.DATABASE_URI)
-
         if self.LOGFILE:
             hdlr = RotatingFileHandler(self.LOGFILE, maxBytes=5*1024*1024)
             formatter = logging.Formatter(
@@ -100,10 +130,6 @@ class Config(Iterable):
     def parameter_dict(self):
         return {attribute: self.__dict__[attribute] for attribute in self}
 
-    @property
-    def database_engine(self):
-        return self._engine
-
     @staticmethod
     def type_convert(value_from_environment):
         try:
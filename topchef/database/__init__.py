@@ -15,5 +15,12 @@ the MySQL record agree.
 """
 from .uuid_database_type import UUID
 from .models import Job, Service, JobSet
+from .job_counters import adjust_job_counters, job_counts
+from .job_counters import repair_job_counters
+from .job_leases import reap_expired_leases
+from .heartbeats import write_heartbeats, is_alive
+from .service_deletion import delete_jobs_of_service, delete_service
+from .identity_map import loaded_instance
+from .json_filters import json_path_matches, is_stored_out_of_line
 from .schemas.abstract_database_schema import AbstractDatabaseSchema as \
     DatabaseSchema
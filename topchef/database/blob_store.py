@@ -0,0 +1,210 @@
+"""
+Contains an optional store for JSON documents that are too large to keep in
+the ``jobs`` table.
+
+Job parameters and results are usually small, but experiment results can
+run to tens of kilobytes. Keeping those in the ``jobs`` table makes every
+page of the table hold fewer jobs, and so makes every query on the table
+slower. When a blob store is configured with ``BLOB_STORE_DIRECTORY``,
+documents longer than ``BLOB_STORE_THRESHOLD`` bytes are written to a file
+in that directory instead, and the row only holds a reference to the file,
+of the form
+
+.. sourcecode:: json
+
+    {"$blob": "<SHA-256 of the document>"}
+
+Files are named after the SHA-256 hash of their contents, so identical
+documents are stored once, and a file never changes after it is written.
+
+So that a document is never mistaken for a reference, any document that
+is an object whose only key is ``$blob`` or ``$document`` is wrapped
+before it is written, whether or not a blob store is configured, as
+
+.. sourcecode:: json
+
+    {"$document": <the document>}
+
+and unwrapped again when it is read.
+
+.. note::
+
+    Files are never deleted, even if the jobs referring to them are. Every
+    process running the API MUST use the same directory.
+"""
+import hashlib
+import os
+import re
+from tempfile import NamedTemporaryFile
+from typing import Any, Optional
+from topchef.config import config
+from topchef.json_codec import JSON_CODEC
+
+__all__ = ['BlobStore', 'BLOB_STORE']
+
+
+class BlobStore(object):
+    """
+    Stores documents in files named after their SHA-256 hashes
+    """
+    _REFERENCE_KEY = '$blob'
+    _ENVELOPE_KEY = '$document'
+    _DIGEST_PATTERN = re.compile('^[0-9a-f]{64}$')
+
+    def __init__(self, directory: str, threshold: int) -> None:
+        """
+
+        :param directory: The directory in which documents are stored
+        :param threshold: The length, in bytes, above which documents are
+            stored in a file
+        """
+        self.directory = directory
+        self.threshold = threshold
+
+    def put(self, data: bytes) -> str:
+        """
+        Write a document, unless an identical one has already been written.
+        The document is written to a temporary file, which is then renamed,
+        so that a document that is only partly written is never read. If
+        either step fails, the temporary file is removed.
+
+        :param data: The document to store
+        :return: The SHA-256 hash of the document, which is used to read it
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            blob = NamedTemporaryFile(dir=os.path.dirname(path), delete=False)
+            try:
+                with blob:
+                    blob.write(data)
+                os.replace(blob.name, path)
+            except Exception:
+                os.unlink(blob.name)
+                raise
+
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """
+
+        :param digest: The SHA-256 hash of the document
+        :return: The document
+        :raises: :exc:`KeyError` if no document has this hash
+        """
+        try:
+            with open(self._path(digest), 'rb') as blob:
+                return blob.read()
+        except FileNotFoundError:
+            raise KeyError('A document with hash %s does not exist' % digest)
+
+    def dump(self, document: str) -> str:
+        """
+
+        :param document: A JSON document that is about to be written to the
+            database
+        :return: The document, if it is no longer than the threshold.
+            Otherwise, the document is stored, and a reference to it is
+            returned
+        """
+        reference = self.store(document)
+        if reference is None:
+            return document
+        else:
+            return JSON_CODEC.dumps(reference)
+
+    def store(self, document: str) -> Optional[dict]:
+        """
+
+        :param document: A JSON document that is about to be written to the
+            database
+        :return: ``None``, if the document is no longer than the threshold.
+            Otherwise, the document is stored, and a reference to it is
+            returned
+        """
+        data = document.encode('utf-8')
+        if len(data) <= self.threshold:
+            return None
+        else:
+            return {self._REFERENCE_KEY: self.put(data)}
+
+    def load(self, value: Any) -> Any:
+        """
+
+        :param value: A JSON value that was read from the database
+        :return: The stored document, if the value refers to one.
+            Otherwise, the value itself
+        """
+        digest = self._digest_referred_to(value)
+        if digest is None:
+            return value
+        else:
+            return JSON_CODEC.loads(self.get(digest))
+
+    @classmethod
+    def escape(cls, value: Any, escape_strings: bool=False) -> Any:
+        """
+
+        :param value: A JSON value that is about to be encoded and written
+            to the database
+        :param escape_strings: If ``True``, strings are wrapped in an
+            envelope as well
+        :return: The value wrapped in an envelope, if it could be read back
+            as a reference or as an envelope, or if it is a string that
+            is to be escaped. Otherwise, the value itself
+        """
+        if escape_strings and isinstance(value, str):
+            return {cls._ENVELOPE_KEY: value}
+        elif isinstance(value, dict) and len(value) == 1 and (
+                cls._REFERENCE_KEY in value or cls._ENVELOPE_KEY in value
+        ):
+            return {cls._ENVELOPE_KEY: value}
+        else:
+            return value
+
+    @classmethod
+    def unescape(cls, value: Any) -> Any:
+        """
+
+        :param value: A JSON value that was read from the database, after
+            any reference in it has been loaded
+        :return: The value in the envelope, if the value is one. Otherwise,
+            the value itself
+        """
+        if isinstance(value, dict) and len(value) == 1 and \
+                cls._ENVELOPE_KEY in value:
+            return value[cls._ENVELOPE_KEY]
+        else:
+            return value
+
+    def _digest_referred_to(self, value: Any) -> Optional[str]:
+        """
+        Documents shaped like references are escaped before they are
+        written, so a value of this shape is always a reference
+
+        :param value: A JSON value that was read from the database
+        :return: The hash in the value, if the value is a reference to a
+            stored document, otherwise ``None``
+        """
+        if isinstance(value, dict) and len(value) == 1:
+            digest = value.get(self._REFERENCE_KEY)
+            if isinstance(digest, str) and self._DIGEST_PATTERN.match(digest):
+                return digest
+        return None
+
+    def _path(self, digest: str) -> str:
+        """
+
+        :param digest: The SHA-256 hash of a document
+        :return: The path of the file holding the document. Files are
+            spread over subdirectories named after the first two characters
+            of their hash, so that no directory holds too many files
+        """
+        return os.path.join(self.directory, digest[:2], digest[2:])
+
+
+BLOB_STORE = BlobStore(
+    config.BLOB_STORE_DIRECTORY, config.BLOB_STORE_THRESHOLD
+) if config.BLOB_STORE_DIRECTORY else None
@@ -0,0 +1,110 @@
+"""
+Writes the dates on which services last checked in. Services check in far
+more often than anything else in the API writes to the database, so check
+ins are collected in memory and written here in batches, rather than with
+one ``UPDATE`` for every check in.
+
+A service is alive until ``heartbeat_timeout_seconds`` have passed since it
+last checked in. :func:`is_alive` compares that deadline to the current
+date in SQL, so that services can be filtered by whether they are alive
+without loading them. Adding a number of seconds to a date is spelled
+differently by each database, so the deadline is compiled separately for
+each dialect.
+"""
+from datetime import datetime
+from typing import Mapping
+from uuid import UUID
+from sqlalchemy import and_, bindparam, DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.functions import FunctionElement
+from .schemas import database
+
+__all__ = ['write_heartbeats', 'is_alive']
+
+_SERVICES = database.services
+
+
+class _SecondsAfter(FunctionElement):
+    """
+    The date that is a number of seconds after another date. Both arguments
+    may be columns
+    """
+    name = 'seconds_after'
+    type = DateTime()
+
+
+@compiles(_SecondsAfter)
+def _seconds_after(element: _SecondsAfter, compiler, **kwargs) -> str:
+    date, seconds = element.clauses
+    return "(%s + %s * INTERVAL '1 second')" % (
+        compiler.process(date, **kwargs), compiler.process(seconds, **kwargs)
+    )
+
+
+@compiles(_SecondsAfter, 'sqlite')
+def _seconds_after_on_sqlite(
+        element: _SecondsAfter, compiler, **kwargs
+) -> str:
+    """
+    SQLite stores dates as text. The deadline is written in the same format,
+    to the millisecond, so that it can be compared with stored dates
+    """
+    date, seconds = element.clauses
+    return "strftime('%%Y-%%m-%%d %%H:%%M:%%f', %s, '+' || %s || ' seconds')" \
+        % (
+            compiler.process(date, **kwargs),
+            compiler.process(seconds, **kwargs)
+        )
+
+
+@compiles(_SecondsAfter, 'mysql')
+def _seconds_after_on_mysql(
+        element: _SecondsAfter, compiler, **kwargs
+) -> str:
+    date, seconds = element.clauses
+    return 'DATE_ADD(%s, INTERVAL %s SECOND)' % (
+        compiler.process(date, **kwargs), compiler.process(seconds, **kwargs)
+    )
+
+
+def is_alive(now: datetime) -> ColumnElement:
+    """
+
+    :param now: The date at which services are checked
+    :return: A condition on the ``services`` table that holds for every
+        service whose last check in written to the database was less than
+        ``heartbeat_timeout_seconds`` before ``now``
+    """
+    return _SecondsAfter(
+        _SERVICES.c.last_checked_in, _SERVICES.c.heartbeat_timeout_seconds
+    ) > now
+
+
+def write_heartbeats(
+        session: Session, heartbeats: Mapping[UUID, datetime]
+) -> None:
+    """
+    Write the last check in of several services with one ``UPDATE``
+    statement, executed once for each service in a single batch. A date is
+    only written if it is later than the one in the database, so that a
+    process flushing older heartbeats cannot undo a newer check in written
+    by another process.
+
+    :param session: The session in whose transaction the dates are written
+    :param heartbeats: The date on which each service last checked in
+    """
+    if not heartbeats:
+        return
+
+    session.execute(
+        _SERVICES.update().where(and_(
+            _SERVICES.c.service_id == bindparam('heartbeat_service_id'),
+            _SERVICES.c.last_checked_in < bindparam('heartbeat_date')
+        )).values(last_checked_in=bindparam('heartbeat_date')),
+        [
+            {'heartbeat_service_id': service_id, 'heartbeat_date': date}
+            for service_id, date in heartbeats.items()
+        ]
+    )
@@ -0,0 +1,30 @@
+"""
+Finds objects that are already loaded into a session. A session keeps one
+object for each row that it has loaded, keyed by the row's primary key.
+Looking an object up in this identity map costs no round trip to the
+database, so primary key lookups SHOULD try it before querying.
+"""
+from typing import Any, Optional, Type
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+__all__ = ['loaded_instance']
+
+
+def loaded_instance(
+        session: Session, model: Type[Any], primary_key: Any
+) -> Optional[Any]:
+    """
+
+    :param session: The session to look in
+    :param model: The mapped class of the object
+    :param primary_key: The primary key of the object
+    :return: The object with this primary key, if the session has loaded it
+        and it has not been marked for deletion, otherwise ``None``
+    """
+    instance = session.identity_map.get(identity_key(model, primary_key))
+
+    if instance is None or instance in session.deleted:
+        return None
+    else:
+        return instance
@@ -0,0 +1,205 @@
+"""
+Keeps the ``service_job_counters`` table up to date. This table holds the
+number of jobs that each service has with each status, so that the length
+of a service's queue can be read from one row, instead of by counting the
+service's jobs.
+
+The counters are changed in the same transaction as the jobs that they
+count. Jobs that are added, changed, or deleted through the ORM are counted
+by a listener that runs after every flush. Jobs that are written with
+statements that bypass the ORM's unit of work, like bulk inserts and
+set-based ``UPDATE`` statements, MUST be counted by calling
+:func:`adjust_job_counters` in the same transaction.
+
+If the counters ever disagree with the jobs, for instance because jobs were
+changed by hand in the database, :func:`repair_job_counters` recomputes
+every counter from the jobs table.
+"""
+from collections import Counter
+from typing import Dict, Mapping, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import and_, event, func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import get_history
+from sqlalchemy.orm.session import UOWTransaction
+from sqlalchemy.sql.dml import Insert
+from .models import Job, Service
+from .schemas import database, JobStatus
+
+__all__ = ['adjust_job_counters', 'job_counts', 'repair_job_counters']
+
+_COUNTERS = database.service_job_counters
+_JOBS = database.jobs
+
+
+def adjust_job_counters(
+        session: Session, changes: Mapping[Tuple[UUID, JobStatus], int]
+) -> None:
+    """
+    Add to or subtract from the number of jobs that services have with each
+    status. Counters are changed in a consistent order, so that two
+    transactions changing the same counters cannot deadlock.
+
+    :param session: The session in whose transaction the jobs were written
+    :param changes: The change in the number of jobs for each
+        ``(service_id, status)`` pair
+    """
+    for (service_id, status), change in sorted(
+            changes.items(), key=_lock_order
+    ):
+        if not change:
+            continue
+
+        update = _COUNTERS.update().where(and_(
+            _COUNTERS.c.service_id == service_id,
+            _COUNTERS.c.status == status
+        )).values(number_of_jobs=_COUNTERS.c.number_of_jobs + change)
+
+        if not session.execute(update).rowcount:
+            _create_counter(session, service_id, status)
+            session.execute(update)
+
+
+def _create_counter(
+        session: Session, service_id: UUID, status: JobStatus
+) -> None:
+    """
+    Make a counter of zero jobs, unless another transaction has made it
+    since it was found to be missing. The ``INSERT`` skips the counter if
+    it exists, instead of failing on the duplicate primary key, so that two
+    transactions counting the first job of a service with some status
+    cannot make each other fail.
+
+    :param session: The session in whose transaction the counter is made
+    :param service_id: The ID of the service whose jobs are counted
+    :param status: The status of the jobs that are counted
+    """
+    values = {
+        'service_id': service_id, 'status': status, 'number_of_jobs': 0
+    }
+    insert = _insert_ignoring_duplicates(session.get_bind().dialect.name)
+
+    if insert is not None:
+        session.execute(insert.values(values))
+        return
+
+    try:
+        with session.begin_nested():
+            session.execute(_COUNTERS.insert().values(values))
+    except IntegrityError:
+        pass
+
+
+def _insert_ignoring_duplicates(dialect_name: str) -> Optional[Insert]:
+    """
+
+    :param dialect_name: The name of the database's SQL dialect
+    :return: An ``INSERT`` into the counters that does nothing for a
+        counter that already exists, or ``None`` if the dialect cannot
+        express one
+    """
+    if dialect_name == 'postgresql':
+        return postgresql.insert(_COUNTERS).on_conflict_do_nothing()
+    elif dialect_name == 'sqlite':
+        return _COUNTERS.insert().prefix_with('OR IGNORE')
+    elif dialect_name == 'mysql':
+        return _COUNTERS.insert().prefix_with('IGNORE')
+    else:
+        return None
+
+
+def _lock_order(
+        change: Tuple[Tuple[UUID, JobStatus], int]
+) -> Tuple[str, str]:
+    """
+
+    :param change: A change to the counter for a service and a status
+    :return: The key by which changes are sorted before they are made
+    """
+    (service_id, status), _ = change
+    return str(service_id), status.value
+
+
+def job_counts(session: Session, service_id: UUID) -> Dict[JobStatus, int]:
+    """
+
+    :param session: The session to use for reading the counters. Jobs
+        pending in this session are flushed, and so counted, first
+    :param service_id: The ID of the service whose jobs are to be counted
+    :return: The number of jobs that the service has with each status
+    """
+    counts = {status: 0 for status in JobStatus}
+    counts.update(session.query(
+        _COUNTERS.c.status, _COUNTERS.c.number_of_jobs
+    ).filter(_COUNTERS.c.service_id == service_id).all())
+    return counts
+
+
+def repair_job_counters(session: Session) -> None:
+    """
+    Throw away all the counters, and count every service's jobs again from
+    the jobs table. This is done in the session's transaction, so the
+    counters are never seen half-repaired.
+
+    :param session: The session in which the counters are to be repaired
+    """
+    session.execute(_COUNTERS.delete())
+    session.execute(_COUNTERS.insert().from_select(
+        ['service_id', 'status', 'number_of_jobs'],
+        select([_JOBS.c.service_id, _JOBS.c.status, func.count()]).where(
+            _JOBS.c.status.isnot(None)
+        ).group_by(_JOBS.c.service_id, _JOBS.c.status)
+    ))
+
+
+@event.listens_for(Session, 'after_flush')
+def _count_flushed_jobs(session: Session, _: UOWTransaction) -> None:
+    """
+    Count the jobs that were inserted, deleted, or had their status changed
+    in a flush. The session's ``new``, ``dirty`` and ``deleted`` collections
+    and the history of each attribute still describe the flush at this
+    point.
+
+    :param session: The session that was flushed
+    """
+    deleted_service_ids = {
+        service.id for service in session.deleted
+        if isinstance(service, Service)
+    }
+    changes = Counter()
+
+    for job in _jobs_in(session.new):
+        changes[(job.service_id, job.status)] += 1
+
+    for job in _jobs_in(session.dirty):
+        history = get_history(job, 'status')
+        if history.deleted and history.added:
+            changes[(job.service_id, history.deleted[0])] -= 1
+            changes[(job.service_id, history.added[0])] += 1
+
+    for job in _jobs_in(session.deleted):
+        changes[(job.service_id, job.status)] -= 1
+
+    adjust_job_counters(session, {
+        (service_id, status): change
+        for (service_id, status), change in changes.items()
+        if service_id not in deleted_service_ids and status is not None
+    })
+
+    if deleted_service_ids:
+        session.execute(_COUNTERS.delete().where(
+            _COUNTERS.c.service_id.in_(deleted_service_ids)
+        ))
+
+
+def _jobs_in(instances) -> Tuple[Job, ...]:
+    """
+
+    :param instances: Some of the objects in a session
+    :return: The jobs among those objects
+    """
+    return tuple(
+        instance for instance in instances if isinstance(instance, Job)
+    )
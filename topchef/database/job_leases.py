@@ -0,0 +1,67 @@
+"""
+Returns jobs whose leases have expired to their services' queues.
+
+A job that is claimed by a worker is leased to that worker until the job's
+``lease_expires_at`` date. The worker can extend its lease for as long as it
+is working on the job. If the worker dies, the lease runs out, and
+:func:`reap_expired_leases` puts the job back in the ``REGISTERED`` state,
+so that another worker can claim it.
+"""
+from datetime import datetime
+from typing import Dict, Optional
+from uuid import UUID, uuid4
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+from .job_counters import adjust_job_counters
+from .schemas import database, JobStatus
+
+__all__ = ['reap_expired_leases']
+
+_JOBS = database.jobs
+
+
+def reap_expired_leases(
+        session: Session, now: Optional[datetime]=None
+) -> Dict[UUID, int]:
+    """
+    Return every ``WORKING`` job whose lease expired before ``now`` to the
+    ``REGISTERED`` state, with one ``UPDATE`` statement. The reaped jobs are
+    given a new lease token that no worker holds, so that they can be told
+    apart from every other job in the same transaction, and counted. Since
+    the lease token is only meaningful while a job is ``WORKING``, the
+    token is replaced as soon as the job is claimed again.
+
+    :param session: The session in whose transaction the jobs are reaped
+    :param now: The date against which leases are checked. Defaults to the
+        current UTC date
+    :return: The number of jobs that were reaped from each service
+    """
+    if now is None:
+        now = datetime.utcnow()
+    sweep_token = uuid4()
+
+    result = session.execute(_JOBS.update().where(and_(
+        _JOBS.c.status == JobStatus.WORKING,
+        _JOBS.c.lease_expires_at < now
+    )).values(
+        status=JobStatus.REGISTERED,
+        lease_token=sweep_token,
+        lease_expires_at=None
+    ))
+
+    if not result.rowcount:
+        return {}
+
+    reaped_jobs = dict(session.execute(
+        select([_JOBS.c.service_id, func.count()]).where(
+            _JOBS.c.lease_token == sweep_token
+        ).group_by(_JOBS.c.service_id)
+    ).fetchall())
+
+    changes = {}
+    for service_id, number_of_jobs in reaped_jobs.items():
+        changes[(service_id, JobStatus.WORKING)] = -number_of_jobs
+        changes[(service_id, JobStatus.REGISTERED)] = number_of_jobs
+    adjust_job_counters(session, changes)
+
+    return reaped_jobs
@@ -0,0 +1,335 @@
+"""
+Compiles conditions on values inside JSON columns, so that jobs can be
+filtered by their parameters and results without loading them. Each
+database has its own functions for reaching into a JSON document, so the
+conditions are compiled separately for each dialect:
+
+* SQLite uses the functions of the JSON1 extension
+* PostgreSQL uses the ``#>`` and ``#>>`` operators on its ``json`` type
+* MySQL uses the functions of its ``JSON`` type
+
+A condition only holds if the value at the path exists and has the same
+JSON type as the value it is compared to, on every database.
+
+Documents that were compressed, or that were moved to the blob store, are
+opaque to the database, and so are documents wrapped in an envelope because
+they looked like references to the blob store, and rows written to a JSON
+type as a JSON string holding the document. :func:`is_stored_out_of_line`
+finds all of those, so that they can be checked after they have been
+loaded.
+"""
+from typing import Any, Sequence, Union
+from sqlalchemy import Boolean, Text, bindparam
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.functions import FunctionElement
+from topchef.json_codec import JSON_CODEC
+
+__all__ = ['json_path_matches', 'is_stored_out_of_line']
+
+_BLOB_REFERENCE_PATH = ('$blob',)
+_ENVELOPE_PATH = ('$document',)
+
+_SQLITE_TYPES = {
+    'string': ('text',),
+    'number': ('integer', 'real'),
+    'boolean': ('true', 'false'),
+    'null': ('null',)
+}
+
+_MYSQL_TYPES = {
+    'string': ('STRING',),
+    'number': ('INTEGER', 'UNSIGNED INTEGER', 'DOUBLE', 'DECIMAL'),
+    'boolean': ('BOOLEAN',),
+    'null': ('NULL',)
+}
+
+_POSTGRESQL_CASTS = {
+    'string': '%s COLLATE "C"',
+    'number': 'CAST(%s AS NUMERIC)',
+    'boolean': 'CAST(%s AS BOOLEAN)'
+}
+
+
+class _JSONPathMatches(FunctionElement):
+    """
+    Whether the value at a path in a JSON document compares with a value
+    as an operator requires
+    """
+    name = 'json_path_matches'
+    type = Boolean()
+
+    def __init__(
+            self, document: ColumnElement, path: Sequence[Union[str, int]],
+            operator: str, value: Any, json_type: str
+    ) -> None:
+        """
+
+        :param document: The column holding the document
+        :param path: The object keys and array indices leading to the value
+        :param operator: The SQL comparison operator
+        :param value: The value to compare with
+        :param json_type: The JSON type of ``value``
+        """
+        self.path = tuple(path)
+        self.operator = operator
+        self.value = value
+        self.json_type = json_type
+        super(_JSONPathMatches, self).__init__(document)
+
+
+class _IsStoredOutOfLine(FunctionElement):
+    """
+    Whether a document is compressed, is a reference to a document in the
+    blob store, or is wrapped in an envelope
+    """
+    name = 'is_stored_out_of_line'
+    type = Boolean()
+
+
+def json_path_matches(
+        document: ColumnElement, path: Sequence[Union[str, int]],
+        operator: str, value: Any, json_type: str
+) -> ColumnElement:
+    """
+
+    :param document: The column holding the JSON documents
+    :param path: The object keys and array indices leading to the value
+    :param operator: One of ``=``, ``!=``, ``<``, ``<=``, ``>`` or ``>=``.
+        Only ``=`` may be used with ``None``, and only ``=`` and ``!=``
+        with booleans
+    :param value: A string, number, boolean or ``None`` to compare with
+    :param json_type: The JSON type of ``value``, which is one of
+        ``string``, ``number``, ``boolean`` or ``null``
+    :return: A condition that holds for every row whose document holds a
+        value of the same type at the path, comparing with ``value`` as
+        ``operator`` requires
+    """
+    return _JSONPathMatches(document, path, operator, value, json_type)
+
+
+def is_stored_out_of_line(document: ColumnElement) -> ColumnElement:
+    """
+
+    :param document: The column holding the JSON documents
+    :return: A condition that holds for every row whose document cannot be
+        read by the database. It also holds for some documents that only
+        have a top-level ``$blob`` or ``$document`` key, which are checked
+        after they have been loaded all the same
+    """
+    return _IsStoredOutOfLine(document)
+
+
+def _json_path(path: Sequence[Union[str, int]]) -> str:
+    """
+
+    :param path: The object keys and array indices leading to a value
+    :return: The path in the syntax used by SQLite and MySQL. Every key is
+        quoted, so that keys are never read as part of the syntax
+    """
+    return '$' + ''.join(
+        '[%d]' % key if isinstance(key, int)
+        else '.%s' % JSON_CODEC.dumps(key)
+        for key in path
+    )
+
+
+def _bound(compiler, value: Any, **kwargs) -> str:
+    """
+
+    :param compiler: The compiler of the statement
+    :param value: A value to send separately from the statement
+    :return: The placeholder for the value
+    """
+    return compiler.process(bindparam(None, value, unique=True), **kwargs)
+
+
+def _postgresql_path(
+        compiler, path: Sequence[Union[str, int]], **kwargs
+) -> str:
+    """
+
+    :param compiler: The compiler of the statement
+    :param path: The object keys and array indices leading to a value
+    :return: The placeholder for the path, as the array of text taken by
+        the ``#>`` and ``#>>`` operators
+    """
+    return compiler.process(bindparam(
+        None, [str(key) for key in path],
+        type_=postgresql.ARRAY(Text), unique=True
+    ), **kwargs)
+
+
+def _in_list(names: Sequence[str]) -> str:
+    """
+
+    :param names: The names of JSON types
+    :return: The names, as a list of SQL strings
+    """
+    return ', '.join("'%s'" % name for name in names)
+
+
+@compiles(_JSONPathMatches)
+def _json_path_matches(element: _JSONPathMatches, compiler, **kwargs):
+    raise CompileError(
+        'Filtering JSON documents is not supported on %s' %
+        compiler.dialect.name
+    )
+
+
+@compiles(_IsStoredOutOfLine)
+def _is_stored_out_of_line(element: _IsStoredOutOfLine, compiler, **kwargs):
+    raise CompileError(
+        'Filtering JSON documents is not supported on %s' %
+        compiler.dialect.name
+    )
+
+
+@compiles(_JSONPathMatches, 'sqlite')
+def _json_path_matches_on_sqlite(
+        element: _JSONPathMatches, compiler, **kwargs
+) -> str:
+    """
+    JSON1 reads booleans as ``1`` and ``0``. Its functions fail on text
+    that is not JSON, so compressed documents are skipped with ``CASE``
+    """
+    document, = element.clauses
+    document = compiler.process(document, **kwargs)
+
+    condition = 'json_type(%s, %s) IN (%s)' % (
+        document, _bound(compiler, _json_path(element.path), **kwargs),
+        _in_list(_SQLITE_TYPES[element.json_type])
+    )
+    if element.json_type != 'null':
+        value = int(element.value) if element.json_type == 'boolean' \
+            else element.value
+        condition += ' AND json_extract(%s, %s) %s %s' % (
+            document, _bound(compiler, _json_path(element.path), **kwargs),
+            element.operator, _bound(compiler, value, **kwargs)
+        )
+
+    return 'CASE WHEN json_valid(%s) THEN %s ELSE 0 END' % (
+        document, condition
+    )
+
+
+@compiles(_IsStoredOutOfLine, 'sqlite')
+def _is_stored_out_of_line_on_sqlite(
+        element: _IsStoredOutOfLine, compiler, **kwargs
+) -> str:
+    document, = element.clauses
+    document = compiler.process(document, **kwargs)
+    return (
+        "CASE WHEN json_valid(%s) THEN json_type(%s, %s) IS 'text' "
+        "OR json_type(%s, %s) IS NOT NULL ELSE %s IS NOT NULL END"
+    ) % (
+        document, document,
+        _bound(compiler, _json_path(_BLOB_REFERENCE_PATH), **kwargs),
+        document, _bound(compiler, _json_path(_ENVELOPE_PATH), **kwargs),
+        document
+    )
+
+
+@compiles(_JSONPathMatches, 'postgresql')
+def _json_path_matches_on_postgresql(
+        element: _JSONPathMatches, compiler, **kwargs
+) -> str:
+    """
+    The value at the path is read as text with ``#>>``, and cast to the
+    type of the value it is compared with. The cast is only made once
+    ``json_typeof`` has checked the type, since PostgreSQL does not
+    evaluate ``AND`` in order. Strings are compared by code point, as
+    they are in Python
+    """
+    document, = element.clauses
+    document = compiler.process(document, **kwargs)
+
+    is_of_type = "json_typeof(%s #> %s) = '%s'" % (
+        document, _postgresql_path(compiler, element.path, **kwargs),
+        element.json_type
+    )
+    if element.json_type == 'null':
+        return is_of_type
+
+    return 'CASE WHEN %s THEN %s %s %s ELSE false END' % (
+        is_of_type,
+        _POSTGRESQL_CASTS[element.json_type] % '(%s #>> %s)' % (
+            document, _postgresql_path(compiler, element.path, **kwargs)
+        ),
+        element.operator, _bound(compiler, element.value, **kwargs)
+    )
+
+
+@compiles(_IsStoredOutOfLine, 'postgresql')
+def _is_stored_out_of_line_on_postgresql(
+        element: _IsStoredOutOfLine, compiler, **kwargs
+) -> str:
+    """
+    Documents are never compressed on PostgreSQL, so only references to
+    the blob store and envelopes are looked for, along with rows that hold
+    their document encoded as a JSON string
+    """
+    document, = element.clauses
+    document = compiler.process(document, **kwargs)
+    return (
+        "(json_typeof(%s) = 'string' OR json_typeof(%s #> %s) = 'string' "
+        "OR (%s #> %s) IS NOT NULL)"
+    ) % (
+        document, document,
+        _postgresql_path(compiler, _BLOB_REFERENCE_PATH, **kwargs),
+        document, _postgresql_path(compiler, _ENVELOPE_PATH, **kwargs)
+    )
+
+
+@compiles(_JSONPathMatches, 'mysql')
+def _json_path_matches_on_mysql(
+        element: _JSONPathMatches, compiler, **kwargs
+) -> str:
+    """
+    The value at the path is compared with the value cast to ``JSON``, so
+    that MySQL compares them as JSON values. Documents are checked with
+    ``JSON_VALID`` first, in case the column is text holding compressed
+    documents
+    """
+    document, = element.clauses
+    document = compiler.process(document, **kwargs)
+
+    condition = 'JSON_TYPE(JSON_EXTRACT(%s, %s)) IN (%s)' % (
+        document, _bound(compiler, _json_path(element.path), **kwargs),
+        _in_list(_MYSQL_TYPES[element.json_type])
+    )
+    if element.json_type != 'null':
+        condition += ' AND JSON_EXTRACT(%s, %s) %s CAST(%s AS JSON)' % (
+            document, _bound(compiler, _json_path(element.path), **kwargs),
+            element.operator,
+            _bound(compiler, JSON_CODEC.dumps(element.value), **kwargs)
+        )
+
+    return 'CASE WHEN JSON_VALID(%s) THEN %s ELSE false END' % (
+        document, condition
+    )
+
+
+@compiles(_IsStoredOutOfLine, 'mysql')
+def _is_stored_out_of_line_on_mysql(
+        element: _IsStoredOutOfLine, compiler, **kwargs
+) -> str:
+    """
+    Rows that hold their document encoded as a JSON string are found as
+    well
+    """
+    document, = element.clauses
+    document = compiler.process(document, **kwargs)
+    return (
+        "CASE WHEN JSON_VALID(%s) THEN JSON_TYPE(%s) = 'STRING' "
+        "OR JSON_TYPE(JSON_EXTRACT(%s, %s)) = 'STRING' "
+        "OR JSON_EXTRACT(%s, %s) IS NOT NULL "
+        "ELSE %s IS NOT NULL END"
+    ) % (
+        document, document, document,
+        _bound(compiler, _json_path(_BLOB_REFERENCE_PATH), **kwargs),
+        document, _bound(compiler, _json_path(_ENVELOPE_PATH), **kwargs),
+        document
+    )
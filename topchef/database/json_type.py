@@ -14,14 +14,31 @@ is a more elegant solution, as databases that support JSON make some effort
 of checking that the JSON placed into a relational database is at least
 syntactically correct. The type defined here will use a JSON type on MySQL
 and PostgreSQL. If these types are not available, it will default into
-storing the JSON as a string.
+storing the JSON as a string, encoded and decoded with
+:data:`topchef.json_codec.JSON_CODEC`. On MySQL and PostgreSQL, documents
+are given to the database's JSON type as they are, so that the database
+can read into them.
+
+A column of this type can be given a
+:class:`topchef.database.blob_store.BlobStore`, in which case documents
+larger than the store's threshold are kept in the store, and the column
+only holds a reference to them. Documents that look like references are
+escaped by every column of this type, with or without a store.
+
+:class:`CompressedJSON` additionally compresses documents with zlib, on
+databases where JSON is stored as text. Rows written before compression was
+turned on are read as they are.
 """
 from sqlalchemy import TypeDecorator
 from sqlalchemy.types import VARCHAR
 from sqlalchemy import dialects
 from sqlalchemy.dialects import postgresql, mysql
-import json
+import base64
+import zlib
 from typing import Union, Optional
+from topchef.config import config
+from topchef.json_codec import JSON_CODEC
+from .blob_store import BlobStore
 
 DialectType = Union[postgresql.UUID, VARCHAR]
 ValueType = Optional[Union[dict, str]]
@@ -36,6 +53,20 @@ class JSON(TypeDecorator):
     impl = VARCHAR
     _MAX_VARCHAR_LIMIT = 100000
 
+    def __init__(
+            self, *args, blob_store: Optional[BlobStore]=None, **kwargs
+    ) -> None:
+        """
+
+        :param args: The arguments to the underlying type
+        :param blob_store: The store for documents that are too large to
+            keep in the column. If this is ``None``, every document is kept
+            in the column
+        :param kwargs: The keyword arguments to the underlying type
+        """
+        super(JSON, self).__init__(*args, **kwargs)
+        self.blob_store = blob_store
+
     def load_dialect_impl(self, dialect: dialects) -> DialectType:
         """
         SQLAlchemy wraps all database-specific features into
@@ -50,22 +81,31 @@ class JSON(TypeDecorator):
         """
         if dialect.name == 'postgresql':
             return dialect.type_descriptor(postgresql.JSON())
-        elif dialect.name == 'mysql':
-            if 'JSON' in dialect.ischema_names:
-                return dialect.type_descriptor(mysql.JSON())
-            else:
-                return dialect.type_descriptor(
-                    VARCHAR(self._MAX_VARCHAR_LIMIT)
-                )
+        elif self._has_native_json(dialect):
+            return dialect.type_descriptor(mysql.JSON())
         else:
             return dialect.type_descriptor(VARCHAR(self._MAX_VARCHAR_LIMIT))
 
+    @staticmethod
+    def _has_native_json(dialect: dialects) -> bool:
+        """
+
+        :param dialect: The loaded dialect
+        :return: Whether the database has a JSON type. If it does not, JSON
+            is stored as text
+        """
+        return dialect.name == 'postgresql' or (
+            dialect.name == 'mysql' and 'JSON' in dialect.ischema_names
+        )
+
     def process_bind_param(
             self, value: ValueType, dialect: dialects
-    ) -> Optional[str]:
+    ) -> ValueType:
         """
         Given a value and a dialect, determine how to serialize the type to
-        the dialect
+        the dialect. Databases with a JSON type are given the value itself,
+        which the dialect's JSON type encodes, so that the column holds a
+        document that the database can read into
 
         .. note::
 
@@ -78,13 +118,25 @@ class JSON(TypeDecorator):
         """
         if value is None:
             return value
+        elif self._has_native_json(dialect):
+            return self._native_value(value)
+
+        document = JSON_CODEC.dumps(BlobStore.escape(value))
+        if self.blob_store is None:
+            return document
         else:
-            return json.dumps(value)
+            return self.blob_store.dump(document)
 
     def process_result_value(
-            self, value: Optional[str], dialect: dialects
+            self, value: ValueType, dialect: dialects
     ) -> Optional[dict]:
         """
+        Databases with a JSON type return values that the dialect has
+        already decoded. Rows that were written before values were given to
+        the dialect as they are hold the document encoded as a JSON string,
+        and come back as that string. Since strings are written in an
+        envelope on those databases, a string is always such a row, and is
+        decoded here
 
         :param value: The value to process from the SQL query
         :param dialect: The dialect to use for the processing
@@ -92,8 +144,32 @@ class JSON(TypeDecorator):
         """
         if value is None:
             return value
+        elif self._has_native_json(dialect) and not isinstance(value, str):
+            document = value
+        else:
+            document = JSON_CODEC.loads(value)
+
+        if self.blob_store is not None:
+            document = self.blob_store.load(document)
+        return BlobStore.unescape(document)
+
+    def _native_value(self, value: ValueType) -> ValueType:
+        """
+
+        :param value: The value to write to a database with a JSON type
+        :return: The value to give to the dialect's JSON type. This is
+            the escaped value, or a reference to it if it was put in the
+            blob store
+        """
+        value = BlobStore.escape(value, escape_strings=True)
+        if self.blob_store is None:
+            return value
+
+        reference = self.blob_store.store(JSON_CODEC.dumps(value))
+        if reference is None:
+            return value
         else:
-            return json.loads(value)
+            return reference
 
     def copy(self, *args, **kwargs) -> 'JSON':
         """
@@ -102,4 +178,118 @@ class JSON(TypeDecorator):
         :param kwargs: The keyword arguments to the UUID constructor
         :return: A deep copy of this object
         """
+        kwargs.setdefault('blob_store', self.blob_store)
         return JSON(*args, **kwargs)
+
+
+class CompressedJSON(JSON):
+    """
+    A JSON type that compresses documents longer than ``threshold`` bytes
+    with zlib before writing them. Compressed documents are stored as
+    ``zlib:`` followed by the compressed bytes in base 64. Since no JSON
+    document starts with ``z``, documents that were written uncompressed
+    are told apart from compressed ones, and read as they are.
+
+    Databases with a JSON type already compress large values themselves,
+    and would reject a compressed document as invalid JSON, so documents
+    are only compressed on databases where JSON is stored as text.
+    """
+    _COMPRESSED_PREFIX = 'zlib:'
+
+    def __init__(
+            self, *args,
+            threshold: int=config.JSON_COMPRESSION_THRESHOLD,
+            level: int=config.JSON_COMPRESSION_LEVEL,
+            **kwargs
+    ) -> None:
+        """
+
+        :param args: The arguments to the JSON type
+        :param threshold: The length, in bytes, above which documents are
+            compressed
+        :param level: The zlib compression level, from ``1`` (fastest) to
+            ``9`` (smallest)
+        :param kwargs: The keyword arguments to the JSON type
+        """
+        super(CompressedJSON, self).__init__(*args, **kwargs)
+        self.threshold = threshold
+        self.level = level
+
+    def process_bind_param(
+            self, value: ValueType, dialect: dialects
+    ) -> ValueType:
+        """
+
+        :param value: The value to encode
+        :param dialect: The dialect to which this will be encoded to
+        :return: The value encoded in that dialect, compressed if it is
+            long enough, and if the dialect stores JSON as text
+        """
+        document = super(CompressedJSON, self).process_bind_param(
+            value, dialect
+        )
+        if document is None or self._has_native_json(dialect):
+            return document
+        else:
+            return self._compress(document)
+
+    def process_result_value(
+            self, value: ValueType, dialect: dialects
+    ) -> Optional[dict]:
+        """
+
+        :param value: The value to process from the SQL query, which may
+            or may not be compressed
+        :param dialect: The dialect to use for the processing
+        :return: The decoded value
+        """
+        if isinstance(value, str) and \
+                value.startswith(self._COMPRESSED_PREFIX):
+            value = self._decompress(value)
+        return super(CompressedJSON, self).process_result_value(
+            value, dialect
+        )
+
+    def copy(self, *args, **kwargs) -> 'CompressedJSON':
+        """
+
+        :param args: The arguments to the constructor
+        :param kwargs: The keyword arguments to the constructor
+        :return: A copy of this type, with the same blob store, threshold
+            and compression level
+        """
+        kwargs.setdefault('blob_store', self.blob_store)
+        kwargs.setdefault('threshold', self.threshold)
+        kwargs.setdefault('level', self.level)
+        return CompressedJSON(*args, **kwargs)
+
+    def _compress(self, document: str) -> str:
+        """
+
+        :param document: A JSON document
+        :return: The compressed document, if the document is longer than
+            the threshold and compressing it makes it shorter. Otherwise,
+            the document itself
+        """
+        data = document.encode('utf-8')
+        if len(data) <= self.threshold:
+            return document
+
+        compressed_document = self._COMPRESSED_PREFIX + base64.b64encode(
+            zlib.compress(data, self.level)
+        ).decode('ascii')
+
+        if len(compressed_document) < len(document):
+            return compressed_document
+        else:
+            return document
+
+    def _decompress(self, value: str) -> str:
+        """
+
+        :param value: A compressed document
+        :return: The JSON document
+        """
+        return zlib.decompress(base64.b64decode(
+            value[len(self._COMPRESSED_PREFIX):]
+        )).decode('utf-8')
@@ -5,6 +5,7 @@ an instance of the result schema
 """
 from .declarative_base import BASE
 from ..schemas import database, JobStatus
+from sqlalchemy.orm import column_property
 from uuid import UUID, uuid4
 from typing import Optional
 from ...json_type import JSON_TYPE as JSON
@@ -19,17 +20,24 @@ class Job(BASE):
 
     id = __table__.c.job_id
 
-    status = __table__.c.status  # type: JobStatus
+    status = column_property(
+        __table__.c.status, active_history=True
+    )  # type: JobStatus
     results = __table__.c.results  # type: JSON
     parameters = __table__.c.parameters  # type: JSON
     date_submitted = __table__.c.date_submitted  # type: datetime
     service_id = __table__.c.service_id
+    lease_token = __table__.c.lease_token  # type: Optional[UUID]
+    lease_expires_at = __table__.c.lease_expires_at  # type: Optional[datetime]
 
     def __init__(
             self, job_id: UUID, status: JobStatus, parameters: JSON,
             service: 'Service', results: Optional[JSON],
-            date_submitted=datetime.utcnow()
+            date_submitted: Optional[datetime]=None
     ) -> None:
+        if date_submitted is None:
+            date_submitted = datetime.utcnow()
+
         self.id = job_id
         self.status = status
         self.parameters = parameters
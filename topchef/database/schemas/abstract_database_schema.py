@@ -41,6 +41,17 @@ class AbstractDatabaseSchema(object, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
+    @property
+    @abc.abstractmethod
+    def service_job_counters(self) -> Table:
+        """
+
+        :return: The table used to count the jobs of each service with each
+            status, so that the jobs do not have to be counted on every
+            request
+        """
+        raise NotImplementedError()
+
     @property
     @abc.abstractmethod
     def metadata(self) -> MetaData:
@@ -2,9 +2,10 @@ from .abstract_database_schema import AbstractDatabaseSchema
 from .job_status import JobStatus
 from datetime import datetime
 from sqlalchemy import Table, Column, MetaData, String, Boolean, Integer
-from sqlalchemy import DateTime, ForeignKey, Enum
+from sqlalchemy import DateTime, ForeignKey, Enum, Index
 from ..uuid_database_type import UUID
-from ..json_type import JSON
+from ..blob_store import BLOB_STORE
+from ..json_type import JSON, CompressedJSON
 
 
 class DatabaseSchema(AbstractDatabaseSchema):
@@ -22,7 +23,7 @@ class DatabaseSchema(AbstractDatabaseSchema):
                default='No description'
                ),
         Column('last_checked_in', DateTime, nullable=False,
-               default=datetime.utcnow()),
+               default=datetime.utcnow),
         Column('heartbeat_timeout_seconds', Integer,
                nullable=False, default=30),
         Column('is_service_available', Boolean, nullable=False),
@@ -36,6 +37,11 @@ class DatabaseSchema(AbstractDatabaseSchema):
             JSON,
             nullable=False,
             default=_GENERAL_JSON_SCHEMA
+        ),
+        Index(
+            'ix_services_available_id_checked_in_timeout',
+            'is_service_available', 'service_id', 'last_checked_in',
+            'heartbeat_timeout_seconds'
         )
     )
 
@@ -46,11 +52,38 @@ class DatabaseSchema(AbstractDatabaseSchema):
                nullable=False
                ),
         Column('date_submitted', DateTime, nullable=False,
-               default=datetime.utcnow()),
+               default=datetime.utcnow),
         Column('status', Enum(JobStatus), default=JobStatus.REGISTERED),
-        Column('parameters', JSON, nullable=False),
-        Column('results', JSON, nullable=True),
-        Column('job_set_id', ForeignKey('job_sets.job_set_id'), nullable=True)
+        Column(
+            'parameters', CompressedJSON(blob_store=BLOB_STORE),
+            nullable=False
+        ),
+        Column(
+            'results', CompressedJSON(blob_store=BLOB_STORE), nullable=True
+        ),
+        Column('job_set_id', ForeignKey('job_sets.job_set_id'), nullable=True),
+        Column('lease_token', UUID, nullable=True),
+        Column('lease_expires_at', DateTime, nullable=True),
+        Index(
+            'ix_jobs_service_id_status_date_submitted',
+            'service_id', 'status', 'date_submitted', 'job_id'
+        ),
+        Index('ix_jobs_status_lease_expires_at', 'status', 'lease_expires_at'),
+        Index('ix_jobs_date_submitted', 'date_submitted', 'job_id'),
+        Index(
+            'ix_jobs_service_id_date_submitted',
+            'service_id', 'date_submitted', 'job_id'
+        )
+    )
+
+    _service_job_counters = Table(
+        'service_job_counters', _metadata,
+        Column('service_id', UUID,
+               ForeignKey('services.service_id', ondelete='CASCADE'),
+               primary_key=True, nullable=False
+               ),
+        Column('status', Enum(JobStatus), primary_key=True, nullable=False),
+        Column('number_of_jobs', Integer, nullable=False, default=0)
     )
 
     _job_sets = Table(
@@ -83,6 +116,15 @@ class DatabaseSchema(AbstractDatabaseSchema):
         """
         return self._jobs
 
+    @property
+    def service_job_counters(self) -> Table:
+        """
+
+        :return: The table containing the number of jobs that each service
+            has with each status
+        """
+        return self._service_job_counters
+
     @property
     def metadata(self) -> MetaData:
         """
@@ -0,0 +1,82 @@
+"""
+Deletes services and their jobs with set-based ``DELETE`` statements.
+
+Deleting a service through the ORM loads every one of its jobs, and deletes
+them one at a time. For a service with a long history, that takes minutes,
+and holds the database's write lock the whole time. Here, a service's jobs
+are deleted by ``service_id`` instead, either all at once with
+:func:`delete_service`, or a bounded chunk at a time with
+:func:`delete_jobs_of_service`, so that the caller can commit between
+chunks and let other writers in.
+
+These statements bypass the ORM's unit of work. Objects for the deleted
+rows that are already loaded into the session are NOT expired, and the
+caller is responsible for removing them from the session.
+"""
+from collections import Counter
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from .job_counters import adjust_job_counters
+from .schemas import database
+
+__all__ = ['delete_jobs_of_service', 'delete_service']
+
+_COUNTERS = database.service_job_counters
+_JOBS = database.jobs
+_SERVICES = database.services
+
+
+def delete_jobs_of_service(
+        session: Session, service_id: UUID, limit: int
+) -> int:
+    """
+    Delete at most ``limit`` of a service's jobs, with one ``DELETE``
+    statement, and take them off the service's job counters
+
+    :param session: The session in whose transaction the jobs are deleted
+    :param service_id: The ID of the service whose jobs are to be deleted
+    :param limit: The maximum number of jobs to delete
+    :return: The number of jobs that were deleted. If this is ``0``, the
+        service has no jobs left
+    """
+    chunk = session.execute(
+        select([_JOBS.c.job_id, _JOBS.c.status]).where(
+            _JOBS.c.service_id == service_id
+        ).limit(limit)
+    ).fetchall()
+
+    if not chunk:
+        return 0
+
+    session.execute(_JOBS.delete().where(
+        _JOBS.c.job_id.in_([job_id for job_id, _ in chunk])
+    ))
+
+    deleted_jobs = Counter(
+        (service_id, status) for _, status in chunk if status is not None
+    )
+    adjust_job_counters(session, {
+        counter: -number_of_jobs
+        for counter, number_of_jobs in deleted_jobs.items()
+    })
+    return len(chunk)
+
+
+def delete_service(session: Session, service_id: UUID) -> bool:
+    """
+    Delete a service, every job it still has, and its job counters, with
+    one ``DELETE`` statement for each table
+
+    :param session: The session in whose transaction the service is deleted
+    :param service_id: The ID of the service to delete
+    :return: ``True`` if the service existed, otherwise ``False``
+    """
+    session.execute(_JOBS.delete().where(_JOBS.c.service_id == service_id))
+    session.execute(
+        _COUNTERS.delete().where(_COUNTERS.c.service_id == service_id)
+    )
+    result = session.execute(
+        _SERVICES.delete().where(_SERVICES.c.service_id == service_id)
+    )
+    return bool(result.rowcount)
@@ -0,0 +1,74 @@
+"""
+Contains a function for making the engine that the API uses to talk to its
+database. The API makes one engine for the whole process, and every request
+borrows a connection from that engine's connection pool.
+
+The size of the pool, how far it may overflow, how long connections may
+live, and whether connections are checked before they are used can all be
+set in :class:`topchef.config.Config`. SQLite does not use a queued pool,
+so the pool size parameters are ignored for SQLite databases.
+"""
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.exc import DBAPIError
+from .config import Config, config as default_config
+
+__all__ = ['create_database_engine']
+
+
+def create_database_engine(
+        config: Config=default_config, engine_factory=create_engine
+) -> Engine:
+    """
+
+    :param config: The configuration from which the database URI and pool
+        parameters are read
+    :param engine_factory: The function used to make the engine
+    :return: An engine with a connection pool built from the configuration
+    """
+    database_uri = config.DATABASE_URI
+
+    if make_url(database_uri).get_backend_name() == 'sqlite':
+        engine = engine_factory(database_uri)
+    else:
+        engine = engine_factory(
+            database_uri,
+            pool_size=config.DATABASE_POOL_SIZE,
+            max_overflow=config.DATABASE_MAX_OVERFLOW,
+            pool_timeout=config.DATABASE_POOL_TIMEOUT,
+            pool_recycle=config.DATABASE_POOL_RECYCLE
+        )
+
+    if config.DATABASE_POOL_PRE_PING:
+        event.listen(engine, 'engine_connect', _ping_connection)
+
+    return engine
+
+
+def _ping_connection(connection: Connection, branch: bool) -> None:
+    """
+    Check that a connection taken out of the pool is still alive. If the
+    database has dropped the connection, the pool is invalidated and the
+    connection is reopened, so that the request does not fail on a stale
+    connection.
+
+    :param connection: The connection taken out of the pool
+    :param branch: ``True`` if the connection is a branch of a connection
+        that has already been checked
+    """
+    if branch:
+        return
+
+    should_close_with_result = connection.should_close_with_result
+    connection.should_close_with_result = False
+
+    try:
+        connection.scalar(select([1]))
+    except DBAPIError as error:
+        if error.connection_invalidated:
+            connection.scalar(select([1]))
+        else:
+            raise
+    finally:
+        connection.should_close_with_result = should_close_with_result
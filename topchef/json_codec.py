@@ -0,0 +1,194 @@
+"""
+Contains the codec with which the API encodes and decodes JSON, both for
+the JSON columns in the database and for the bodies of its responses.
+
+Serializing JSON takes a large share of the time spent answering requests
+for long lists of jobs, so a faster codec is used when one is installed.
+The codec is chosen with the ``JSON_CODEC`` configuration parameter, which
+is one of
+
+* ``auto``: Use `orjson <https://github.com/ijl/orjson>`_ if it is
+  installed, and the standard library's :mod:`json` module otherwise
+* ``orjson``: Use orjson, which MUST be installed
+* ``json``: Use the standard library's :mod:`json` module
+
+Every codec encodes dates, UUIDs, and anything else that Flask's own
+encoder accepts in the same way as Flask does, so responses do not depend
+on the codec that wrote them.
+"""
+import abc
+import json
+import math
+from datetime import date
+from typing import Any, Union
+from uuid import UUID
+from flask import Response
+from werkzeug.http import http_date
+from topchef.config import config
+
+__all__ = ['JSONCodec', 'codec_named', 'jsonify', 'JSON_CODEC']
+
+
+class JSONCodec(object, metaclass=abc.ABCMeta):
+    """
+    Describes a means of encoding values as JSON, and of decoding them
+    """
+    @abc.abstractmethod
+    def dumps(self, value: Any) -> str:
+        """
+
+        :param value: The value to encode
+        :return: The value as a JSON document
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def loads(self, document: Union[str, bytes]) -> Any:
+        """
+
+        :param document: A JSON document
+        :return: The decoded value
+        :raises: :exc:`ValueError` if the document is not valid JSON
+        """
+        raise NotImplementedError()
+
+
+def _default(value: Any) -> Any:
+    """
+    Encode the values that Flask's JSON encoder accepts, but that JSON
+    does not have a type for
+
+    :param value: A value that the codec cannot encode by itself
+    :return: A value that the codec can encode
+    :raises: :exc:`TypeError` if the value cannot be encoded
+    """
+    if isinstance(value, date):
+        return http_date(value.timetuple())
+    elif isinstance(value, UUID):
+        return str(value)
+    elif hasattr(value, '__html__'):
+        return str(value.__html__())
+    else:
+        raise TypeError('%r is not JSON serializable' % value)
+
+
+class StandardLibraryCodec(JSONCodec):
+    """
+    A codec that uses the standard library's :mod:`json` module
+    """
+    def dumps(self, value: Any) -> str:
+        return json.dumps(value, default=_default)
+
+    def loads(self, document: Union[str, bytes]) -> Any:
+        return json.loads(document)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    A codec that uses orjson, which is several times faster than the
+    standard library. orjson cannot encode integers that do not fit into
+    64 bits, so values containing those are encoded with the standard
+    library instead. orjson also writes ``NaN`` and infinite floats as
+    ``null``, and does not read the ``NaN``, ``Infinity`` and
+    ``-Infinity`` tokens that the standard library writes for them, so
+    values and documents holding those are handled by the standard library
+    as well.
+    """
+    def __init__(self) -> None:
+        """
+
+        :raises: :exc:`ImportError` if orjson is not installed
+        """
+        import orjson
+        self._orjson = orjson
+        self._fallback = StandardLibraryCodec()
+
+    def dumps(self, value: Any) -> str:
+        try:
+            document = self._orjson.dumps(
+                value, default=_default,
+                option=self._orjson.OPT_PASSTHROUGH_DATETIME
+            ).decode('utf-8')
+        except TypeError:
+            return self._fallback.dumps(value)
+
+        if 'null' in document and _has_non_finite_float(value):
+            return self._fallback.dumps(value)
+        else:
+            return document
+
+    def loads(self, document: Union[str, bytes]) -> Any:
+        try:
+            return self._orjson.loads(document)
+        except ValueError:
+            return self._fallback.loads(document)
+
+
+def _has_non_finite_float(value: Any) -> bool:
+    """
+    This is only called for documents in which orjson wrote ``null``, since
+    that is what it writes for those floats
+
+    :param value: A value that was encoded
+    :return: Whether the value holds ``NaN`` or an infinite float
+    """
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    elif isinstance(value, dict):
+        return any(map(_has_non_finite_float, value.values()))
+    elif isinstance(value, (list, tuple)):
+        return any(map(_has_non_finite_float, value))
+    else:
+        return False
+
+
+def codec_named(name: str) -> JSONCodec:
+    """
+
+    :param name: The name of the codec, as given to ``JSON_CODEC``
+    :return: The codec
+    :raises: :exc:`ValueError` if there is no codec with this name
+    :raises: :exc:`ImportError` if the codec's library is not installed
+    """
+    if name == 'auto':
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return StandardLibraryCodec()
+    elif name == 'orjson':
+        return OrjsonCodec()
+    elif name == 'json':
+        return StandardLibraryCodec()
+    else:
+        raise ValueError(
+            'Unknown JSON codec %s. The codec must be one of "auto", '
+            '"orjson", or "json"' % name
+        )
+
+
+JSON_CODEC = codec_named(config.JSON_CODEC)
+
+
+def jsonify(*args, **kwargs) -> Response:
+    """
+    Make a JSON response, encoded with :data:`JSON_CODEC`. This takes the
+    same arguments as :func:`flask.jsonify`, but the document is always
+    written compactly, with its keys in the order in which they were given
+
+    :param args: Either one value to encode, or several values to encode
+        as an array
+    :param kwargs: The members of an object to encode
+    :return: The response
+    :raises: :exc:`TypeError` if both ``args`` and ``kwargs`` are given
+    """
+    if args and kwargs:
+        raise TypeError('jsonify() behavior undefined when passed both args '
+                        'and kwargs')
+    elif len(args) == 1:
+        data = args[0]
+    else:
+        data = args or kwargs
+
+    return Response(
+        JSON_CODEC.dumps(data) + '\n', mimetype='application/json'
+    )
@@ -35,15 +35,22 @@ Therefore, everything before
 """
 import abc
 from ..interfaces.job_list import JobList
+from datetime import datetime, timedelta
+from sqlalchemy import and_, or_, func
 from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.elements import ColumnElement
+from collections import Counter
+from topchef.config import config
+from topchef.database import adjust_job_counters, loaded_instance
+from topchef.database import is_stored_out_of_line, json_path_matches
 from topchef.database.models import Job as DatabaseJob
 from topchef.database.models.job import JobStatus as DatabaseJobStatus
-from typing import Iterator, Sequence
+from typing import Iterator, Sequence, Optional, Tuple, List
 from collections.abc import AsyncIterator
+from topchef.models.async_chunk_iterator import AsyncChunkIterator
 from topchef.models.interfaces.job import Job
 from topchef.models.job import Job as JobModel
-from copy import deepcopy
-from uuid import UUID
+from uuid import UUID, uuid4
 from typing import Union
 
 
@@ -55,6 +62,16 @@ class JobListFromQuery(JobList, metaclass=abc.ABCMeta):
         Job.JobStatus.ERROR: DatabaseJobStatus.ERROR
     }
 
+    _DB_TO_MODEL_JOB_STATUS = {
+        database_status: model_status for model_status, database_status
+        in _MODEL_TO_DB_JOB_STATUS.items()
+    }
+
+    _MAXIMUM_CLAIM_ATTEMPTS = 5
+    _ITERATION_CHUNK_SIZE = 1000
+    _DIALECTS_WITH_SKIP_LOCKED = frozenset(['postgresql'])
+    _LEASE_DURATION = timedelta(seconds=config.JOB_LEASE_DURATION)
+
     @property
     @abc.abstractmethod
     def root_job_query(self) -> Query:
@@ -116,6 +133,17 @@ class JobListFromQuery(JobList, metaclass=abc.ABCMeta):
 
     def __iter__(self) -> Iterator[Job]:
         """
+        Iterate over the jobs without loading all of them at once. The jobs
+        are fetched from the database in chunks, and once a chunk has been
+        iterated over, its jobs are removed from the session, unless they
+        have changes that have not yet been flushed.
+
+        .. note::
+
+            A job that was left unchanged while its chunk was iterated over
+            is no longer tracked by the session. Changes to that job will
+            not be saved, unless the job is written back with
+            :meth:`__setitem__`.
 
         :return: An iterator that can iterate snychronously over all the
             jobs in the set
@@ -126,17 +154,283 @@ class JobListFromQuery(JobList, metaclass=abc.ABCMeta):
 
     def __aiter__(self) -> AsyncIterator:
         """
+        Iterate asynchronously over the jobs. The jobs are read with keyset
+        queries, ``_ITERATION_CHUNK_SIZE`` at a time, in a thread pool, so
+        that the event loop is not blocked while the database is queried.
+        Each chunk is read in a session of its own, so the jobs are
+        detached, and jobs that this list's session has not committed are
+        not seen.
 
         :return: The asynchronous job iterator that can asynchronously
             iterate over all the jobs.
         """
-        return self._AsyncJobIterator(self._all_database_jobs)
+        return AsyncChunkIterator(
+            self.session.get_bind(), self._jobs_after,
+            self._ITERATION_CHUNK_SIZE
+        )
 
     def __len__(self) -> int:
         return self.root_job_query.count()
 
+    def page(
+            self, limit: int, after: Optional[Tuple[datetime, UUID]]=None,
+            filters: Sequence[JobList.Filter]=()
+    ) -> Sequence[Job]:
+        """
+        Get a page of jobs using a keyset query. Rather than skipping over
+        the jobs on earlier pages with ``OFFSET``, the query starts at the
+        first job sorting after ``after``, so that every page is an index
+        range scan.
+
+        Filters are compiled into the query, so that the database only
+        returns matching jobs. The database cannot read documents that were
+        compressed or moved to the blob store, so those jobs are returned
+        as well, and checked once they are loaded. If that leaves the page
+        short, the next jobs are fetched, until the page is full or the
+        list runs out.
+
+        :param limit: The maximum number of jobs on the page
+        :param after: The ``(date_submitted, job_id)`` of the last job on
+            the previous page, or ``None`` to get the first page
+        :param filters: The conditions that every job on the page must
+            match
+        :return: At most ``limit`` jobs that sort after ``after``
+        """
+        return self._page(self.root_job_query, limit, after, filters)
+
+    def _page(
+            self, query: Query, limit: int,
+            after: Optional[Tuple[datetime, UUID]],
+            filters: Sequence[JobList.Filter]
+    ) -> Sequence[Job]:
+        """
+
+        :param query: The query for the jobs in this list
+        :param limit: The maximum number of jobs on the page
+        :param after: The ``(date_submitted, job_id)`` of the last job on
+            the previous page, or ``None`` to get the first page
+        :param filters: The conditions that every job on the page must
+            match
+        :return: The page of jobs, as described in :meth:`page`
+        """
+        if filters:
+            query = query.filter(*(
+                self._condition_for_filter(job_filter)
+                for job_filter in filters
+            ))
+
+        jobs = []
+        while len(jobs) < limit:
+            chunk_size = limit - len(jobs)
+            chunk = [
+                JobModel(db_job) for db_job in self._after(query, after)
+                .order_by(DatabaseJob.date_submitted, DatabaseJob.id)
+                .limit(chunk_size).all()
+            ]
+            jobs.extend(
+                job for job in chunk
+                if all(job_filter.matches(job) for job_filter in filters)
+            )
+
+            if len(chunk) < chunk_size:
+                break
+            after = (chunk[-1].date_submitted, chunk[-1].id)
+
+        return jobs
+
+    def registered_jobs(self, limit: int) -> Sequence[Job]:
+        """
+        Filter, sort and limit the registered jobs in the database, so that
+        only the head of the queue is loaded from it.
+
+        :param limit: The maximum number of jobs to return
+        :return: At most ``limit`` registered jobs, oldest first
+        """
+        return [
+            JobModel(db_job) for db_job in
+            self._registered_jobs_in_queue_order.limit(limit).all()
+        ]
+
+    def summary(self) -> JobList.Summary:
+        """
+        Count the jobs with each status, and find the oldest submission
+        date for each status, in one ``GROUP BY`` query. The query is
+        answered from the index on ``(service_id, status, date_submitted)``
+        so the rows of the jobs themselves are never loaded.
+
+        :return: The summary of the jobs in this list
+        """
+        rows = self.root_job_query.with_entities(
+            DatabaseJob.status,
+            func.count(DatabaseJob.id),
+            func.min(DatabaseJob.date_submitted)
+        ).group_by(DatabaseJob.status).all()
+
+        counts = {status.name.lower(): 0 for status in Job.JobStatus}
+        oldest_registered_job_date = None
+
+        for database_status, count, oldest_date in rows:
+            status = self._DB_TO_MODEL_JOB_STATUS[database_status]
+            counts[status.name.lower()] = count
+            if status is Job.JobStatus.REGISTERED:
+                oldest_registered_job_date = oldest_date
+
+        return self.Summary(
+            oldest_registered_job_date=oldest_registered_job_date, **counts
+        )
+
+    def claim_next_job(self) -> Optional[Job]:
+        """
+        Claim the oldest registered job in this list, and set its status to
+        ``WORKING``. The claim is done entirely in the database, so that two
+        clients claiming jobs concurrently never receive the same job. If
+        the database supports ``SELECT ... FOR UPDATE SKIP LOCKED``, the
+        next job is locked while it is being claimed, and jobs locked by
+        other clients are skipped over. Otherwise, the job is claimed using
+        an ``UPDATE`` that only succeeds if the job is still registered.
+
+        The claimed job is leased for ``JOB_LEASE_DURATION`` seconds. If
+        the lease is not extended with :meth:`extend_lease` before then,
+        the job is returned to the queue.
+
+        :return: The claimed job, or ``None`` if no job could be claimed
+        """
+        if self._dialect_name in self._DIALECTS_WITH_SKIP_LOCKED:
+            database_job = self._claim_with_row_lock()
+        else:
+            database_job = self._claim_with_compare_and_swap()
+
+        if database_job is None:
+            return None
+        else:
+            return JobModel(database_job)
+
+    def claim_next_jobs(self, count: int) -> Sequence[Job]:
+        """
+        Claim up to ``count`` of the oldest registered jobs in this list,
+        and set their status to ``WORKING``. The jobs are claimed with a
+        single ``UPDATE`` statement. If the database supports ``SELECT ...
+        FOR UPDATE SKIP LOCKED``, the jobs to claim are locked first, and
+        jobs locked by other clients are skipped over. Otherwise, the first
+        job is claimed with a guarded ``UPDATE``, which takes the database's
+        write lock on SQLite. The rest of the jobs are then selected with
+        ``FOR UPDATE`` and claimed in one statement, with no other client
+        able to claim them in the meantime. Jobs claimed by the same
+        statement share a lease token.
+
+        :param count: The maximum number of jobs to claim
+        :return: The claimed jobs, oldest first
+        """
+        if self._dialect_name in self._DIALECTS_WITH_SKIP_LOCKED:
+            database_jobs = self._claim_batch_with_row_lock(count)
+        else:
+            database_jobs = self._claim_batch_after_compare_and_swap(count)
+
+        return [JobModel(database_job) for database_job in database_jobs]
+
+    def extend_lease(
+            self, job_id: UUID, lease_token: UUID
+    ) -> Optional[datetime]:
+        """
+        Extend a lease with one ``UPDATE`` statement, which only matches the
+        job if it is still ``WORKING`` and still leased with the token. A
+        worker whose job has been reaped, or claimed by another worker, can
+        no longer extend the lease.
+
+        :param job_id: The ID of the job whose lease is to be extended
+        :param lease_token: The token of the worker holding the lease
+        :return: The new expiry date of the lease, or ``None`` if the job
+            is not leased with that token
+        """
+        lease_expires_at = datetime.utcnow() + self._LEASE_DURATION
+
+        number_of_extended_leases = self.session.query(DatabaseJob).filter(
+            DatabaseJob.id == job_id,
+            DatabaseJob.status == DatabaseJobStatus.WORKING,
+            DatabaseJob.lease_token == lease_token
+        ).update(
+            {DatabaseJob.lease_expires_at: lease_expires_at},
+            synchronize_session=False
+        )
+
+        if number_of_extended_leases:
+            return lease_expires_at
+        else:
+            return None
+
+    @staticmethod
+    def _after(
+            query: Query, after: Optional[Tuple[datetime, UUID]]
+    ) -> Query:
+        """
+
+        :param query: A query for jobs
+        :param after: The ``(date_submitted, job_id)`` of a job, or
+            ``None``
+        :return: The query, restricted to the jobs that sort after
+            ``after``
+        """
+        if after is None:
+            return query
+
+        date_submitted, job_id = after
+        return query.filter(or_(
+            DatabaseJob.date_submitted > date_submitted,
+            and_(
+                DatabaseJob.date_submitted == date_submitted,
+                DatabaseJob.id > job_id
+            )
+        ))
+
+    @staticmethod
+    def _condition_for_filter(job_filter: JobList.Filter) -> ColumnElement:
+        """
+
+        :param job_filter: A condition on the parameters or results of jobs
+        :return: A condition that holds for every job matching the filter,
+            and for every job whose document the database cannot read
+        """
+        document = getattr(DatabaseJob, job_filter.document)
+        return or_(
+            json_path_matches(
+                document, job_filter.path, job_filter.operator,
+                job_filter.value, job_filter.json_type(job_filter.value)
+            ),
+            is_stored_out_of_line(document)
+        )
+
+    def _is_loaded_job_in_list(self, database_job: DatabaseJob) -> bool:
+        """
+        Tell whether a job that is already loaded into the session belongs
+        to this list, without querying the database. Lists whose query
+        cannot be checked in Python return ``False``, in which case the job
+        is looked up with :attr:`root_job_query`.
+
+        :param database_job: A job in the session's identity map
+        :return: ``True`` if the job is known to be in this list
+        """
+        return False
+
+    def _loaded_database_job(self, job_id: UUID) -> Optional[DatabaseJob]:
+        """
+
+        :param job_id: The ID of the job to look up
+        :return: The job, if it is already loaded into the session and
+            belongs to this list, otherwise ``None``
+        """
+        database_job = loaded_instance(self.session, DatabaseJob, job_id)
+
+        if database_job is not None and \
+                self._is_loaded_job_in_list(database_job):
+            return database_job
+        else:
+            return None
+
     def _safely_get_database_job(self, job_id: UUID) -> DatabaseJob:
-        job = self.root_job_query.filter_by(id=job_id).first()
+        job = self._loaded_database_job(job_id)
+
+        if job is None:
+            job = self.root_job_query.filter_by(id=job_id).first()
 
         if job is None:
             raise KeyError('A job with id %s does not exist' % job_id)
@@ -144,57 +438,283 @@ class JobListFromQuery(JobList, metaclass=abc.ABCMeta):
             return job
 
     def _check_membership_for_job(self, job: Job) -> bool:
-        return bool(
-            self.root_job_query.filter_by(
-                id=job.id
-            ).count()
-        )
+        return self._check_membership_for_id(job.id)
 
     def _check_membership_for_id(self, job_id: UUID) -> bool:
-        return bool(
-            self.root_job_query.filter_by(
-                id=job_id
-            ).count()
+        """
+
+        :param job_id: The ID of the job to look for
+        :return: Whether the job is in this list. Jobs that are not loaded
+            are looked for with an ``EXISTS`` query, which stops at the
+            first matching row instead of counting them
+        """
+        if self._loaded_database_job(job_id) is not None:
+            return True
+
+        return self.session.query(
+            self.root_job_query.filter_by(id=job_id).exists()
+        ).scalar()
+
+    @property
+    def _all_database_jobs(self) -> Iterator[DatabaseJob]:
+        """
+        Fetch the jobs with ``yield_per``, which reads
+        ``_ITERATION_CHUNK_SIZE`` rows at a time. For drivers that support
+        them, like ``psycopg2``, this also makes the query use a server-side
+        cursor, so that the database driver does not buffer every row
+        either.
+
+        :return: An iterator over all the database jobs in this list
+        """
+        processed_jobs = []
+
+        for database_job in self.root_job_query.yield_per(
+                self._ITERATION_CHUNK_SIZE
+        ):
+            yield database_job
+            processed_jobs.append(database_job)
+
+            if len(processed_jobs) == self._ITERATION_CHUNK_SIZE:
+                self._expunge_unchanged_jobs(processed_jobs)
+                processed_jobs = []
+
+    def _jobs_after(
+            self, session: Session, last_job: Optional[Job]
+    ) -> Sequence[Job]:
+        """
+
+        :param session: The session in which to read the jobs
+        :param last_job: The last job of the previous chunk, or ``None`` to
+            get the first chunk
+        :return: The next chunk of jobs, in the order of :meth:`page`
+        """
+        after = None if last_job is None else (
+            last_job.date_submitted, last_job.id
+        )
+        return self._page(
+            self.root_job_query.with_session(session),
+            self._ITERATION_CHUNK_SIZE, after, ()
         )
 
+    def _expunge_unchanged_jobs(
+            self, database_jobs: Sequence[DatabaseJob]
+    ) -> None:
+        """
+        Remove jobs that have been iterated over from the session, so that
+        the session does not keep every job of a long iteration alive. Jobs
+        with unflushed changes are kept, so that their changes are saved.
+
+        :param database_jobs: The jobs to remove
+        """
+        for database_job in database_jobs:
+            if not self.session.is_modified(database_job):
+                self.session.expunge(database_job)
+
     @property
-    def _all_database_jobs(self) -> Sequence[DatabaseJob]:
-        return self.root_job_query.all()
+    def _registered_jobs_in_queue_order(self) -> Query:
+        """
 
-    def __eq__(self, other: JobList) -> bool:
+        :return: A query for all registered jobs in this list, with the
+            oldest job first. Jobs submitted at the same time are ordered by
+            ID, so that the order is the same every time the query is run.
         """
+        return self.root_job_query.filter(
+            DatabaseJob.status == DatabaseJobStatus.REGISTERED
+        ).order_by(DatabaseJob.date_submitted, DatabaseJob.id)
 
-        :param other: The other job list to compare
-        :return: ``True`` if the jobs in this list are equal to jobs in the
-            other list
+    @property
+    def _dialect_name(self) -> str:
         """
-        return set(self) == set(other)
 
-    class _AsyncJobIterator(AsyncIterator):
-        def __init__(self, db_job_list: Sequence[DatabaseJob]) -> None:
-            self.database_jobs = db_job_list
-            self._last_iterated_index = 0
+        :return: The name of the SQL dialect spoken by the database to
+            which the session is bound
+        """
+        return self.session.get_bind().dialect.name
+
+    def _claim_with_row_lock(self) -> Optional[DatabaseJob]:
+        """
+        Lock the next registered job with ``FOR UPDATE SKIP LOCKED``, and
+        mark it as ``WORKING``. The lock is held until the session's
+        transaction ends.
+
+        :return: The claimed job, or ``None`` if there is no unlocked
+            registered job
+        """
+        database_job = self._registered_jobs_in_queue_order.with_for_update(
+            skip_locked=True
+        ).populate_existing().first()
+
+        if database_job is not None:
+            database_job.status = DatabaseJobStatus.WORKING
+            database_job.lease_token, database_job.lease_expires_at = \
+                self._new_lease()
+            self.session.flush()
+
+        return database_job
+
+    def _claim_with_compare_and_swap(self) -> Optional[DatabaseJob]:
+        """
+        Find the ID of the next registered job, and then set its status to
+        ``WORKING`` only if it is still ``REGISTERED``. If another client
+        claimed the job in between, try again with the next job, up to
+        ``_MAXIMUM_CLAIM_ATTEMPTS`` times.
+
+        :return: The claimed job, or ``None`` if no job could be claimed
+        """
+        for _ in range(self._MAXIMUM_CLAIM_ATTEMPTS):
+            candidate = self._registered_jobs_in_queue_order.with_entities(
+                DatabaseJob.id
+            ).first()
+
+            if candidate is None:
+                return None
+
+            job_id = candidate[0]
+
+            number_of_claimed_jobs = self.session.query(DatabaseJob).filter(
+                DatabaseJob.id == job_id,
+                DatabaseJob.status == DatabaseJobStatus.REGISTERED
+            ).update(
+                self._values_for_claimed_jobs, synchronize_session=False
+            )
 
-        def __aiter__(self) -> AsyncIterator:
-            iterable = deepcopy(self)
-            iterable._last_iterated_index = 0
+            if number_of_claimed_jobs:
+                database_job = self.session.query(
+                    DatabaseJob
+                ).populate_existing().get(job_id)
+                self._count_claimed_jobs([database_job])
+                return database_job
 
-            return iterable
+        return None
 
-        async def __anext__(self) -> Job:
-            if self._last_iterated_index == len(self):
-                raise StopAsyncIteration()
-            else:
-                db_job = self.database_jobs[self._last_iterated_index]
-                self._last_iterated_index += 1
-                return db_job
+    def _claim_batch_with_row_lock(self, count: int) -> List[DatabaseJob]:
+        """
+        Lock the IDs of the next ``count`` registered jobs with ``FOR UPDATE
+        SKIP LOCKED``, and mark all of them as ``WORKING`` at once.
+
+        :param count: The maximum number of jobs to claim
+        :return: The claimed jobs
+        """
+        job_ids = self._locked_registered_job_ids(count, skip_locked=True)
+        return self._mark_jobs_as_working(job_ids)
+
+    def _claim_batch_after_compare_and_swap(
+            self, count: int
+    ) -> List[DatabaseJob]:
+        """
+        Claim the next job with a guarded ``UPDATE``, and then claim the
+        next ``count - 1`` registered jobs at once.
 
-        def __len__(self):
-            return len(self.database_jobs)
+        :param count: The maximum number of jobs to claim
+        :return: The claimed jobs
+        """
+        first_job = self._claim_with_compare_and_swap()
+        if first_job is None:
+            return []
+        elif count == 1:
+            return [first_job]
+
+        job_ids = self._locked_registered_job_ids(count - 1)
+        return [first_job] + self._mark_jobs_as_working(job_ids)
+
+    def _locked_registered_job_ids(
+            self, count: int, skip_locked: bool=False
+    ) -> List[UUID]:
+        """
+
+        :param count: The maximum number of IDs to select
+        :param skip_locked: If ``True``, jobs locked by other clients are
+            skipped over, instead of waiting for their locks to be released
+        :return: The IDs of the next ``count`` registered jobs, selected
+            ``FOR UPDATE``
+        """
+        query = self._registered_jobs_in_queue_order.with_entities(
+            DatabaseJob.id
+        ).with_for_update(skip_locked=skip_locked).limit(count)
 
-        class _JobAwaitable(object):
-            def __init__(self, job: Job):
-                self.job = job
+        return [row[0] for row in query.all()]
 
-            def __await__(self) -> Job:
-                return self.job
+    def _mark_jobs_as_working(
+            self, job_ids: Sequence[UUID]
+    ) -> List[DatabaseJob]:
+        """
+        Set the status of all the registered jobs with the given IDs to
+        ``WORKING`` in one ``UPDATE`` statement, and load the jobs. A job
+        that is no longer registered by the time of the ``UPDATE``, because
+        another client claimed it first, is left out. The jobs claimed by
+        this statement are told apart by the lease token that it set.
+
+        :param job_ids: The IDs of the jobs to claim
+        :return: The jobs that were claimed, oldest first
+        """
+        if not job_ids:
+            return []
+
+        values = self._values_for_claimed_jobs
+        self.session.query(DatabaseJob).filter(
+            DatabaseJob.id.in_(job_ids),
+            DatabaseJob.status == DatabaseJobStatus.REGISTERED
+        ).update(values, synchronize_session=False)
+
+        database_jobs = self.session.query(DatabaseJob).filter(
+            DatabaseJob.id.in_(job_ids),
+            DatabaseJob.lease_token == values[DatabaseJob.lease_token]
+        ).order_by(
+            DatabaseJob.date_submitted, DatabaseJob.id
+        ).populate_existing().all()
+        self._count_claimed_jobs(database_jobs)
+
+        return database_jobs
+
+    def _new_lease(self) -> Tuple[UUID, datetime]:
+        """
+
+        :return: A new lease token, and the date on which a lease starting
+            now expires
+        """
+        return uuid4(), datetime.utcnow() + self._LEASE_DURATION
+
+    @property
+    def _values_for_claimed_jobs(self) -> dict:
+        """
+
+        :return: The values to which the columns of jobs claimed by an
+            ``UPDATE`` statement are set. Each call starts a new lease
+        """
+        lease_token, lease_expires_at = self._new_lease()
+        return {
+            DatabaseJob.status: DatabaseJobStatus.WORKING,
+            DatabaseJob.lease_token: lease_token,
+            DatabaseJob.lease_expires_at: lease_expires_at
+        }
+
+    def _count_claimed_jobs(
+            self, database_jobs: Sequence[DatabaseJob]
+    ) -> None:
+        """
+        Move jobs claimed with an ``UPDATE`` statement from the
+        ``REGISTERED`` counters of their services to the ``WORKING``
+        counters. Statements like this bypass the ORM, so the job counters
+        are not updated automatically.
+
+        :param database_jobs: The jobs that were claimed
+        """
+        claimed_jobs_per_service = Counter(
+            database_job.service_id for database_job in database_jobs
+        )
+        changes = {}
+        for service_id, number_of_jobs in claimed_jobs_per_service.items():
+            changes[(service_id, DatabaseJobStatus.REGISTERED)] = \
+                -number_of_jobs
+            changes[(service_id, DatabaseJobStatus.WORKING)] = number_of_jobs
+
+        adjust_job_counters(self.session, changes)
+
+    def __eq__(self, other: JobList) -> bool:
+        """
+
+        :param other: The other job list to compare
+        :return: ``True`` if the jobs in this list are equal to jobs in the
+            other list
+        """
+        return set(self) == set(other)
@@ -0,0 +1,122 @@
+"""
+Contains an asynchronous iterator over rows that are read from the database
+in chunks. SQLAlchemy only provides a blocking API, so each chunk is read
+by a thread in a thread pool, while the event loop gets on with other
+work. The event loop thread only waits for a chunk to be ready, never for
+the database itself.
+
+Sessions are not thread-safe, so a chunk is never read with the session of
+the request that is iterating. Each chunk is read in a session of its own,
+made in the thread that reads it, and closed once the chunk has been read.
+The items of a chunk are therefore detached from any session, and only
+rows that had been committed when the chunk was read are seen.
+
+.. note::
+
+    The ``sqlite3`` module does not allow a connection to be used by any
+    thread other than the one that opened it. For SQLite databases, chunks
+    are read by :data:`SQLITE_EXECUTOR`, which has a single thread, so
+    that every SQLite connection that it opens stays in that thread.
+"""
+import asyncio
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Generic, Optional, Sequence, TypeVar
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from ..config import config
+
+__all__ = ['AsyncChunkIterator', 'DATABASE_EXECUTOR', 'SQLITE_EXECUTOR']
+
+T = TypeVar('T')
+
+DATABASE_EXECUTOR = ThreadPoolExecutor(max_workers=config.DATABASE_POOL_SIZE)
+
+SQLITE_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+
+class AsyncChunkIterator(AsyncIterator, Generic[T]):
+    """
+    Asynchronously iterates over items read from the database, one chunk
+    at a time
+    """
+    _THREAD_BOUND_DIALECTS = frozenset(['sqlite'])
+
+    def __init__(
+            self, bind: Engine,
+            read_chunk: Callable[[Session, Optional[T]], Sequence[T]],
+            chunk_size: int,
+            executor: Optional[Executor]=None
+    ) -> None:
+        """
+
+        :param bind: The engine from which chunks are read
+        :param read_chunk: A blocking function that takes the session in
+            which to read, and the last item of the previous chunk, or
+            ``None`` for the first chunk. It returns up to ``chunk_size``
+            items that come after that item
+        :param chunk_size: The number of items to read at once
+        :param executor: The executor in which chunks are read. By default,
+            this is :data:`SQLITE_EXECUTOR` for SQLite databases, and
+            :data:`DATABASE_EXECUTOR` otherwise
+        """
+        self._bind = bind
+        self._read_chunk = read_chunk
+        self._chunk_size = chunk_size
+        self._executor = executor if executor is not None else (
+            SQLITE_EXECUTOR if bind.dialect.name in
+            self._THREAD_BOUND_DIALECTS else DATABASE_EXECUTOR
+        )
+
+        self._chunk = []  # type: Sequence[T]
+        self._index_in_chunk = 0
+        self._last_item = None  # type: Optional[T]
+        self._is_exhausted = False
+
+    def __aiter__(self) -> 'AsyncChunkIterator[T]':
+        return self
+
+    async def __anext__(self) -> T:
+        """
+
+        :return: The next item, reading the next chunk if the current one
+            has run out
+        :raises: :exc:`StopAsyncIteration` if there are no items left
+        """
+        if self._index_in_chunk == len(self._chunk):
+            if self._is_exhausted:
+                raise StopAsyncIteration()
+            await self._read_next_chunk()
+            if not self._chunk:
+                raise StopAsyncIteration()
+
+        self._last_item = self._chunk[self._index_in_chunk]
+        self._index_in_chunk += 1
+        return self._last_item
+
+    async def _read_next_chunk(self) -> None:
+        """
+        Replace the current chunk with the items that come after it
+        """
+        self._chunk = await asyncio.get_event_loop().run_in_executor(
+            self._executor, self._read_chunk_in_own_session, self._last_item
+        )
+
+        self._index_in_chunk = 0
+        self._is_exhausted = len(self._chunk) < self._chunk_size
+
+    def _read_chunk_in_own_session(
+            self, last_item: Optional[T]
+    ) -> Sequence[T]:
+        """
+        This runs in the executor's thread
+
+        :param last_item: The last item of the previous chunk, or ``None``
+        :return: The next chunk, read in a session that is closed
+            afterwards
+        """
+        session = Session(bind=self._bind)
+        try:
+            return self._read_chunk(session, last_item)
+        finally:
+            session.close()
@@ -15,3 +15,5 @@ from .serialization_error import SerializationError
 from .request_not_json_error import RequestNotJSONError
 from .job_with_uuid_not_found_error import JobWithUUIDNotFound
 from .jsonschema_validation_error import ValidationError
+from .invalid_query_parameter_error import InvalidQueryParameterError
+from .lease_not_held_error import LeaseNotHeldError
@@ -0,0 +1,50 @@
+"""
+Contains an exception thrown if a query string parameter supplied to an
+endpoint cannot be understood
+"""
+from topchef.models.interfaces import APIError
+
+
+class InvalidQueryParameterError(APIError):
+    """
+    Thrown if the value of a query string parameter is not valid for the
+    endpoint that received it. This is a client-side error.
+    """
+    def __init__(self, parameter: str, value: str, reason: str) -> None:
+        """
+
+        :param parameter: The name of the offending query parameter
+        :param value: The value that was supplied for the parameter
+        :param reason: A human-readable explanation of what a valid value
+            for the parameter looks like
+        """
+        self.parameter = parameter
+        self.value = value
+        self.reason = reason
+
+    @property
+    def status_code(self) -> int:
+        """
+
+        :return: Since the client supplied the bad value, the status code is
+            ``400 BAD REQUEST``
+        """
+        return 400
+
+    @property
+    def title(self) -> str:
+        """
+
+        :return: The title of the error
+        """
+        return 'Invalid Query Parameter'
+
+    @property
+    def detail(self) -> str:
+        """
+
+        :return: A message explaining which parameter was rejected and why
+        """
+        return "The value '%s' of query parameter '%s' is invalid. %s" % (
+            self.value, self.parameter, self.reason
+        )
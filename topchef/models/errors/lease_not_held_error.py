@@ -0,0 +1,41 @@
+"""
+Contains an exception thrown if a worker tries to extend the lease on a
+job, or to modify a job, that is not leased to it
+"""
+from ..interfaces import APIError
+from uuid import UUID
+
+
+class LeaseNotHeldError(APIError):
+    """
+    Thrown if a job is not ``WORKING``, or is leased with a different token
+    than the one presented
+    """
+    def __init__(self, job_id: UUID):
+        self._job_id = job_id
+
+    @property
+    def status_code(self) -> int:
+        """
+
+        :return: The 409 status code indicating that the job is not in a
+            state in which its lease can be extended
+        """
+        return 409
+
+    @property
+    def title(self) -> str:
+        """
+
+        :return: The title of the error
+        """
+        return 'Lease Not Held'
+
+    @property
+    def detail(self) -> str:
+        """
+
+        :return: A detailed message explaining what went wrong
+        """
+        return 'The lease on job %s has expired, or is held by another ' \
+            'worker' % self._job_id
@@ -0,0 +1,173 @@
+"""
+Contains a buffer that holds service check ins in memory, and a thread that
+writes them to the ``services`` table in batches.
+
+Recording a check in only touches a dictionary. Every few seconds, the
+latest check in of every service that checked in since the last write is
+written with one batched ``UPDATE``. Until that write is committed, the
+buffer holds the freshest date on which each service checked in, and
+:attr:`topchef.models.Service.has_timed_out` reads it from here.
+
+.. note::
+
+    Set ``HEARTBEAT_WRITE_INTERVAL`` to ``0`` to turn the buffer off. Each
+    check in is then written to the service's row in the transaction of
+    the request that made it.
+
+    Each process running the API has its own buffer. A process only sees
+    the check ins recorded by other processes once they are written to the
+    database. Check ins that have not been written when a process exits
+    are lost, which can make a service look like it checked in up to one
+    write interval earlier than it did.
+"""
+from datetime import datetime
+from threading import Lock
+from typing import Callable, Dict, FrozenSet, Mapping, Optional, Union
+from uuid import UUID
+from sqlalchemy import event
+from sqlalchemy.orm import Session, scoped_session
+from ..config import config
+from ..database import write_heartbeats
+from .periodic_transaction import PeriodicTransaction
+
+__all__ = ['HeartbeatBuffer', 'HeartbeatWriter', 'HEARTBEAT_BUFFER']
+
+
+class HeartbeatBuffer(object):
+    """
+    Holds the latest check in of each service that has not yet been written
+    to the database
+    """
+    def __init__(
+            self,
+            write: Callable[
+                [Session, Mapping[UUID, datetime]], None]=write_heartbeats,
+            is_enabled: bool=True
+    ) -> None:
+        """
+
+        :param write: The function that writes check ins to the database
+        :param is_enabled: Whether check ins are to be buffered at all. If
+            not, nothing writes the buffer, so check ins MUST be written to
+            the database as they are made
+        """
+        self._lock = Lock()
+        self._heartbeats = {}  # type: Dict[UUID, datetime]
+        self._write = write
+        self._is_enabled = is_enabled
+
+    @property
+    def is_enabled(self) -> bool:
+        """
+
+        :return: Whether check ins are held in this buffer, rather than
+            written to the database as they are made
+        """
+        return self._is_enabled
+
+    def record(self, service_id: UUID, date: Optional[datetime]=None) -> None:
+        """
+
+        :param service_id: The ID of the service that checked in
+        :param date: The date of the check in. Defaults to the current UTC
+            date
+        """
+        if date is None:
+            date = datetime.utcnow()
+        with self._lock:
+            if date > self._heartbeats.get(service_id, date.min):
+                self._heartbeats[service_id] = date
+
+    def last_checked_in(self, service_id: UUID) -> Optional[datetime]:
+        """
+
+        :param service_id: The ID of the service to look up
+        :return: The date of the service's latest check in that has not yet
+            been written to the database, or ``None`` if there is none
+        """
+        with self._lock:
+            return self._heartbeats.get(service_id)
+
+    def service_ids(self) -> FrozenSet[UUID]:
+        """
+
+        :return: The IDs of the services with check ins that have not yet
+            been written to the database
+        """
+        with self._lock:
+            return frozenset(self._heartbeats)
+
+    def write(self, session: Union[Session, scoped_session]) -> int:
+        """
+        Write every buffered check in, in the session's transaction. The
+        check ins stay in the buffer until the transaction is committed,
+        and are written again by the next call if it is rolled back. Check
+        ins recorded while the write is in progress are kept.
+
+        :param session: The session in which the check ins are written
+        :return: The number of services whose check ins were written
+        """
+        with self._lock:
+            heartbeats = dict(self._heartbeats)
+
+        if not heartbeats:
+            return 0
+
+        self._write(session, heartbeats)
+
+        if isinstance(session, scoped_session):
+            session = session()
+        event.listen(
+            session, 'after_commit',
+            lambda _: self._forget(heartbeats),
+            once=True
+        )
+        return len(heartbeats)
+
+    def _forget(self, heartbeats: Mapping[UUID, datetime]) -> None:
+        """
+
+        :param heartbeats: Check ins that have been committed to the
+            database. A service that has checked in again since is kept
+        """
+        with self._lock:
+            for service_id, date in heartbeats.items():
+                if self._heartbeats.get(service_id) == date:
+                    del self._heartbeats[service_id]
+
+
+class HeartbeatWriter(PeriodicTransaction):
+    """
+    A daemon thread that writes the buffered check ins every ``interval``
+    seconds
+    """
+    def __init__(
+            self,
+            session_factory: Callable[[], Session],
+            interval: float,
+            heartbeat_buffer: HeartbeatBuffer
+    ) -> None:
+        """
+
+        :param session_factory: A function that makes a new session for
+            each write
+        :param interval: The number of seconds between writes
+        :param heartbeat_buffer: The buffer whose check ins are written
+        """
+        super(HeartbeatWriter, self).__init__(
+            session_factory, interval, 'heartbeat-writer'
+        )
+        self.heartbeat_buffer = heartbeat_buffer
+
+    def transaction(self, session: Session) -> int:
+        """
+
+        :param session: The session in which the check ins are written
+        :return: The number of services whose check ins were written
+        """
+        return self.heartbeat_buffer.write(session)
+
+
+HEARTBEAT_BUFFER = HeartbeatBuffer(
+    is_enabled=config.HEARTBEAT_WRITE_INTERVAL > 0
+)
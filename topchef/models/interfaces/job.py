@@ -3,6 +3,7 @@ Defines TopChef jobs
 """
 import abc
 from enum import Enum
+from typing import Optional
 from uuid import UUID
 from topchef.database.models import JobStatus
 from datetime import datetime
@@ -59,6 +60,27 @@ class Job(object, metaclass=abc.ABCMeta):
     def date_submitted(self) -> datetime:
         raise NotImplementedError()
 
+    @property
+    @abc.abstractmethod
+    def lease_token(self) -> Optional[UUID]:
+        """
+
+        :return: The token that a worker must present to extend its lease
+            on this job, or ``None`` if the job is not leased to a worker
+        """
+        raise NotImplementedError()
+
+    @property
+    @abc.abstractmethod
+    def lease_expires_at(self) -> Optional[datetime]:
+        """
+
+        :return: The date after which this job is returned to the queue,
+            unless its lease is extended, or ``None`` if the job is not
+            leased to a worker
+        """
+        raise NotImplementedError()
+
     @property
     @abc.abstractmethod
     def parameter_schema(self) -> dict:
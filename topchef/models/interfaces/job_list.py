@@ -1,8 +1,12 @@
 import abc
+import operator
+from collections import namedtuple
 from collections.abc import MutableMapping, AsyncIterable
+from datetime import datetime
 from uuid import UUID
 from topchef.models.interfaces.job import Job
-from typing import Iterator, AsyncIterator, Union
+from typing import Iterator, AsyncIterator, Union, Optional, Sequence, Tuple
+from typing import Any
 
 
 class JobList(MutableMapping, AsyncIterable, metaclass=abc.ABCMeta):
@@ -10,6 +14,80 @@ class JobList(MutableMapping, AsyncIterable, metaclass=abc.ABCMeta):
     Describes an interface for manipulating a set of jobs posted to the API.
     The Job list should be iterating over all the jobs in the list.
     """
+    class Summary(namedtuple('Summary', [
+        'registered', 'working', 'completed', 'error',
+        'oldest_registered_job_date'
+    ])):
+        """
+        The number of jobs in a list with each status, and the date on
+        which the oldest registered job was submitted. This date is
+        ``None`` if there are no registered jobs.
+        """
+
+    class Filter(namedtuple('Filter', [
+        'document', 'path', 'operator', 'value'
+    ])):
+        """
+        A condition on one value inside the ``parameters`` or ``results``
+        of a job. ``path`` is a sequence of object keys and array indices
+        leading to the value, ``operator`` is one of the keys of
+        ``OPERATORS``, and ``value`` is a string, number, boolean or
+        ``None``. A job matches the filter if the value at the path exists,
+        has the same JSON type as ``value``, and compares with it as
+        ``operator`` requires. Jobs in which the path does not exist, or
+        holds a value of another type, never match.
+        """
+        DOCUMENTS = frozenset(['parameters', 'results'])
+
+        OPERATORS = {
+            '=': operator.eq,
+            '!=': operator.ne,
+            '<': operator.lt,
+            '<=': operator.le,
+            '>': operator.gt,
+            '>=': operator.ge
+        }
+
+        def matches(self, job: Job) -> bool:
+            """
+
+            :param job: The job to check
+            :return: ``True`` if the job matches this filter
+            """
+            value = getattr(job, self.document)
+            for key in self.path:
+                if isinstance(key, int):
+                    if not isinstance(value, list) or \
+                            not 0 <= key < len(value):
+                        return False
+                elif not isinstance(value, dict) or key not in value:
+                    return False
+                value = value[key]
+
+            if self.json_type(value) != self.json_type(self.value):
+                return False
+            return self.OPERATORS[self.operator](value, self.value)
+
+        @staticmethod
+        def json_type(value: Any) -> Optional[str]:
+            """
+
+            :param value: A decoded JSON value
+            :return: The name of the value's JSON type, if it is one of
+                ``string``, ``number``, ``boolean`` or ``null``, otherwise
+                ``None``
+            """
+            if value is None:
+                return 'null'
+            elif isinstance(value, bool):
+                return 'boolean'
+            elif isinstance(value, (int, float)):
+                return 'number'
+            elif isinstance(value, str):
+                return 'string'
+            else:
+                return None
+
     @abc.abstractmethod
     def __getitem__(self, job_id: UUID) -> Job:
         """
@@ -78,6 +156,91 @@ class JobList(MutableMapping, AsyncIterable, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def page(
+            self, limit: int, after: Optional[Tuple[datetime, UUID]]=None,
+            filters: Sequence['JobList.Filter']=()
+    ) -> Sequence[Job]:
+        """
+        Return a page of jobs from this list. Pages are sorted by the date
+        on which each job was submitted, and then by job ID.
+
+        :param limit: The maximum number of jobs on the page
+        :param after: The ``(date_submitted, job_id)`` of the last job on
+            the previous page. If this is ``None``, the first page is returned
+        :param filters: Conditions that every job on the page must match.
+            Jobs that do not match are skipped over, so a page is only
+            shorter than ``limit`` if it is the last page
+        :return: At most ``limit`` jobs that sort after ``after``, and
+            match every filter
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def registered_jobs(self, limit: int) -> Sequence[Job]:
+        """
+        Return the head of the queue for this list. These are the oldest
+        jobs with status ``REGISTERED``, in the order in which they were
+        submitted.
+
+        :param limit: The maximum number of jobs to return
+        :return: At most ``limit`` registered jobs, oldest first
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def summary(self) -> 'JobList.Summary':
+        """
+        Summarize the jobs in this list without loading them. The time
+        taken to get the summary MUST NOT depend on the number of jobs
+        in the list.
+
+        :return: The number of jobs with each status, and the submission
+            date of the oldest registered job
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def claim_next_job(self) -> Optional[Job]:
+        """
+        Atomically take the oldest job with status ``REGISTERED`` off the
+        queue and mark it as ``WORKING``. Two clients claiming jobs at the
+        same time MUST NOT receive the same job.
+
+        :return: The claimed job, or ``None`` if there are no registered jobs
+            left to claim
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def claim_next_jobs(self, count: int) -> Sequence[Job]:
+        """
+        Atomically take up to ``count`` of the oldest jobs with status
+        ``REGISTERED`` off the queue, and mark them as ``WORKING``. As with
+        :meth:`claim_next_job`, no job may be claimed by two clients.
+
+        :param count: The maximum number of jobs to claim
+        :return: The claimed jobs, oldest first. This is empty if there are
+            no registered jobs left to claim
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def extend_lease(
+            self, job_id: UUID, lease_token: UUID
+    ) -> Optional[datetime]:
+        """
+        Push back the expiry date of the lease on a ``WORKING`` job. The
+        lease is only extended if ``lease_token`` is the token handed out
+        when the job was claimed.
+
+        :param job_id: The ID of the job whose lease is to be extended
+        :param lease_token: The token of the worker holding the lease
+        :return: The new expiry date of the lease, or ``None`` if the job
+            is not leased with that token
+        """
+        raise NotImplementedError()
+
     @abc.abstractmethod
     def __eq__(self, other: 'JobList') -> bool:
         """
@@ -5,7 +5,7 @@ services and experiment setups.
 """
 import abc
 from collections.abc import Iterable, AsyncIterable
-from typing import Callable, AsyncIterator
+from typing import Callable, AsyncIterator, Sequence
 from typing import Iterator as IteratorType
 from uuid import UUID
 from sqlalchemy.orm import Session
@@ -201,6 +201,19 @@ class Service(Iterable, AsyncIterable, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def new_jobs(self, parameter_sets: Sequence[JSON]) -> Sequence[UUID]:
+        """
+        Create one new job for each set of parameters. This is meant for
+        submitting many jobs at once, and SHOULD write all of the jobs to
+        storage in one operation.
+
+        :param parameter_sets: The parameters for each of the new jobs
+        :return: The IDs of the new jobs, in the same order as the
+            parameters
+        """
+        raise NotImplementedError()
+
     @property
     @abc.abstractmethod
     def jobs(self) -> JobList:
@@ -210,6 +223,15 @@ class Service(Iterable, AsyncIterable, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
+    @property
+    def job_summary(self) -> JobList.Summary:
+        """
+
+        :return: The number of this service's jobs with each status, and
+            the date of its oldest registered job
+        """
+        return self.jobs.summary()
+
     def __eq__(self, other: 'Service') -> bool:
         return self.id == other.id
 
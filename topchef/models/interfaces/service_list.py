@@ -4,7 +4,7 @@ Contains an interface for getting services
 import abc
 from uuid import UUID
 from collections.abc import AsyncIterable, MutableMapping
-from typing import Union, AsyncIterator, Iterator
+from typing import Union, AsyncIterator, Iterator, Optional, Sequence
 from topchef.json_type import JSON_TYPE as JSON
 from topchef.models.interfaces.service import Service
 
@@ -62,3 +62,25 @@ class ServiceList(MutableMapping, AsyncIterable, metaclass=abc.ABCMeta):
             result_schema: JSON
     ) -> Service:
         raise NotImplementedError()
+
+    @abc.abstractmethod
+    def page(
+            self, limit: Optional[int], after: Optional[UUID]=None,
+            is_available: Optional[bool]=None, is_alive: Optional[bool]=None
+    ) -> Sequence[Service]:
+        """
+        Return a page of services from this list. Pages are sorted by
+        service ID.
+
+        :param limit: The maximum number of services on the page, or
+            ``None`` for every service after ``after``
+        :param after: The ID of the last service on the previous page. If
+            this is ``None``, the first page is returned
+        :param is_available: If this is not ``None``, only services whose
+            ``is_service_available`` flag equals it are returned
+        :param is_alive: If this is ``True``, only services that have not
+            timed out are returned. If this is ``False``, only services that
+            have timed out are returned
+        :return: At most ``limit`` services that sort after ``after``
+        """
+        raise NotImplementedError()
@@ -64,6 +64,18 @@ class Job(JobInterface):
     def date_submitted(self) -> datetime:
         return self.db_model.date_submitted
 
+    @property
+    def lease_token(self) -> Optional[UUID]:
+        if self.db_model.status != DatabaseJobStatus.WORKING:
+            return None
+        return self.db_model.lease_token
+
+    @property
+    def lease_expires_at(self) -> Optional[datetime]:
+        if self.db_model.status != DatabaseJobStatus.WORKING:
+            return None
+        return self.db_model.lease_expires_at
+
     @results.setter
     def results(self, new_results: JSON) -> None:
         self._assert_json(new_results)
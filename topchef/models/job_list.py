@@ -9,3 +9,11 @@ class JobList(JobListFromQuery):
     @property
     def root_job_query(self):
         return self.session.query(DatabaseJob)
+
+    def _is_loaded_job_in_list(self, database_job: DatabaseJob) -> bool:
+        """
+
+        :param database_job: A job in the session's identity map
+        :return: ``True``, since every job is in this list
+        """
+        return True
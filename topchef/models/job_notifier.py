@@ -0,0 +1,148 @@
+"""
+Contains a notifier that lets request threads wait for jobs to be submitted
+to a service. This is what allows a worker to long-poll for its next job
+instead of polling the database over and over again.
+
+Each service has a generation counter, which goes up by one every time a
+job is submitted to the service. A waiter reads the generation for the
+service *before* it looks for jobs in the database, and then waits for the
+generation to change. A job that is submitted in between the lookup and
+the wait changes the generation, so the waiter will not sleep through it.
+
+A service's counter is only kept while some thread holds a generation
+that was read from it. Once the last waiter is done with it, the counter
+is thrown away, so that the notifier does not hold on to every service
+that has ever had a job submitted to it.
+
+.. note::
+
+    Notifications are only delivered to waiters in the same process as the
+    thread that submitted the job. If the API runs in several processes,
+    waiters in the other processes will only see the job when they time
+    out and look for jobs again.
+"""
+from threading import Condition, Lock
+from time import monotonic
+from typing import NamedTuple, Union
+from uuid import UUID
+from weakref import WeakValueDictionary
+from sqlalchemy import event
+from sqlalchemy.orm import Session, scoped_session
+
+__all__ = ['JobNotifier', 'JOB_NOTIFIER']
+
+
+class _Announcements(object):
+    """
+    Counts the jobs announced for one service, and lets threads wait for
+    the count to change
+    """
+    def __init__(self, lock: Lock) -> None:
+        """
+
+        :param lock: The lock shared by every service's condition
+        """
+        self.condition = Condition(lock)
+        self.count = 0
+
+
+class JobNotifier(object):
+    """
+    Wakes up threads waiting for jobs to be submitted to a service
+    """
+    Generation = NamedTuple('Generation', [
+        ('announcements', _Announcements), ('count', int)
+    ])
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._announcements = WeakValueDictionary()
+
+    def generation(self, service_id: UUID) -> Generation:
+        """
+
+        :param service_id: The ID of the service to check
+        :return: The number of times that jobs for the service have been
+            announced while anyone was waiting for them. Holding on to the
+            generation keeps the service's counter alive until it is
+            passed to :meth:`wait`
+        """
+        with self._lock:
+            announcements = self._announcements_for(service_id)
+            return self.Generation(announcements, announcements.count)
+
+    def notify(self, service_id: UUID) -> None:
+        """
+        Announce that a job was submitted to a service, and wake up all the
+        threads waiting for that service. If nobody is waiting, there is
+        nothing to announce
+
+        :param service_id: The ID of the service that got a new job
+        """
+        with self._lock:
+            announcements = self._announcements.get(service_id)
+            if announcements is not None:
+                announcements.count += 1
+                announcements.condition.notify_all()
+
+    def notify_after_commit(
+            self, session: Union[Session, scoped_session], service_id: UUID
+    ) -> None:
+        """
+        Announce a job for the service once the session's transaction is
+        committed. Waiters are woken up only when the new job can be seen
+        by their own database sessions.
+
+        :param session: The session in which the job was added. If this is
+            a registry of sessions, the listener is attached to the
+            registry's session for the current request, rather than to
+            every session that the registry makes
+        :param service_id: The ID of the service that got a new job
+        """
+        if isinstance(session, scoped_session):
+            session = session()
+        event.listen(
+            session, 'after_commit',
+            lambda _: self.notify(service_id),
+            once=True
+        )
+
+    def wait(
+            self, service_id: UUID, generation: Generation, timeout: float
+    ) -> bool:
+        """
+        Block until a job is announced for the service, or until the
+        timeout expires
+
+        :param service_id: The ID of the service to wait for
+        :param generation: The generation of the service that the waiter
+            last saw
+        :param timeout: The maximum number of seconds to wait
+        :return: ``True`` if a job was announced after ``generation``,
+            otherwise ``False``
+        """
+        deadline = monotonic() + timeout
+        with self._lock:
+            announcements = generation.announcements
+            while announcements.count == generation.count:
+                remaining_time = deadline - monotonic()
+                if remaining_time <= 0:
+                    return False
+                announcements.condition.wait(remaining_time)
+            return True
+
+    def _announcements_for(self, service_id: UUID) -> _Announcements:
+        """
+        This MUST be called with the lock held
+
+        :param service_id: The ID of the service
+        :return: The service's counter, which is made if nobody holds it
+        """
+        announcements = self._announcements.get(service_id)
+        if announcements is None:
+            announcements = _Announcements(self._lock)
+            self._announcements[service_id] = announcements
+        return announcements
+
+
+JOB_NOTIFIER = JobNotifier()
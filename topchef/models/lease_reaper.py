@@ -0,0 +1,59 @@
+"""
+Contains a thread that periodically returns jobs with expired leases to
+their services' queues. Each sweep is one transaction, in which every
+expired job is reaped by a single ``UPDATE`` statement. Workers waiting for
+jobs from a service that had jobs reaped are woken up once the sweep is
+committed.
+
+.. note::
+
+    Every process running the API runs its own reaper. Sweeps from
+    different processes do not conflict, since a job that has been reaped
+    no longer has an expired lease, and so is not reaped twice.
+"""
+from typing import Callable, Dict
+from uuid import UUID
+from sqlalchemy.orm import Session
+from ..database import reap_expired_leases
+from .job_notifier import JobNotifier, JOB_NOTIFIER
+from .periodic_transaction import PeriodicTransaction
+
+
+class LeaseReaper(PeriodicTransaction):
+    """
+    A daemon thread that reaps expired leases every ``interval`` seconds
+    """
+    def __init__(
+            self,
+            session_factory: Callable[[], Session],
+            interval: float,
+            job_notifier: JobNotifier=JOB_NOTIFIER,
+            reap: Callable[[Session], Dict[UUID, int]]=reap_expired_leases
+    ) -> None:
+        """
+
+        :param session_factory: A function that makes a new session for
+            each sweep
+        :param interval: The number of seconds between sweeps
+        :param job_notifier: The notifier told about the services whose
+            jobs were reaped
+        :param reap: The function that reaps expired leases in a session
+        """
+        super(LeaseReaper, self).__init__(
+            session_factory, interval, 'lease-reaper'
+        )
+        self._job_notifier = job_notifier
+        self._reap = reap
+
+    def transaction(self, session: Session) -> int:
+        """
+        Reap expired leases, and wake up the workers waiting for jobs from
+        the services whose jobs were reaped once the sweep is committed
+
+        :param session: The session in which leases are reaped
+        :return: The number of jobs that were returned to their queues
+        """
+        reaped_jobs = self._reap(session)
+        for service_id in reaped_jobs:
+            self._job_notifier.notify_after_commit(session, service_id)
+        return sum(reaped_jobs.values())
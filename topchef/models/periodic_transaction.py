@@ -0,0 +1,82 @@
+"""
+Contains a base class for daemon threads that do some work in the database
+every few seconds. Each run is one transaction in a new session, which is
+committed if the work succeeds, and rolled back if it fails. A failed run
+is logged, and tried again after the next interval.
+"""
+import abc
+import logging
+from threading import Event, Thread
+from typing import Any, Callable
+from sqlalchemy.orm import Session
+
+LOG = logging.getLogger(__name__)
+
+
+class PeriodicTransaction(Thread, metaclass=abc.ABCMeta):
+    """
+    A daemon thread that runs :meth:`transaction` every ``interval``
+    seconds
+    """
+    def __init__(
+            self,
+            session_factory: Callable[[], Session],
+            interval: float,
+            name: str
+    ) -> None:
+        """
+
+        :param session_factory: A function that makes a new session for
+            each run
+        :param interval: The number of seconds between runs
+        :param name: The name of the thread
+        """
+        super(PeriodicTransaction, self).__init__(name=name, daemon=True)
+        self.session_factory = session_factory
+        self.interval = interval
+        self._stopped = Event()
+
+    @abc.abstractmethod
+    def transaction(self, session: Session) -> Any:
+        """
+        Do the work for one run
+
+        :param session: The session in which the work is to be done. This
+            is committed by the caller
+        :return: The outcome of the run
+        """
+        raise NotImplementedError()
+
+    def run(self) -> None:
+        """
+        Run until the thread is stopped
+        """
+        while not self._stopped.wait(self.interval):
+            try:
+                self.sweep()
+            except Exception:
+                LOG.exception('The periodic task %s failed', self.name)
+
+    def stop(self) -> None:
+        """
+        Stop running. A run that has started is allowed to finish.
+        """
+        self._stopped.set()
+
+    def sweep(self) -> Any:
+        """
+        Run :meth:`transaction` once, in a new session, and commit it
+
+        :return: The outcome of the run
+        """
+        session = self.session_factory()
+        try:
+            outcome = self.transaction(session)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        return outcome
@@ -3,8 +3,8 @@ Contains an implementation of the ``Service`` interface that pulls all the
 required data from a SQLAlchemy model class.
 """
 import json
-from typing import Type, Callable
-from uuid import UUID
+from typing import Type, Callable, Sequence
+from uuid import UUID, uuid4
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.declarative import declarative_base
@@ -12,8 +12,12 @@ from .interfaces import Service as ServiceInterface
 from .interfaces import JobList as JobListInterface
 from .abstract_classes import JobListFromQuery
 from .job import Job
+from .heartbeat_buffer import HeartbeatBuffer, HEARTBEAT_BUFFER
+from .job_notifier import JobNotifier, JOB_NOTIFIER
+from ..database import adjust_job_counters, job_counts
 from ..database.models import Job as DatabaseJob
 from ..database.models import Service as DatabaseService
+from ..database.schemas import JobStatus as DatabaseJobStatus
 from ..json_type import JSON_TYPE as JSON
 
 
@@ -26,10 +30,14 @@ class Service(ServiceInterface):
             self,
             database_service: DatabaseService,
             session_getter_for_model:
-            Callable[[declarative_base()], Session]=Session.object_session
+            Callable[[declarative_base()], Session]=Session.object_session,
+            job_notifier: JobNotifier=JOB_NOTIFIER,
+            heartbeat_buffer: HeartbeatBuffer=HEARTBEAT_BUFFER
     ) -> None:
         self.db_model = database_service
         self._session_getter_for_model = session_getter_for_model
+        self._job_notifier = job_notifier
+        self._heartbeat_buffer = heartbeat_buffer
 
     @property
     def id(self) -> UUID:
@@ -110,11 +118,18 @@ class Service(ServiceInterface):
     def has_timed_out(self) -> bool:
         """
 
-        :return: Whether the service has timed out or not
+        :return: Whether the service has timed out or not. A check in that
+            has not yet been written to the database counts, if it is later
+            than the one in the database
         """
-        return (
-                   datetime.utcnow() - self.db_model.last_checked_in
-               ) > self.timeout
+        last_checked_in = self.db_model.last_checked_in
+        buffered_check_in = self._heartbeat_buffer.last_checked_in(self.id)
+
+        if buffered_check_in is not None and \
+                buffered_check_in > last_checked_in:
+            last_checked_in = buffered_check_in
+
+        return (datetime.utcnow() - last_checked_in) > self.timeout
 
     @property
     def timeout(self) -> timedelta:
@@ -129,7 +144,16 @@ class Service(ServiceInterface):
         self.db_model.timeout = new_timeout.total_seconds()
 
     def check_in(self) -> None:
-        self.db_model.last_checked_in = datetime.utcnow()
+        """
+        Record the check in in the heartbeat buffer, which writes it to the
+        database together with the check ins of other services. If the
+        buffer is turned off, the check in is written to the service's
+        database model instead
+        """
+        if self._heartbeat_buffer.is_enabled:
+            self._heartbeat_buffer.record(self.id)
+        else:
+            self.db_model.last_checked_in = datetime.utcnow()
 
     @classmethod
     def new(cls, name: str, description: str, registration_schema: JSON,
@@ -148,9 +172,47 @@ class Service(ServiceInterface):
         db_job = database_job_constructor(self.db_model, parameters)
         session = self._session_getter_for_model(self.db_model)
         session.add(db_job)
+        self._job_notifier.notify_after_commit(session, self.id)
 
         return Job(db_job)
 
+    def new_jobs(self, parameter_sets: Sequence[JSON]) -> Sequence[UUID]:
+        """
+        Write all the new jobs with one bulk ``INSERT``. The jobs are
+        inserted as plain rows, without creating an ORM object for each
+        job.
+
+        Jobs are queued in order of ``(date_submitted, job_id)``, and job
+        IDs are random, so each job is submitted one microsecond after the
+        job before it. That way, the jobs are claimed in the order in which
+        they were given.
+
+        :param parameter_sets: The parameters for each of the new jobs
+        :return: The IDs of the new jobs
+        """
+        first_date_submitted = datetime.utcnow()
+        rows = [
+            {
+                'id': uuid4(),
+                'status': DatabaseJobStatus.REGISTERED,
+                'parameters': parameters,
+                'results': None,
+                'date_submitted': first_date_submitted + timedelta(
+                    microseconds=index
+                ),
+                'service_id': self.id
+            } for index, parameters in enumerate(parameter_sets)
+        ]
+
+        session = self._session_getter_for_model(self.db_model)
+        session.bulk_insert_mappings(DatabaseJob, rows)
+        adjust_job_counters(
+            session, {(self.id, DatabaseJobStatus.REGISTERED): len(rows)}
+        )
+        self._job_notifier.notify_after_commit(session, self.id)
+
+        return [row['id'] for row in rows]
+
     @property
     def jobs(self) -> JobListInterface:
         return self._ListOfJobsForService(
@@ -192,3 +254,41 @@ class Service(ServiceInterface):
             return self.session.query(DatabaseJob).filter_by(
                 service_id=self.service_id
             )
+
+        def _is_loaded_job_in_list(self, database_job: DatabaseJob) -> bool:
+            """
+
+            :param database_job: A job in the session's identity map
+            :return: Whether the job belongs to this service
+            """
+            return database_job.service_id == self.service_id
+
+        def __len__(self) -> int:
+            """
+
+            :return: The number of jobs for this service, read from the
+                service's job counters
+            """
+            return sum(job_counts(self.session, self.service_id).values())
+
+        def summary(self) -> JobListInterface.Summary:
+            """
+            Read the number of jobs with each status from the service's job
+            counters, and look up the oldest registered job in the index
+            on ``(service_id, status, date_submitted)``
+
+            :return: The summary of this service's jobs
+            """
+            counts = job_counts(self.session, self.service_id)
+            oldest_registered_job = self._registered_jobs_in_queue_order.\
+                with_entities(DatabaseJob.date_submitted).first()
+
+            return self.Summary(
+                oldest_registered_job_date=None
+                if oldest_registered_job is None
+                else oldest_registered_job[0],
+                **{
+                    status.name.lower(): count
+                    for status, count in counts.items()
+                }
+            )
@@ -1,12 +1,17 @@
-from collections.abc import AsyncIterator as CollectionsAsyncIterator
-from collections.abc import Awaitable
-from typing import Union, Iterator, Sequence, AsyncIterator
+from datetime import datetime
+from typing import Union, Iterator, Optional, Sequence, AsyncIterator
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, not_, or_
+from sqlalchemy.orm import Session, Query
 
+from topchef.database import delete_service, loaded_instance
+from topchef.database import is_alive as is_alive_in_database
+from topchef.database.models import Job as DatabaseJob
 from topchef.database.models import Service as DatabaseService
 from topchef.json_type import JSON_TYPE as JSON
+from topchef.models.async_chunk_iterator import AsyncChunkIterator
+from topchef.models.heartbeat_buffer import HeartbeatBuffer, HEARTBEAT_BUFFER
 from topchef.models.interfaces.service_list import ServiceList as IServiceList
 from topchef.models.service import Service
 
@@ -15,12 +20,20 @@ class ServiceList(IServiceList):
     """
     Implements a means of getting services from a relational DB back end
     """
-    def __init__(self, session: Session) -> None:
+    _ITERATION_CHUNK_SIZE = 1000
+
+    def __init__(
+            self, session: Session,
+            heartbeat_buffer: HeartbeatBuffer=HEARTBEAT_BUFFER
+    ) -> None:
         """
 
         :param session: The database session to use for getting services
+        :param heartbeat_buffer: The buffer holding check ins that have not
+            yet been written to the database
         """
         self.session = session
+        self._heartbeat_buffer = heartbeat_buffer
 
     def __getitem__(self, service_id: UUID) -> Service:
         db_model = self._get_db_model_by_id(self.session, service_id)
@@ -36,11 +49,25 @@ class ServiceList(IServiceList):
         self.session.add(db_model)
 
     def __delitem__(self, service_id: UUID) -> None:
-        db_model = self._get_db_model_by_id(self.session, service_id)
+        """
+        Delete the service and all of its jobs with one ``DELETE`` statement
+        for each table, instead of loading and deleting each job. Pending
+        changes are flushed first, and the deleted objects that were loaded
+        into the session are removed from it afterwards. Everything is
+        deleted in the session's transaction, which the caller commits.
+        Services with a long history are better deleted with the
+        ``delete-service`` command, which deletes their jobs in chunks,
+        and commits each chunk in a session of its own.
+
+        :param service_id: The ID of the service to delete
+        :raises: :exc:`KeyError` if a service with this ID does not exist
+        """
+        self.session.flush()
+
+        if not delete_service(self.session, service_id):
+            raise KeyError('A model with that ID does not exist')
 
-        for job in db_model.jobs:
-            self.session.delete(job)
-        self.session.delete(db_model)
+        self._expunge_deleted_service(service_id)
 
     def __contains__(
             self, service_or_service_id: Union[UUID, Service]
@@ -65,8 +92,59 @@ class ServiceList(IServiceList):
         )
 
     def __aiter__(self) -> AsyncIterator[Service]:
-        services = self.session.query(DatabaseService).all()  # type: list
-        return self._AsynchronousServicesIterator(services)
+        """
+        Iterate asynchronously over the services. The services are read in
+        order of their IDs, ``_ITERATION_CHUNK_SIZE`` at a time, in a thread
+        pool, so that the event loop is not blocked while the database is
+        queried. Each chunk is read in a session of its own, so only
+        services that have been committed are seen.
+
+        :return: An iterator that can asynchronously iterate over all the
+            services
+        """
+        return AsyncChunkIterator(
+            self.session.get_bind(), self._services_after,
+            self._ITERATION_CHUNK_SIZE
+        )
+
+    def page(
+            self, limit: Optional[int], after: Optional[UUID]=None,
+            is_available: Optional[bool]=None, is_alive: Optional[bool]=None
+    ) -> Sequence[Service]:
+        """
+        Return a page of services, filtered in SQL. Whether a service is
+        alive is worked out from the deadline ``last_checked_in +
+        heartbeat_timeout_seconds``, which is read from the
+        ``ix_services_available_id_checked_in_timeout`` index rather than
+        from the table. A service with a check in that is still in the
+        heartbeat buffer checked in less than one write interval ago, and so
+        is alive whatever the database says.
+
+        :param limit: The maximum number of services on the page, or
+            ``None`` for every service after ``after``
+        :param after: The ID of the last service on the previous page
+        :param is_available: The required availability, if any
+        :param is_alive: Whether the services must be alive or timed out,
+            if either
+        :return: At most ``limit`` services, sorted by ID
+        """
+        query = self.session.query(DatabaseService)
+
+        if after is not None:
+            query = query.filter(DatabaseService.id > after)
+        if is_available is not None:
+            query = query.filter(
+                DatabaseService.is_service_available == is_available
+            )
+        if is_alive is not None:
+            query = self._filter_by_liveness(query, is_alive)
+
+        return [
+            Service(db_service, heartbeat_buffer=self._heartbeat_buffer)
+            for db_service in query.order_by(
+                DatabaseService.id
+            ).limit(limit).all()
+        ]
 
     def new(
             self, name: str, description: str, registration_schema: JSON,
@@ -81,52 +159,108 @@ class ServiceList(IServiceList):
     def _get_db_model_by_id(
             session: Session, service_id: UUID
     ) -> DatabaseService:
+        """
+        Look the service up in the session's identity map, and only query
+        the database if it has not been loaded yet
 
-        db_model = session.query(
-            DatabaseService
-        ).filter_by(
-            id=service_id
-        ).first()
+        :param session: The session to use
+        :param service_id: The ID of the service to get
+        :return: The service's database model
+        :raises: :exc:`KeyError` if a service with this ID does not exist
+        """
+        db_model = loaded_instance(session, DatabaseService, service_id)
+
+        if db_model is None:
+            db_model = session.query(
+                DatabaseService
+            ).filter_by(
+                id=service_id
+            ).first()
 
         if db_model is None:
             raise KeyError('A model with that ID does not exist')
 
         return db_model
 
+    def _services_after(
+            self, session: Session, last_service: Optional[Service]
+    ) -> Sequence[Service]:
+        """
+
+        :param session: The session in which to read the services
+        :param last_service: The last service of the previous chunk, or
+            ``None`` to get the first chunk
+        :return: The next chunk of services, sorted by ID
+        """
+        query = session.query(DatabaseService)
+
+        if last_service is not None:
+            query = query.filter(DatabaseService.id > last_service.id)
+
+        return [
+            Service(db_service) for db_service in query.order_by(
+                DatabaseService.id
+            ).limit(self._ITERATION_CHUNK_SIZE).all()
+        ]
+
+    def _expunge_deleted_service(self, service_id: UUID) -> None:
+        """
+
+        :param service_id: The ID of a service whose rows were deleted
+            without the ORM. The service and its jobs are removed from the
+            session, so that they are not written back
+        """
+        for instance in list(self.session.identity_map.values()):
+            if isinstance(instance, DatabaseService) and \
+                    instance.id == service_id:
+                self.session.expunge(instance)
+            elif isinstance(instance, DatabaseJob) and \
+                    instance.service_id == service_id:
+                self.session.expunge(instance)
+
+    def _filter_by_liveness(self, query: Query, is_alive: bool) -> Query:
+        """
+
+        :param query: The query for services to filter
+        :param is_alive: Whether the services that are kept must be alive,
+            or timed out
+        :return: The filtered query
+        """
+        alive_in_database = is_alive_in_database(datetime.utcnow())
+        buffered_service_ids = self._heartbeat_buffer.service_ids()
+
+        if buffered_service_ids:
+            checked_in_recently = DatabaseService.id.in_(buffered_service_ids)
+            if is_alive:
+                condition = or_(alive_in_database, checked_in_recently)
+            else:
+                condition = and_(
+                    not_(alive_in_database), not_(checked_in_recently)
+                )
+        elif is_alive:
+            condition = alive_in_database
+        else:
+            condition = not_(alive_in_database)
+
+        return query.filter(condition)
+
     def _check_service_membership(self, service: Service):
-        number_of_matches = self.session.query(DatabaseService).filter_by(
-            id=service.id).count()
-        return bool(number_of_matches)
+        return self._check_id_membership(service.id)
 
     def _check_id_membership(self, service_id: UUID) -> bool:
-        number_of_matches = self.session.query(DatabaseService).filter_by(
-            id=service_id
-        ).count()
-        return bool(number_of_matches)
-
-    class _AsynchronousServicesIterator(
-        CollectionsAsyncIterator
-    ):
-        def __init__(self, services: Sequence[Service]):
-            self.services = services
-            self._last_served_index = 0
-
-        def __len__(self):
-            return len(self.services)
-
-        async def __anext__(self) -> Awaitable:
-            if self._last_served_index < len(self.services):
-                service = self._AsyncServiceFuture(
-                    Service(self.services[self._last_served_index])
-                )
-                self._last_served_index += 1
-            else:
-                raise StopAsyncIteration()
-            return service
+        """
 
-        class _AsyncServiceFuture(Awaitable):
-            def __init__(self, service: Service):
-                self.service = service
+        :param service_id: The ID of the service to look for
+        :return: Whether the service exists. Services that are not loaded
+            are looked for with an ``EXISTS`` query
+        """
+        if loaded_instance(
+                self.session, DatabaseService, service_id
+        ) is not None:
+            return True
 
-            def __await__(self):
-                return self.service
+        return self.session.query(
+            self.session.query(DatabaseService).filter_by(
+                id=service_id
+            ).exists()
+        ).scalar()
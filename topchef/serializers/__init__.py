@@ -11,8 +11,11 @@ from .service_overview import ServiceOverview
 from .api_exception import APIException
 from .service_detail import ServiceDetail
 from .job_overview import JobOverview
+from .job_summary import JobSummary
 from .job_detail import JobDetail
+from .claimed_job import ClaimedJob
 from .job_modification import JobModification
+from .job_lease import JobLease
 from .json_schema_validator import JSONSchemaValidator
 from .service_modifier import ServiceModification
 from .new_job import NewJob
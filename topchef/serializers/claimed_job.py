@@ -0,0 +1,15 @@
+"""
+Contains a serializer for a job that a worker has just claimed
+"""
+from marshmallow import fields
+from .job_detail import JobDetail
+
+
+class ClaimedJob(JobDetail):
+    """
+    All the information about a job, together with the token of the lease
+    that the worker was given when it claimed the job. The token is only
+    handed to the worker that claimed the job, and is never shown anywhere
+    else.
+    """
+    lease_token = fields.UUID(allow_none=True)
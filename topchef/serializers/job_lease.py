@@ -0,0 +1,14 @@
+"""
+Describes a lease on a job, and the ``POST`` request sent in to extend it
+"""
+from marshmallow import Schema, fields
+
+
+class JobLease(Schema):
+    """
+    The schema that must be satisfied for a valid request to extend the
+    lease on a job. The expiry date is set by the API, and cannot be
+    chosen by the worker.
+    """
+    lease_token = fields.UUID(required=True)
+    lease_expires_at = fields.DateTime(dump_only=True)
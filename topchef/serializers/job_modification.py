@@ -8,7 +8,9 @@ from .custom_fields import JobStatusField
 class JobModification(Schema):
     """
     The schema that must be satisfied for a valid request to change the job
-    parameters
+    parameters. A job that is leased to a worker can only be changed with
+    the token of that lease.
     """
     status = JobStatusField(required=False, allow_none=True)
     results = fields.Dict(required=False, allow_none=True)
+    lease_token = fields.UUID(required=False, allow_none=True)
@@ -0,0 +1,17 @@
+"""
+Contains a serializer for summarizing the jobs in a job list, without
+listing the jobs themselves
+"""
+from marshmallow import Schema, fields
+
+
+class JobSummary(Schema):
+    """
+    Describes the number of jobs with each status, and the date on which the
+    oldest job still waiting in the queue was submitted
+    """
+    registered = fields.Integer(dump_only=True, required=True)
+    working = fields.Integer(dump_only=True, required=True)
+    completed = fields.Integer(dump_only=True, required=True)
+    error = fields.Integer(dump_only=True, required=True)
+    oldest_registered_job_date = fields.DateTime(dump_only=True)
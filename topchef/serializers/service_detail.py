@@ -2,7 +2,7 @@
 Contains a serializer that can output detailed information related to a service
 """
 from marshmallow import Schema, fields
-from topchef.serializers.job_overview import JobOverview
+from topchef.serializers.job_summary import JobSummary
 
 
 class ServiceDetail(Schema):
@@ -15,6 +15,6 @@ class ServiceDetail(Schema):
     job_registration_schema = fields.Dict(required=True, dump_only=True)
     job_result_schema = fields.Dict(required=True, dump_only=True)
     is_service_available = fields.Boolean(required=True, dump_only=True)
-    jobs = fields.Nested(JobOverview, many=True, dump_only=True)
+    job_summary = fields.Nested(JobSummary, required=True, dump_only=True)
     has_timed_out = fields.Boolean(required=True, dump_only=True)
     timeout = fields.TimeDelta(required=True, dump_only=True)
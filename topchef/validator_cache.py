@@ -0,0 +1,130 @@
+"""
+Contains a process-wide cache of JSON schema validators. Building a
+``Draft4Validator`` copies every meta-schema into a fresh reference
+resolver, which is wasted work if the same schema is used to validate job
+parameters on every request. Instead, validators are built once for each
+schema, and reused for as long as they stay in the cache.
+
+Validators are keyed by a hash of the schema's canonical JSON form, rather
+than by the service that owns the schema. Two services with the same schema
+share a validator, and if a schema is changed, it hashes to a new key, so a
+validator for the old schema is never returned for the new one. Stale
+validators are evicted once they become the least recently used entries.
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from threading import Lock, local
+from typing import Type
+from jsonschema import Draft4Validator, RefResolver
+from .config import config
+from .json_type import JSON_TYPE as JSON
+
+__all__ = ['ValidatorCache', 'VALIDATOR_CACHE']
+
+
+class ValidatorCache(object):
+    """
+    A bounded, thread-safe LRU cache of validators. Calling the cache with
+    a schema returns a validator for that schema, so the cache can be used
+    anywhere that a validator type is expected.
+    """
+    def __init__(
+            self, maximum_size: int,
+            validator_type: Type[Draft4Validator]=Draft4Validator
+    ) -> None:
+        """
+
+        :param maximum_size: The maximum number of validators to keep
+        :param validator_type: The type of validator to build
+        """
+        self._maximum_size = maximum_size
+        self._validator_type = validator_type
+        self._validators = OrderedDict()
+        self._lock = Lock()
+
+    def __call__(self, schema: JSON) -> Draft4Validator:
+        """
+
+        :param schema: The schema for which a validator is required
+        :return: A validator for the schema. This is built if it is not
+            already in the cache
+        """
+        key = self.schema_hash(schema)
+
+        with self._lock:
+            validator = self._validators.get(key)
+            if validator is not None:
+                self._validators.move_to_end(key)
+                return validator
+
+        validator = self._validator_type(
+            schema, resolver=_ThreadSafeRefResolver.from_schema(schema)
+        )
+
+        with self._lock:
+            self._validators[key] = validator
+            while len(self._validators) > self._maximum_size:
+                self._validators.popitem(last=False)
+
+        return validator
+
+    def __len__(self) -> int:
+        """
+
+        :return: The number of validators in the cache
+        """
+        return len(self._validators)
+
+    def clear(self) -> None:
+        """
+        Remove all validators from the cache
+        """
+        with self._lock:
+            self._validators.clear()
+
+    @staticmethod
+    def schema_hash(schema: JSON) -> str:
+        """
+
+        :param schema: The schema to hash
+        :return: A SHA-256 hash of the schema's canonical JSON form. Schemas
+            that differ only in key order or whitespace have the same hash
+        """
+        canonical_form = json.dumps(
+            schema, sort_keys=True, separators=(',', ':')
+        )
+        return hashlib.sha256(canonical_form.encode('utf-8')).hexdigest()
+
+
+class _ThreadSafeRefResolver(RefResolver):
+    """
+    A reference resolver that can be shared between threads. The resolver
+    in ``jsonschema`` keeps a stack of resolution scopes, which it pushes
+    to and pops from while validating. This resolver keeps one stack for
+    each thread, so that validators using it can validate in several
+    threads at once.
+    """
+    def __init__(self, base_uri: str, referrer: JSON, *args, **kwargs):
+        self._base_uri = base_uri
+        self._thread_state = local()
+        super(_ThreadSafeRefResolver, self).__init__(
+            base_uri, referrer, *args, **kwargs
+        )
+
+    @property
+    def _scopes_stack(self) -> list:
+        """
+
+        :return: The stack of resolution scopes for the current thread
+        """
+        if not hasattr(self._thread_state, 'scopes_stack'):
+            self._thread_state.scopes_stack = [self._base_uri]
+        return self._thread_state.scopes_stack
+
+    @_scopes_stack.setter
+    def _scopes_stack(self, scopes_stack: list) -> None:
+        self._thread_state.scopes_stack = scopes_stack
+
+
+VALIDATOR_CACHE = ValidatorCache(config.VALIDATOR_CACHE_SIZE)
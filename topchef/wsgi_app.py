@@ -11,19 +11,35 @@ API, enabling multiple web frameworks to use the same web server.
 for making dynamic web applications. At its core is an application object of
 type ``Flask`` that maps WSGI to plain Python functions. This module takes
 care of generating this flask application.
+
+The application makes one database engine, and one registry of database
+sessions that is shared by all the endpoints. Each request gets its own
+session from the registry, and that session is removed when the request's
+application context is torn down. This lets the application be served by
+several threads without sharing sessions between them, and returns each
+request's connection to the pool once the request is finished.
+
+The application also runs a :class:`topchef.models.lease_reaper.LeaseReaper`
+thread, which returns jobs whose workers have stopped extending their
+leases to the queue, and a
+:class:`topchef.models.heartbeat_buffer.HeartbeatWriter` thread, which
+writes service check ins to the database in batches.
 """
 import abc
-from flask import Flask
+from typing import Optional
+from flask import Flask, _app_ctx_stack
 from .api import APIMetadata, ServicesList, ServiceDetail
 from .api import JobsList, JobsForService, JobQueueForService
-from .api import NextJob as NextJobEndpoint, JobDetail
+from .api import NextJob as NextJobEndpoint, JobDetail, JobLease
 from .api import JSONSchemaValidator
 from .method_override_middleware import HTTPMethodOverrideMiddleware
-from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm import scoped_session
 from .config import config
+from .database_engine import create_database_engine
+from .models.heartbeat_buffer import HeartbeatWriter, HEARTBEAT_BUFFER
+from .models.lease_reaper import LeaseReaper
 
 
 class WSGIAppFactory(object, metaclass=abc.ABCMeta):
@@ -57,59 +73,83 @@ class ProductionWSGIAppFactory(
         self._app = Flask(__name__)
         self._app.wsgi_app = HTTPMethodOverrideMiddleware(self._app.wsgi_app)
 
-        self._engine = create_engine(config.DATABASE_URI)
+        self._engine = create_database_engine()
+        self._session_registry = scoped_session(
+            sessionmaker(bind=self._engine),
+            scopefunc=_app_ctx_stack.__ident_func__
+        )
+        self._app.teardown_appcontext(self._remove_session)
+
+        self._lease_reaper = LeaseReaper(
+            sessionmaker(bind=self._engine), config.LEASE_REAPER_INTERVAL
+        )
+        if config.LEASE_REAPER_INTERVAL > 0:
+            self._app.before_first_request(self._lease_reaper.start)
+
+        self._heartbeat_writer = HeartbeatWriter(
+            sessionmaker(bind=self._engine), config.HEARTBEAT_WRITE_INTERVAL,
+            HEARTBEAT_BUFFER
+        )
+        if config.HEARTBEAT_WRITE_INTERVAL > 0:
+            self._app.before_first_request(self._heartbeat_writer.start)
 
         self._app.add_url_rule(
             '/', view_func=APIMetadata.as_view(
-                APIMetadata.__name__, self._session_factory()
+                APIMetadata.__name__, self._session_registry
             )
         )
         self._app.add_url_rule(
             '/services',
             view_func=ServicesList.as_view(
-                ServicesList.__name__, self._session_factory()
+                ServicesList.__name__, self._session_registry
             )
         )
         self._app.add_url_rule(
             '/services/<service_id>',
             view_func=ServiceDetail.as_view(
-                ServiceDetail.__name__, self._session_factory()
+                ServiceDetail.__name__, self._session_registry
             )
         )
         self._app.add_url_rule(
             '/services/<service_id>/queue',
             view_func=JobQueueForService.as_view(
-                JobQueueForService.__name__, self._session_factory()
+                JobQueueForService.__name__, self._session_registry
             )
         )
         self._app.add_url_rule(
             '/jobs',
             view_func=JobsList.as_view(
-                JobsList.__name__, self._session_factory()
+                JobsList.__name__, self._session_registry
             )
         )
         self._app.add_url_rule(
             '/jobs/<job_id>',
             view_func=JobDetail.as_view(
-                JobDetail.__name__, self._session_factory()
+                JobDetail.__name__, self._session_registry
+            )
+        )
+        self._app.add_url_rule(
+            '/jobs/<job_id>/lease',
+            view_func=JobLease.as_view(
+                JobLease.__name__, self._session_registry
             )
         )
         self._app.add_url_rule(
             '/services/<service_id>/jobs',
             view_func=JobsForService.as_view(
-                JobsForService.__name__, self._session_factory()
+                JobsForService.__name__, self._session_registry
             )
         )
         self._app.add_url_rule(
             '/services/<service_id>/jobs/next',
             view_func=NextJobEndpoint.as_view(
-                NextJobEndpoint.__name__, self._session_factory()
+                NextJobEndpoint.__name__, self._session_registry
             )
         )
         self._app.add_url_rule(
             '/validator',
             view_func=JSONSchemaValidator.as_view(
-                JSONSchemaValidator.__name__, self._session_factory()
+                JSONSchemaValidator.__name__, self._session_registry
             )
         )
 
@@ -122,8 +162,42 @@ class ProductionWSGIAppFactory(
         return self._engine
 
     @property
-    def _session_factory(self) -> sessionmaker:
-        return scoped_session(sessionmaker(bind=self._engine))
+    def session_registry(self) -> scoped_session:
+        """
+
+        :return: The registry of sessions given to every endpoint. Calling
+            a method of the session on the registry calls the method on
+            the session for the current request
+        """
+        return self._session_registry
+
+    @property
+    def lease_reaper(self) -> LeaseReaper:
+        """
+
+        :return: The thread that returns jobs with expired leases to their
+            queues. It is started when the app handles its first request,
+            unless ``LEASE_REAPER_INTERVAL`` is not positive
+        """
+        return self._lease_reaper
+
+    @property
+    def heartbeat_writer(self) -> HeartbeatWriter:
+        """
+
+        :return: The thread that writes service check ins to the database.
+            It is started when the app handles its first request
+        """
+        return self._heartbeat_writer
+
+    def _remove_session(self, _: Optional[BaseException]=None) -> None:
+        """
+        Close the session for the request that has just finished, and
+        return its connection to the pool
+
+        :param _: The exception that ended the request, if there was one
+        """
+        self._session_registry.remove()
 
 
 class TestingWSGIAPPFactory(